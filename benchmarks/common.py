@@ -0,0 +1,83 @@
+"""Common benchmarking utilities for HVAC Zoning."""
+
+from collections.abc import Callable
+import tracemalloc
+
+from homeassistant.const import STATE_CLOSED, STATE_ON
+from homeassistant.core import HomeAssistant
+
+CENTRAL_THERMOSTAT_ENTITY_ID = "climate.central_thermostat"
+
+
+def generate_house(num_areas: int, covers_per_area: int) -> dict:
+    """Generate config entry data for a house with the given number of areas.
+
+    Every third area is a bedroom and the central thermostat sits in an area
+    without covers, as it would in a real configuration.
+    """
+    areas = {
+        f"area_{index}": {
+            "covers": [
+                f"cover.area_{index}_vent_{cover}" for cover in range(covers_per_area)
+            ],
+            "connectivities": [f"binary_sensor.area_{index}_vent_status"],
+            "temperature": f"sensor.area_{index}_temperature",
+            "bedroom": index % 3 == 0,
+        }
+        for index in range(num_areas)
+    }
+    areas["central"] = {"climate": CENTRAL_THERMOSTAT_ENTITY_ID, "bedroom": False}
+    return {
+        "areas": areas,
+        "bed_time": "21:00:00",
+        "wake_time": "05:00:00",
+        "control_central_thermostat": True,
+    }
+
+
+def populate_house(
+    hass: HomeAssistant, config_entry_data: dict, unrelated_entities: int
+) -> list[str]:
+    """Set the states of a generated house plus unrelated entities.
+
+    Half of the areas are below the default virtual setpoint so an
+    adjustment has covers to open and close. Returns the unrelated entity ids.
+    """
+    hass.states.async_set(
+        CENTRAL_THERMOSTAT_ENTITY_ID, "heat", {"current_temperature": 70}
+    )
+    for index, area in enumerate(config_entry_data["areas"].values()):
+        if "covers" not in area:
+            continue
+        for cover in area["covers"]:
+            hass.states.async_set(cover, STATE_CLOSED)
+        for connectivity in area["connectivities"]:
+            hass.states.async_set(connectivity, STATE_ON)
+        hass.states.async_set(area["temperature"], 70 if index % 2 else 74)
+    unrelated_entity_ids = [
+        f"sensor.unrelated_{index}" for index in range(unrelated_entities)
+    ]
+    for entity_id in unrelated_entity_ids:
+        hass.states.async_set(entity_id, 0)
+    return unrelated_entity_ids
+
+
+def measure_allocations(function: Callable[[], object], iterations: int) -> dict:
+    """Measure memory allocated by a function with tracemalloc.
+
+    Runs separately from the timed rounds so tracing does not skew timings.
+    """
+    function()
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for _ in range(iterations):
+            function()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "peak_bytes": peak - start,
+        "retained_bytes_per_call": (current - start) / iterations,
+    }
@@ -0,0 +1,64 @@
+"""Fixtures for the HVAC Zoning benchmarks.
+
+Benchmarks drive Home Assistant synchronously so pytest-benchmark can time
+both callbacks and coroutines, which the async hass fixture does not allow.
+"""
+
+import asyncio
+from collections.abc import Callable, Generator
+from unittest.mock import AsyncMock, MagicMock
+
+from homeassistant import loader
+from homeassistant.core import HomeAssistant
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+from benchmarks.common import generate_house, populate_house
+from custom_components.hvac_zoning.const import DOMAIN
+
+
+@pytest.fixture
+def bench_hass(event_loop: asyncio.AbstractEventLoop) -> Generator[HomeAssistant]:
+    """Create a Home Assistant instance driven from outside the event loop."""
+    context = async_test_home_assistant(event_loop)
+    hass = event_loop.run_until_complete(context.__aenter__())
+    hass.data.pop(loader.DATA_CUSTOM_COMPONENTS)
+    # The test harness runs the loop in debug mode, which dominates timings.
+    event_loop.set_debug(False)
+    yield hass
+    event_loop.run_until_complete(hass.async_stop(force=True))
+    event_loop.run_until_complete(context.__aexit__(None, None, None))
+
+
+@pytest.fixture
+def setup_house(
+    bench_hass: HomeAssistant, event_loop: asyncio.AbstractEventLoop
+) -> Generator[Callable[[int, int, int], tuple[MockConfigEntry, list[str]]]]:
+    """Return a function that sets up a generated house and mocks services."""
+    config_entries: list[MockConfigEntry] = []
+
+    def setup(
+        num_areas: int, covers_per_area: int, unrelated_entities: int
+    ) -> tuple[MockConfigEntry, list[str]]:
+        config_entry_data = generate_house(num_areas, covers_per_area)
+        unrelated_entity_ids = populate_house(
+            bench_hass, config_entry_data, unrelated_entities
+        )
+        config_entry = MockConfigEntry(domain=DOMAIN, data=config_entry_data)
+        config_entry.add_to_hass(bench_hass)
+        event_loop.run_until_complete(
+            bench_hass.config_entries.async_setup(config_entry.entry_id)
+        )
+        event_loop.run_until_complete(bench_hass.async_block_till_done())
+        bench_hass.services = MagicMock(async_call=AsyncMock())
+        config_entries.append(config_entry)
+        return config_entry, unrelated_entity_ids
+
+    yield setup
+    for config_entry in config_entries:
+        event_loop.run_until_complete(
+            bench_hass.config_entries.async_unload(config_entry.entry_id)
+        )
@@ -0,0 +1,130 @@
+"""Benchmark event handling and house adjustment at house scale.
+
+State changes are dispatched on the next loop iteration, so each dispatch
+benchmark includes one pass of the event loop.
+"""
+
+import asyncio
+from collections.abc import Callable
+from itertools import count
+
+from homeassistant.core import HomeAssistant
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from benchmarks.common import CENTRAL_THERMOSTAT_ENTITY_ID, measure_allocations
+from custom_components.hvac_zoning import async_adjust_house
+from custom_components.hvac_zoning.models import get_runtime_data
+
+UNRELATED_ENTITIES = 1000
+ALLOCATION_ITERATIONS = 200
+ROUNDS = 100
+
+HOUSES = pytest.mark.parametrize(
+    "house",
+    [(5, 1), (25, 2), (100, 4)],
+    ids=["small", "medium", "large"],
+)
+
+
+@HOUSES
+def test_dispatch_unrelated_event(
+    benchmark: BenchmarkFixture,
+    bench_hass: HomeAssistant,
+    setup_house: Callable,
+    house: tuple[int, int],
+) -> None:
+    """Benchmark a state change of an entity the integration does not track."""
+    _, unrelated_entity_ids = setup_house(*house, UNRELATED_ENTITIES)
+    values = count()
+
+    async def async_fire() -> None:
+        value = next(values)
+        bench_hass.states.async_set(
+            unrelated_entity_ids[value % len(unrelated_entity_ids)], value
+        )
+        await asyncio.sleep(0)
+
+    def fire() -> None:
+        bench_hass.loop.run_until_complete(async_fire())
+
+    benchmark.extra_info.update(measure_allocations(fire, ALLOCATION_ITERATIONS))
+    benchmark(fire)
+
+
+@HOUSES
+def test_dispatch_routed_event(
+    benchmark: BenchmarkFixture,
+    bench_hass: HomeAssistant,
+    setup_house: Callable,
+    house: tuple[int, int],
+) -> None:
+    """Benchmark a central thermostat change routed to the scheduler."""
+    config_entry, _ = setup_house(*house, UNRELATED_ENTITIES)
+    scheduler = (
+        get_runtime_data(bench_hass, config_entry)
+        .systems[CENTRAL_THERMOSTAT_ENTITY_ID]
+        .scheduler
+    )
+    values = count()
+
+    async def async_fire() -> None:
+        bench_hass.states.async_set(
+            CENTRAL_THERMOSTAT_ENTITY_ID,
+            "heat",
+            {"current_temperature": 70, "temperature": next(values)},
+        )
+        await asyncio.sleep(0)
+
+    def fire() -> None:
+        bench_hass.loop.run_until_complete(async_fire())
+
+    benchmark.extra_info.update(measure_allocations(fire, ALLOCATION_ITERATIONS))
+    requests = scheduler.requests
+    benchmark(fire)
+    assert scheduler.requests > requests
+    assert scheduler.evaluations == 0
+
+
+@HOUSES
+@pytest.mark.parametrize("is_cold", [True, False], ids=["cold", "steady"])
+def test_adjust_house(
+    benchmark: BenchmarkFixture,
+    bench_hass: HomeAssistant,
+    setup_house: Callable,
+    house: tuple[int, int],
+    is_cold: bool,
+) -> None:
+    """Benchmark an end-to-end adjustment.
+
+    A cold adjustment has no command history so every cover is commanded; a
+    steady adjustment repeats the previous plan and is fully suppressed.
+    """
+    config_entry, _ = setup_house(*house, UNRELATED_ENTITIES)
+    runtime_data = get_runtime_data(bench_hass, config_entry)
+
+    def reset() -> None:
+        if is_cold:
+            runtime_data.cover_commands.clear()
+            for system_data in runtime_data.systems.values():
+                system_data.central_setpoint_command = None
+
+    def adjust() -> None:
+        reset()
+        bench_hass.loop.run_until_complete(async_adjust_house(bench_hass, config_entry))
+
+    benchmark.extra_info.update(measure_allocations(adjust, ALLOCATION_ITERATIONS))
+    bench_hass.services.async_call.reset_mock()
+    commands_issued = runtime_data.commands_issued
+
+    def setup() -> tuple[tuple, dict]:
+        reset()
+        return (async_adjust_house(bench_hass, config_entry),), {}
+
+    benchmark.pedantic(bench_hass.loop.run_until_complete, setup=setup, rounds=ROUNDS)
+    benchmark.extra_info["service_calls_per_adjustment"] = (
+        bench_hass.services.async_call.call_count / ROUNDS
+    )
+    benchmark.extra_info["commands_per_adjustment"] = (
+        runtime_data.commands_issued - commands_issued
+    ) / ROUNDS
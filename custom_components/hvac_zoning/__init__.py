@@ -2,28 +2,103 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable, Collection, Mapping
+from dataclasses import replace
 import datetime
+import time
+from types import MappingProxyType
+from typing import Any
 
-from homeassistant.components.climate import SERVICE_SET_TEMPERATURE, HVACMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    ATTR_SUPPORTED_FEATURES,
     ATTR_TEMPERATURE,
-    EVENT_STATE_CHANGED,
     SERVICE_CLOSE_COVER,
     SERVICE_OPEN_COVER,
+    SERVICE_SET_COVER_POSITION,
     STATE_OFF,
     STATE_ON,
     Platform,
 )
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    CoreState,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+    split_entity_id,
+)
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.entity_registry import (
+    EVENT_ENTITY_REGISTRY_UPDATED,
+    EventEntityRegistryUpdatedData,
+    async_get as async_get_entity_registry,
+)
+from homeassistant.helpers.event import (
+    async_track_point_in_utc_time,
+    async_track_state_change_event,
+)
+from homeassistant.helpers.start import async_at_started
 import homeassistant.util.dt as dt_util
 
-from .const import ACTIVE, DOMAIN, IDLE, LOGGER, SUPPORTED_HVAC_MODES
-from .utils import filter_to_valid_areas, get_all_thermostat_entity_ids
+from .const import (
+    ATTR_CURRENT_POSITION,
+    ATTR_HVAC_ACTION,
+    ATTR_POSITION,
+    COMMAND_RETRY_INTERVAL,
+    COVER_FEATURE_SET_POSITION,
+    COVER_STATES_BY_SERVICE,
+    DOMAIN,
+    HVAC_ACTIONS_BY_MODE,
+    LOGGER,
+    ROLE_AREA_THERMOSTAT,
+    ROLE_CENTRAL_THERMOSTAT,
+    ROLE_CONNECTIVITY,
+    ROLE_TEMPERATURE,
+    SERVICE_SET_TEMPERATURE,
+    SIGNAL_AREAS_UPDATED,
+    SIGNAL_STATS_UPDATED,
+    SIGNAL_THERMAL_MODEL_UPDATED,
+    STARTUP_PHASE_FIRST_EVALUATION,
+    STARTUP_PHASE_PLATFORMS_SET_UP,
+    STARTUP_PHASE_SET_UP,
+    STARTUP_PHASE_STORAGE_LOADED,
+    TRIGGER_CONFIG,
+    TRIGGER_CONNECTIVITY,
+    TRIGGER_DWELL,
+    TRIGGER_STARTED,
+    TRIGGER_TEMPERATURE,
+    TRIGGER_THERMOSTAT,
+)
+from .controller import create_controller
+from .engine import (
+    HousePlan,
+    HouseSnapshot,
+    evaluate_house,
+    evaluate_zones,
+    has_same_house_inputs,
+)
+from .models import (
+    HVACSystemConfig,
+    HVACSystemData,
+    HVACZoningConfig,
+    HVACZoningData,
+    StartupProfile,
+    determine_changed_areas,
+    get_config,
+    get_runtime_data,
+    get_system_data,
+)
+from .scheduler import AdjustmentScheduler
+from .state import ControllerState, SystemState
+from .thermal import ThermalModel
+from .utils import parse_temperature
 
-PLATFORMS: list[Platform] = [Platform.CLIMATE]
+PLATFORMS: list[Platform] = [Platform.CLIMATE, Platform.SENSOR]
 
 
 def get_all_cover_entity_ids(areas):
@@ -43,94 +118,96 @@ def get_all_temperature_entity_ids(areas):
     return [area["temperature"] for area in areas.values() if "temperature" in area]
 
 
-def determine_if_night_time_mode(areas):
-    """Determine if night time mode."""
-    return any(area.get("bedroom", False) for area in areas.values())
+def get_area_thermostat_entity_id(
+    hass: HomeAssistant, area_thermostat_entity_ids: dict[str, str | None], area: str
+) -> str | None:
+    """Get the entity id of an area's virtual thermostat, resolving it once."""
+    try:
+        return area_thermostat_entity_ids[area]
+    except KeyError:
+        entity_id = area_thermostat_entity_ids[area] = async_get_entity_registry(
+            hass
+        ).async_get_entity_id(Platform.CLIMATE, DOMAIN, area + "_thermostat")
+        return entity_id
 
 
-def determine_action(target_temperature: int, actual_temperature: int, hvac_mode: str):
-    """Determine action."""
-    if (
-        hvac_mode in SUPPORTED_HVAC_MODES
-        and target_temperature is not None
-        and actual_temperature is not None
-    ):
-        modified_actual_temperature = int(float(actual_temperature))
-        modified_target_temperature = int(float(target_temperature))
-        match hvac_mode:
-            case HVACMode.HEAT:
-                if modified_actual_temperature >= modified_target_temperature:
-                    return IDLE
-            case HVACMode.COOL:
-                if modified_actual_temperature <= modified_target_temperature:
-                    return IDLE
+def build_area_routes(
+    hass: HomeAssistant,
+    config: HVACZoningConfig,
+    area_thermostat_entity_ids: dict[str, str | None],
+    area_name: str,
+) -> dict[str, tuple[str, str]]:
+    """Build the routes of the entities an area is configured with."""
+    area = config.areas.get(area_name)
+    if area is None:
+        return {}
+    routes: dict[str, tuple[str, str]] = {}
+    if area.climate:
+        routes[area.climate] = (ROLE_CENTRAL_THERMOSTAT, area.name)
+    if area.name not in config.valid_area_indexes:
+        return routes
+    routes.update(dict.fromkeys(area.connectivities, (ROLE_CONNECTIVITY, area.name)))
+    if area.temperature:
+        routes[area.temperature] = (ROLE_TEMPERATURE, area.name)
+    area_thermostat_entity_id = get_area_thermostat_entity_id(
+        hass, area_thermostat_entity_ids, area.name
+    )
+    if area_thermostat_entity_id:
+        routes[area_thermostat_entity_id] = (ROLE_AREA_THERMOSTAT, area.name)
+    return routes
+
+
+def build_routing_index(
+    hass: HomeAssistant,
+    config: HVACZoningConfig,
+    area_thermostat_entity_ids: dict[str, str | None] | None = None,
+) -> Mapping[str, tuple[str, str]]:
+    """Build a read-only map of entity id to (role, area) for routing events."""
+    return update_routing_index_for_areas(
+        hass, MappingProxyType({}), config, area_thermostat_entity_ids, config.areas
+    )
+
 
-    return ACTIVE
+def update_routing_index_for_areas(
+    hass: HomeAssistant,
+    routing_index: Mapping[str, tuple[str, str]],
+    config: HVACZoningConfig,
+    area_thermostat_entity_ids: dict[str, str | None] | None,
+    areas: Collection[str],
+) -> Mapping[str, tuple[str, str]]:
+    """Rebuild the routes of some areas, keeping the routes of every other area."""
+    if area_thermostat_entity_ids is None:
+        area_thermostat_entity_ids = {}
+    updated_routing_index = {
+        entity_id: route
+        for entity_id, route in routing_index.items()
+        if route[1] not in areas
+    }
+    for area_name in areas:
+        updated_routing_index.update(
+            build_area_routes(hass, config, area_thermostat_entity_ids, area_name)
+        )
+    return MappingProxyType(updated_routing_index)
 
 
-def determine_is_night_time(bed_time, wake_time):
+def determine_is_night_time(bed_time: datetime.time, wake_time: datetime.time):
     """Determine is night time."""
-    now = dt_util.now()
-    bed_time = datetime.time.fromisoformat(bed_time)
-    wake_time = datetime.time.fromisoformat(wake_time)
+    now = dt_util.now().time()
 
-    return (
-        bed_time > wake_time and (now.time() > bed_time or now.time() < wake_time)
-    ) or (bed_time <= wake_time and now.time() >= bed_time and now.time() < wake_time)
-
-
-def filter_to_bedrooms(areas):
-    """Filter to bedrooms."""
-    return {key: value for key, value in areas.items() if value.get("bedroom", False)}
-
-
-def determine_cover_service_to_call(
-    target_temperature: int,
-    actual_temperature: int,
-    hvac_mode: str,
-    thermostat_action: str,
-    is_night_time_mode: bool,
-    is_night_time: bool,
-    is_bedroom: bool,
-    control_central_thermostat: bool,
-) -> str:
-    """Determine cover service."""
-    if is_night_time_mode and is_night_time:
-        return SERVICE_OPEN_COVER if is_bedroom else SERVICE_CLOSE_COVER
-    action = (
-        ACTIVE
-        if thermostat_action == IDLE and control_central_thermostat is True
-        else determine_action(target_temperature, actual_temperature, hvac_mode)
-    )
-
-    return SERVICE_CLOSE_COVER if action is not ACTIVE else SERVICE_OPEN_COVER
-
-
-def determine_change_in_temperature(
-    actual_temperature: float, hvac_mode: HVACMode, action: str
-) -> float:
-    """Determine change in temperature based on HVAC mode and action."""
-    if hvac_mode in SUPPORTED_HVAC_MODES:
-        match hvac_mode:
-            case HVACMode.HEAT:
-                if action == ACTIVE:
-                    return actual_temperature + 2
-                return actual_temperature - 2
-            case HVACMode.COOL:
-                if action == ACTIVE:
-                    return actual_temperature - 2
-                return actual_temperature + 2
-    return actual_temperature
-
-
-def determine_target_temperature(hass: HomeAssistant, area):
+    return (bed_time > wake_time and (now > bed_time or now < wake_time)) or (
+        bed_time <= wake_time and now >= bed_time and now < wake_time
+    )
+
+
+def determine_target_temperature(
+    hass: HomeAssistant, area_thermostat_entity_id: str | None
+):
     """Determine thermostat temperature."""
-    entity_registry = async_get_entity_registry(hass)
-    area_thermostat_unique_id = area + "_thermostat"
-    area_thermostat_entity_id = entity_registry.async_get_entity_id(
-        "climate", DOMAIN, area_thermostat_unique_id
+    thermostat = (
+        hass.states.get(area_thermostat_entity_id)
+        if area_thermostat_entity_id
+        else None
     )
-    thermostat = hass.states.get(area_thermostat_entity_id)
     return (
         thermostat.attributes["temperature"]
         if thermostat and "temperature" in thermostat.attributes
@@ -138,193 +215,898 @@ def determine_target_temperature(hass: HomeAssistant, area):
     )
 
 
-def determine_actual_temperature(hass: HomeAssistant, devices):
+def determine_actual_temperature(
+    hass: HomeAssistant, temperature_entity_id: str | None
+):
     """Determine thermostat temperature."""
-    temperature_sensor = hass.states.get(devices["temperature"])
+    temperature_sensor = (
+        hass.states.get(temperature_entity_id) if temperature_entity_id else None
+    )
     return temperature_sensor.state if temperature_sensor else None
 
 
-def adjust_house(hass: HomeAssistant, config_entry: ConfigEntry):
-    """Adjust house."""
-    LOGGER.debug("[HVAC Zoning] adjust_house: Starting house adjustment")
-    config_entry_data = config_entry.as_dict()["data"]
-    central_thermostat_entity_ids = get_all_thermostat_entity_ids(config_entry_data)
-    central_thermostat = hass.states.get(central_thermostat_entity_ids[0])
-    if central_thermostat and "current_temperature" in central_thermostat.attributes:
-        central_thermostat_actual_temperature = central_thermostat.attributes[
-            "current_temperature"
-        ]
-        central_hvac_mode = central_thermostat.state
-        LOGGER.debug(
-            "[HVAC Zoning] adjust_house: Central thermostat state - "
-            "hvac_mode=%s, current_temp=%s",
-            central_hvac_mode,
-            central_thermostat_actual_temperature,
+def determine_if_position_reached(
+    cover_state: State | None, position: int, position_step: int
+) -> bool:
+    """Determine if a cover is within a position step of a position."""
+    current_position = (
+        cover_state.attributes.get(ATTR_CURRENT_POSITION)
+        if cover_state is not None
+        else None
+    )
+    return (
+        current_position is not None
+        and abs(current_position - position) <= position_step
+    )
+
+
+def determine_if_position_supported(cover_state: State | None) -> bool:
+    """Determine if a cover can be set to a position."""
+    return cover_state is not None and bool(
+        cover_state.attributes.get(ATTR_SUPPORTED_FEATURES, 0)
+        & COVER_FEATURE_SET_POSITION
+    )
+
+
+def determine_if_command_needed(
+    is_in_target_state: bool,
+    target,
+    last_command: tuple[Any, datetime.datetime] | None,
+    now: datetime.datetime,
+) -> bool:
+    """Determine if a device needs a command to reach its target.
+
+    A command already sent for the same target is not repeated until the retry
+    interval has passed, so sleeping battery devices are not flooded while the
+    first command is still queued.
+    """
+    if is_in_target_state:
+        return False
+    if last_command is None:
+        return True
+    last_target, last_sent_at = last_command
+    return last_target != target or now - last_sent_at >= COMMAND_RETRY_INTERVAL
+
+
+def build_house_snapshot(
+    hass: HomeAssistant,
+    config: HVACZoningConfig,
+    system: HVACSystemConfig,
+    central_thermostat: State,
+    area_thermostat_entity_ids: dict[str, str | None],
+) -> HouseSnapshot:
+    """Build a snapshot of the valid areas of a system from their current states."""
+    areas = system.valid_areas
+    target_temperatures = tuple(
+        parse_temperature(
+            determine_target_temperature(
+                hass,
+                get_area_thermostat_entity_id(
+                    hass, area_thermostat_entity_ids, area.name
+                ),
+            )
         )
-        config_entry_data_with_only_valid_areas = filter_to_valid_areas(
-            config_entry_data
+        for area in areas
+    )
+    actual_temperatures = tuple(
+        parse_temperature(determine_actual_temperature(hass, area.temperature))
+        for area in areas
+    )
+    return HouseSnapshot(
+        areas=tuple(area.name for area in areas),
+        target_temperatures=target_temperatures,
+        actual_temperatures=actual_temperatures,
+        is_bedrooms=tuple(area.bedroom for area in areas),
+        hystereses=tuple(area.hysteresis for area in areas),
+        min_dwells=tuple(area.min_dwell for area in areas),
+        is_availables=tuple(
+            target is not None and actual is not None
+            for target, actual in zip(
+                target_temperatures, actual_temperatures, strict=True
+            )
+        ),
+        hvac_mode=central_thermostat.state,
+        central_actual_temperature=central_thermostat.attributes["current_temperature"],
+        is_night_time_mode=config.is_night_time_mode,
+        is_night_time=determine_is_night_time(config.bed_time, config.wake_time),
+        control_central_thermostat=config.control_central_thermostat,
+        temperature_tolerance=config.temperature_tolerance,
+        proportional_band=config.proportional_band,
+        min_open_area=config.min_open_area,
+        now=dt_util.utcnow(),
+    )
+
+
+def update_house_snapshot(
+    hass: HomeAssistant,
+    config: HVACZoningConfig,
+    system: HVACSystemConfig,
+    central_thermostat: State,
+    area_thermostat_entity_ids: dict[str, str | None],
+    *,
+    previous: HouseSnapshot,
+    indexes: Collection[int],
+) -> HouseSnapshot:
+    """Refresh the house-wide values and the areas at indexes of a snapshot."""
+    target_temperatures = list(previous.target_temperatures)
+    actual_temperatures = list(previous.actual_temperatures)
+    is_availables = list(previous.is_availables)
+    for index in indexes:
+        area = system.valid_areas[index]
+        target_temperatures[index] = parse_temperature(
+            determine_target_temperature(
+                hass,
+                get_area_thermostat_entity_id(
+                    hass, area_thermostat_entity_ids, area.name
+                ),
+            )
         )
-        areas = config_entry_data_with_only_valid_areas.get("areas", {})
-        bedroom_areas = filter_to_bedrooms(areas)
-        is_night_time_mode = determine_if_night_time_mode(areas)
-        is_night_time = determine_is_night_time(
-            config_entry_data["bed_time"], config_entry_data["wake_time"]
+        actual_temperatures[index] = parse_temperature(
+            determine_actual_temperature(hass, area.temperature)
         )
-        control_central_thermostat = config_entry_data.get(
-            "control_central_thermostat", False
+        is_availables[index] = (
+            target_temperatures[index] is not None
+            and actual_temperatures[index] is not None
         )
-        LOGGER.debug(
-            "[HVAC Zoning] adjust_house: Night mode settings - "
-            "is_night_time_mode=%s, is_night_time=%s, control_central_thermostat=%s",
-            is_night_time_mode,
-            is_night_time,
-            control_central_thermostat,
+    return replace(
+        previous,
+        target_temperatures=tuple(target_temperatures),
+        actual_temperatures=tuple(actual_temperatures),
+        is_availables=tuple(is_availables),
+        hvac_mode=central_thermostat.state,
+        central_actual_temperature=central_thermostat.attributes["current_temperature"],
+        is_night_time=determine_is_night_time(config.bed_time, config.wake_time),
+        now=dt_util.utcnow(),
+    )
+
+
+def determine_if_setpoint_changed(old_state: State | None, new_state: State | None):
+    """Determine if a thermostat's target temperature changed."""
+    return (
+        old_state is not None
+        and new_state is not None
+        and old_state.attributes.get(ATTR_TEMPERATURE)
+        != new_state.attributes.get(ATTR_TEMPERATURE)
+    )
+
+
+def determine_if_hvac_mode_unchanged(old_state: State | None, new_state: State | None):
+    """Determine if a thermostat kept its HVAC mode across a state change."""
+    return (
+        old_state is not None
+        and new_state is not None
+        and old_state.state == new_state.state
+    )
+
+
+def determine_if_temperature_moved(
+    new_state: State | None, evaluated_temperature: float | None, deadband: float
+):
+    """Determine if a temperature moved by at least the deadband.
+
+    The comparison is against the temperature the last evaluation used, so a
+    slow drift still triggers once it accumulates past the deadband.
+    """
+    temperature = parse_temperature(new_state.state) if new_state else None
+    return (
+        temperature is None
+        or evaluated_temperature is None
+        # Rounding keeps a 0.1° sensor step from falling just short of the
+        # deadband through float error.
+        or round(abs(temperature - evaluated_temperature), 6) >= deadband
+    )
+
+
+def get_evaluated_temperature(
+    config: HVACZoningConfig, systems: Mapping[str, HVACSystemData], area: str
+) -> float | None:
+    """Get the actual temperature of an area used by the last evaluation."""
+    system_entity_id = config.area_systems.get(area)
+    system_data = systems.get(system_entity_id) if system_entity_id else None
+    if system_data is None or system_data.last_snapshot is None:
+        return None
+    index = config.systems[system_entity_id].valid_area_indexes[area]
+    return system_data.last_snapshot.actual_temperatures[index]
+
+
+def determine_if_vent_open(plan: HousePlan, index: int) -> bool:
+    """Determine if the vents of an area are open under a plan."""
+    position = plan.cover_positions[index]
+    if position is not None:
+        return position > 0
+    return plan.cover_services[index] != SERVICE_CLOSE_COVER
+
+
+def determine_if_central_conditioning(state: State | None, hvac_mode: str) -> bool:
+    """Determine if a central thermostat reports running in an HVAC mode."""
+    return (
+        state is not None
+        and hvac_mode in HVAC_ACTIONS_BY_MODE
+        and state.attributes.get(ATTR_HVAC_ACTION) == HVAC_ACTIONS_BY_MODE[hvac_mode]
+    )
+
+
+def observe_area_temperature(
+    hass: HomeAssistant,
+    runtime_data: HVACZoningData,
+    config: HVACZoningConfig,
+    area: str,
+    new_state: State | None,
+) -> bool:
+    """Feed an area temperature to the thermal model under the last plan.
+
+    Only intervals during which the central thermostat reports heating or
+    cooling are learned from, since the plan being active does not mean the
+    equipment runs. Returns whether a learned rate was updated.
+    """
+    system_entity_id = config.area_systems.get(area)
+    system_data = (
+        runtime_data.systems.get(system_entity_id) if system_entity_id else None
+    )
+    if (
+        runtime_data.thermal_model is None
+        or system_data is None
+        or system_data.last_snapshot is None
+        or system_data.last_plan is None
+    ):
+        return False
+    index = config.systems[system_entity_id].valid_area_indexes[area]
+    snapshot = system_data.last_snapshot
+    plan = system_data.last_plan
+    return runtime_data.thermal_model.observe(
+        area,
+        parse_temperature(new_state.state) if new_state is not None else None,
+        dt_util.utcnow(),
+        hvac_mode=snapshot.hvac_mode,
+        is_active=determine_if_central_conditioning(
+            hass.states.get(system_entity_id), snapshot.hvac_mode
+        ),
+        is_open=determine_if_vent_open(plan, index),
+    )
+
+
+async def async_adjust_house(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    forced_areas: set[str] | frozenset[str] = frozenset(),
+) -> None:
+    """Adjust every HVAC system of the house in parallel."""
+    await asyncio.gather(
+        *(
+            async_adjust_system(
+                hass, config_entry, central_thermostat_entity_id, forced_areas
+            )
+            for central_thermostat_entity_id in get_config(hass, config_entry).systems
         )
-        thermostat_areas = (
-            bedroom_areas if is_night_time_mode and is_night_time else areas
+    )
+
+
+async def async_adjust_system(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    central_thermostat_entity_id: str,
+    forced_areas: set[str] | frozenset[str] = frozenset(),
+    zones: set[str] | frozenset[str] | None = None,
+) -> None:
+    """Adjust the areas conditioned by one central thermostat.
+
+    With zones, only those areas and the central thermostat are re-read and
+    re-evaluated against the previous plan, unless that changes the house-wide
+    decision. Empty zones only recompute the central setpoint.
+    """
+    LOGGER.debug(
+        "[HVAC Zoning] adjust_house: Starting adjustment of %s",
+        central_thermostat_entity_id,
+    )
+    config = get_config(hass, config_entry)
+    system = config.systems.get(central_thermostat_entity_id)
+    central_thermostat = hass.states.get(central_thermostat_entity_id)
+    if (
+        system is None
+        or central_thermostat is None
+        or "current_temperature" not in central_thermostat.attributes
+    ):
+        return
+    runtime_data = get_runtime_data(hass, config_entry)
+    system_data = get_system_data(hass, config_entry, central_thermostat_entity_id)
+    previous_snapshot = system_data.last_snapshot
+    previous_plan = system_data.last_plan
+    areas = None
+    if zones is None or previous_snapshot is None or previous_plan is None:
+        snapshot = build_house_snapshot(
+            hass,
+            config,
+            system,
+            central_thermostat,
+            runtime_data.area_thermostat_entity_ids,
         )
-        actions = [
-            determine_action(
-                determine_target_temperature(hass, area),
-                determine_actual_temperature(hass, devices),
-                central_hvac_mode,
+        # The first evaluation after a restart continues from the saved
+        # decisions, so areas held by their minimum dwell stay held.
+        if (
+            previous_plan is None
+            and system_data.saved_state is not None
+            and (
+                previous_evaluation := system_data.saved_state.as_previous_evaluation(
+                    snapshot
+                )
             )
-            for area, devices in thermostat_areas.items()
+            is not None
+        ):
+            previous_snapshot, previous_plan = previous_evaluation
+        plan = evaluate_house(snapshot, previous_snapshot, previous_plan)
+    else:
+        indexes = [
+            system.valid_area_indexes[zone]
+            for zone in zones
+            if zone in system.valid_area_indexes
         ]
-        thermostat_action = ACTIVE if ACTIVE in actions else IDLE
-        entity_registry = async_get_entity_registry(hass)
-        for area_name, area_config in areas.items():
-            area_thermostat_unique_id = area_name + "_thermostat"
-            area_thermostat_entity_id = entity_registry.async_get_entity_id(
-                "climate", DOMAIN, area_thermostat_unique_id
-            )
-            area_thermostat = hass.states.get(area_thermostat_entity_id)
-            area_temperature_sensor = hass.states.get(area_config["temperature"])
-            if (
-                area_thermostat
-                and "temperature" in area_thermostat.attributes
-                and area_temperature_sensor
-            ):
-                area_actual_temperature = int(float(area_temperature_sensor.state))
-                area_target_temperature = area_thermostat.attributes["temperature"]
-                is_bedroom = area_config["bedroom"]
-                service_to_call = determine_cover_service_to_call(
-                    area_target_temperature,
-                    area_actual_temperature,
-                    central_hvac_mode,
-                    thermostat_action,
-                    is_night_time_mode,
-                    is_night_time,
-                    is_bedroom,
-                    control_central_thermostat,
-                )
-                covers = area_config["covers"]
-                cover_action = (
-                    "opening" if service_to_call == SERVICE_OPEN_COVER else "closing"
-                )
-                LOGGER.debug(
-                    "[HVAC Zoning] adjust_house: Area '%s' - target_temp=%s, actual_temp=%s, "
-                    "is_bedroom=%s, thermostat_action=%s, %s covers %s",
-                    area_name,
-                    area_target_temperature,
-                    area_actual_temperature,
-                    is_bedroom,
-                    thermostat_action,
-                    cover_action,
-                    covers,
+        snapshot = update_house_snapshot(
+            hass,
+            config,
+            system,
+            central_thermostat,
+            runtime_data.area_thermostat_entity_ids,
+            previous=previous_snapshot,
+            indexes=indexes,
+        )
+        plan = evaluate_zones(snapshot, indexes, previous_snapshot, previous_plan)
+        if plan.thermostat_action == previous_plan.thermostat_action and (
+            has_same_house_inputs(snapshot, previous_snapshot)
+        ):
+            # The minimum open area can move the vents of other areas too.
+            areas = set(zones).union(
+                area
+                for area, position, previous_position in zip(
+                    snapshot.areas,
+                    plan.cover_positions,
+                    previous_plan.cover_positions,
+                    strict=True,
                 )
-                for cover in covers:
-                    hass.services.call(
-                        Platform.COVER,
-                        service_to_call,
-                        service_data={ATTR_ENTITY_ID: cover},
-                    )
-        if control_central_thermostat:
-            new_target_temp = determine_change_in_temperature(
-                central_thermostat_actual_temperature,
-                central_hvac_mode,
-                thermostat_action,
-            )
-            LOGGER.debug(
-                "[HVAC Zoning] adjust_house: Adjusting central thermostat - "
-                "entity_id=%s, thermostat_action=%s, new_target_temp=%s",
-                central_thermostat_entity_ids[0],
-                thermostat_action,
-                new_target_temp,
+                if position != previous_position
             )
-            hass.services.call(
+    if system_data.controller is not None:
+        plan = replace(
+            plan,
+            central_setpoint=system_data.controller.compute_setpoint(snapshot, plan),
+        )
+    system_data.last_snapshot = snapshot
+    system_data.last_plan = plan
+    system_data.saved_state = None
+    async_schedule_held_zones(hass, system_data, snapshot, plan)
+    LOGGER.debug(
+        "[HVAC Zoning] adjust_house: central_thermostat=%s, hvac_mode=%s, "
+        "current_temp=%s, is_night_time_mode=%s, is_night_time=%s, "
+        "control_central_thermostat=%s, thermostat_action=%s",
+        central_thermostat_entity_id,
+        snapshot.hvac_mode,
+        snapshot.central_actual_temperature,
+        snapshot.is_night_time_mode,
+        snapshot.is_night_time,
+        snapshot.control_central_thermostat,
+        plan.thermostat_action,
+    )
+    await async_apply_house_plan(
+        hass,
+        config_entry,
+        central_thermostat,
+        snapshot,
+        plan,
+        forced_areas=forced_areas,
+        areas=areas,
+    )
+    if runtime_data.controller_state is not None:
+        runtime_data.controller_state.async_schedule_save(runtime_data)
+
+
+@callback
+def async_schedule_held_zones(
+    hass: HomeAssistant,
+    system_data: HVACSystemData,
+    snapshot: HouseSnapshot,
+    plan: HousePlan,
+) -> None:
+    """Re-evaluate areas held by their minimum dwell once the first one expires."""
+    if system_data.cancel_dwell_timer is not None:
+        system_data.cancel_dwell_timer()
+        system_data.cancel_dwell_timer = None
+    scheduler = system_data.scheduler
+    held_untils = {
+        area: held_until
+        for area, held_until in zip(snapshot.areas, plan.held_untils, strict=True)
+        if held_until is not None
+    }
+    if scheduler is None or not held_untils:
+        return
+
+    @callback
+    def request_held_zones(_now: datetime.datetime) -> None:
+        system_data.cancel_dwell_timer = None
+        system_data.pending_triggers.add(TRIGGER_DWELL)
+        scheduler.async_request(zones=held_untils.keys())
+
+    system_data.cancel_dwell_timer = async_track_point_in_utc_time(
+        hass, request_held_zones, min(held_untils.values())
+    )
+
+
+async def async_apply_house_plan(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    central_thermostat: State,
+    snapshot: HouseSnapshot,
+    plan: HousePlan,
+    *,
+    forced_areas: set[str] | frozenset[str],
+    areas: Collection[str] | None = None,
+) -> None:
+    """Send the commands needed to bring the house in line with a plan.
+
+    With areas, only the covers of those areas are reconciled. Covers that
+    support positions are set to the planned position of proportional vents
+    once it is more than a position step away.
+    """
+    runtime_data = get_runtime_data(hass, config_entry)
+    system_data = get_system_data(hass, config_entry, central_thermostat.entity_id)
+    config = get_config(hass, config_entry)
+    area_configs = config.areas
+    now = dt_util.utcnow()
+    commands_issued = 0
+    commands_suppressed = 0
+    covers_by_service: dict[str, list[str]] = {
+        SERVICE_OPEN_COVER: [],
+        SERVICE_CLOSE_COVER: [],
+    }
+    covers_by_position: dict[int, list[str]] = {}
+    for area_name, service_to_call, position in zip(
+        snapshot.areas, plan.cover_services, plan.cover_positions, strict=True
+    ):
+        if service_to_call is None or (areas is not None and area_name not in areas):
+            continue
+        covers = area_configs[area_name].covers
+        LOGGER.debug(
+            "[HVAC Zoning] adjust_house: Area '%s' - %s covers %s, position=%s",
+            area_name,
+            service_to_call,
+            covers,
+            position,
+        )
+        is_forced = area_name in forced_areas
+        for cover in covers:
+            cover_state = hass.states.get(cover)
+            if position is not None and determine_if_position_supported(cover_state):
+                if is_forced or determine_if_command_needed(
+                    determine_if_position_reached(
+                        cover_state, position, config.position_step
+                    ),
+                    position,
+                    runtime_data.cover_commands.get(cover),
+                    now,
+                ):
+                    covers_by_position.setdefault(position, []).append(cover)
+                    runtime_data.cover_commands[cover] = (position, now)
+                    commands_issued += 1
+                else:
+                    commands_suppressed += 1
+            elif is_forced or determine_if_command_needed(
+                cover_state is not None
+                and cover_state.state in COVER_STATES_BY_SERVICE[service_to_call],
+                service_to_call,
+                runtime_data.cover_commands.get(cover),
+                now,
+            ):
+                covers_by_service[service_to_call].append(cover)
+                runtime_data.cover_commands[cover] = (service_to_call, now)
+                commands_issued += 1
+            else:
+                commands_suppressed += 1
+    service_calls = [
+        hass.services.async_call(
+            Platform.COVER,
+            service,
+            service_data={ATTR_ENTITY_ID: covers},
+        )
+        for service, covers in covers_by_service.items()
+        if covers
+    ]
+    service_calls.extend(
+        hass.services.async_call(
+            Platform.COVER,
+            SERVICE_SET_COVER_POSITION,
+            service_data={ATTR_ENTITY_ID: covers, ATTR_POSITION: position},
+        )
+        for position, covers in covers_by_position.items()
+    )
+    new_target_temp = plan.central_setpoint
+    if new_target_temp is not None and determine_if_command_needed(
+        central_thermostat.attributes.get(ATTR_TEMPERATURE) == new_target_temp,
+        new_target_temp,
+        system_data.central_setpoint_command,
+        now,
+    ):
+        system_data.central_setpoint_command = (new_target_temp, now)
+        commands_issued += 1
+        LOGGER.debug(
+            "[HVAC Zoning] adjust_house: Adjusting central thermostat - "
+            "entity_id=%s, thermostat_action=%s, new_target_temp=%s",
+            central_thermostat.entity_id,
+            plan.thermostat_action,
+            new_target_temp,
+        )
+        service_calls.append(
+            hass.services.async_call(
                 Platform.CLIMATE,
                 SERVICE_SET_TEMPERATURE,
                 service_data={
-                    ATTR_ENTITY_ID: central_thermostat_entity_ids[0],
+                    ATTR_ENTITY_ID: central_thermostat.entity_id,
                     ATTR_TEMPERATURE: new_target_temp,
                 },
             )
+        )
+    elif new_target_temp is not None:
+        commands_suppressed += 1
+    runtime_data.commands_issued += commands_issued
+    runtime_data.commands_suppressed += commands_suppressed
+    runtime_data.stats.service_calls += len(service_calls)
+    LOGGER.debug(
+        "[HVAC Zoning] adjust_house: Issued %s commands, suppressed %s",
+        commands_issued,
+        commands_suppressed,
+    )
+    await asyncio.gather(*service_calls)
+
+
+@callback
+def async_shutdown_system(system_data: HVACSystemData) -> None:
+    """Cancel the pending evaluations and timers of an HVAC system."""
+    if system_data.scheduler is not None:
+        system_data.scheduler.async_shutdown()
+    if system_data.cancel_dwell_timer is not None:
+        system_data.cancel_dwell_timer()
+        system_data.cancel_dwell_timer = None
+
+
+def apply_saved_states(
+    runtime_data: HVACZoningData, saved_states: Mapping[str, SystemState]
+) -> None:
+    """Resume each system from the state saved before the last shutdown."""
+    for central_thermostat_entity_id, saved_state in saved_states.items():
+        if (
+            system_data := runtime_data.systems.get(central_thermostat_entity_id)
+        ) is None:
+            continue
+        system_data.central_setpoint_command = saved_state.central_setpoint_command
+        system_data.saved_state = saved_state
+
+
+@callback
+def request_systems(
+    runtime_data: HVACZoningData,
+    trigger: str,
+    central_thermostat_entity_ids: Collection[str] | None = None,
+) -> None:
+    """Request a full evaluation of some, by default every, HVAC system."""
+    for central_thermostat_entity_id, system_data in runtime_data.systems.items():
+        if system_data.scheduler is None or (
+            central_thermostat_entity_ids is not None
+            and central_thermostat_entity_id not in central_thermostat_entity_ids
+        ):
+            continue
+        system_data.pending_triggers.add(trigger)
+        system_data.scheduler.async_request()
+
+
+@callback
+def is_entity_id_change(event_data: EventEntityRegistryUpdatedData) -> bool:
+    """Filter entity registry updates to those that can change entity ids."""
+    return event_data["action"] != "update" or "entity_id" in event_data["changes"]
+
+
+@callback
+def record_startup_phase(runtime_data: HVACZoningData, phase: str) -> None:
+    """Record and log when a startup phase ended, if startup is profiled."""
+    startup_profile = runtime_data.startup_profile
+    if startup_profile is None or phase in startup_profile.phases:
+        return
+    elapsed = startup_profile.phases[phase] = (
+        time.perf_counter() - startup_profile.started_at
+    )
+    LOGGER.info(
+        "[HVAC Zoning] startup profile: %s after %.1f ms", phase, elapsed * 1000
+    )
+
+
+@callback
+def async_update_systems(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    create_scheduler: Callable[[str], AdjustmentScheduler],
+    previous_config: HVACZoningConfig | None = None,
+) -> list[str]:
+    """Give every HVAC system its own scheduler and controller.
+
+    Each system is evaluated by its own scheduler, so the evaluations and
+    service calls of one system never wait on another. Systems no longer
+    configured are shut down. When only areas changed since the previous
+    configuration, systems whose areas are unchanged keep their controller
+    and cached evaluation. Returns the systems whose cached evaluation was
+    reset.
+    """
+    runtime_data = get_runtime_data(hass, config_entry)
+    config = get_config(hass, config_entry)
+    has_same_settings = previous_config is not None and config.has_same_settings(
+        previous_config
+    )
+    for central_thermostat_entity_id in list(runtime_data.systems):
+        if central_thermostat_entity_id not in config.systems:
+            async_shutdown_system(
+                runtime_data.systems.pop(central_thermostat_entity_id)
+            )
+    reset_systems = []
+    for central_thermostat_entity_id in config.systems:
+        system_data = get_system_data(hass, config_entry, central_thermostat_entity_id)
+        if system_data.scheduler is None:
+            system_data.scheduler = create_scheduler(central_thermostat_entity_id)
+        system_data.scheduler.window = config.evaluation_window
+        system_data.scheduler.max_latency = config.evaluation_max_latency
+        if (
+            has_same_settings
+            and system_data.controller is not None
+            and previous_config.systems.get(central_thermostat_entity_id)
+            == config.systems[central_thermostat_entity_id]
+        ):
+            continue
+        system_data.controller = create_controller(
+            config,
+            runtime_data.thermal_model.get_conditioning_rate
+            if runtime_data.thermal_model is not None
+            else None,
+        )
+        system_data.last_snapshot = None
+        system_data.last_plan = None
+        reset_systems.append(central_thermostat_entity_id)
+    return reset_systems
 
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Set up HVAC Zoning from a config entry."""
 
-    hass.data.setdefault(DOMAIN, {})
+    runtime_data = get_runtime_data(hass, config_entry)
+    runtime_data.config = HVACZoningConfig.from_config_entry_data(config_entry.data)
+    runtime_data.startup_profile = (
+        StartupProfile() if runtime_data.config.profile_startup else None
+    )
+
+    thermal_model = runtime_data.thermal_model = ThermalModel(
+        hass, config_entry.entry_id
+    )
+    controller_state = runtime_data.controller_state = ControllerState(
+        hass, config_entry.entry_id
+    )
+    _, saved_states = await asyncio.gather(
+        thermal_model.async_load(), controller_state.async_load(runtime_data)
+    )
+    record_startup_phase(runtime_data, STARTUP_PHASE_STORAGE_LOADED)
 
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
+    record_startup_phase(runtime_data, STARTUP_PHASE_PLATFORMS_SET_UP)
 
-    def handle_event_state_changed(event):
-        event_dict = event.as_dict()
-        data = event_dict["data"]
-        entity_id = data["entity_id"]
-        config_entry_data = config_entry.as_dict()["data"]
-        config_entry_data_with_only_valid_areas = filter_to_valid_areas(
-            config_entry_data
-        )
-        areas = config_entry_data_with_only_valid_areas.get("areas", {})
-        # cover_entity_ids = get_all_cover_entity_ids(areas)
-        connectivity_entity_ids = get_all_connectivity_entity_ids(areas)
-        # temperature_entity_ids = get_all_temperature_entity_ids(areas)
-        thermostat_entity_ids = get_all_thermostat_entity_ids(config_entry_data)
-        entity_registry = async_get_entity_registry(hass)
-        virtual_thermostat_entity_ids = []
-        for area_name in areas:
-            area_thermostat_unique_id = area_name + "_thermostat"
-            area_thermostat_entity_id = entity_registry.async_get_entity_id(
-                "climate", DOMAIN, area_thermostat_unique_id
+    stats = runtime_data.stats
+
+    def create_scheduler(central_thermostat_entity_id: str) -> AdjustmentScheduler:
+        async def async_adjust_system_with_forced_areas(
+            forced_areas: frozenset[str], zones: frozenset[str] | None
+        ):
+            system_data = runtime_data.systems[central_thermostat_entity_id]
+            triggers = frozenset(system_data.pending_triggers)
+            system_data.pending_triggers.clear()
+            started = time.perf_counter()
+            await async_adjust_system(
+                hass, config_entry, central_thermostat_entity_id, forced_areas, zones
+            )
+            stats.record_evaluation(triggers, time.perf_counter() - started)
+            record_startup_phase(runtime_data, STARTUP_PHASE_FIRST_EVALUATION)
+            async_dispatcher_send(
+                hass, SIGNAL_STATS_UPDATED.format(config_entry.entry_id)
             )
-            if area_thermostat_entity_id:
-                virtual_thermostat_entity_ids.append(area_thermostat_entity_id)
-        thermostat_entity_ids = thermostat_entity_ids + virtual_thermostat_entity_ids
+
+        config = get_config(hass, config_entry)
+        return AdjustmentScheduler(
+            hass,
+            config_entry,
+            config.evaluation_window,
+            config.evaluation_max_latency,
+            async_adjust_system_with_forced_areas,
+        )
+
+    async_update_systems(hass, config_entry, create_scheduler)
+    apply_saved_states(runtime_data, saved_states)
+
+    is_started = hass.state is CoreState.running
+
+    @callback
+    def handle_started(hass: HomeAssistant) -> None:
+        nonlocal is_started
+        is_started = True
+        request_systems(runtime_data, TRIGGER_STARTED)
+
+    @callback
+    def handle_event_state_changed(event: Event[EventStateChangedData]) -> None:
+        stats.events_received += 1
+        data = event.data
+        entity_id = data["entity_id"]
+        route = runtime_data.routing_index.get(entity_id)
+        # Until Home Assistant has started, source entities are still coming
+        # up; the whole house is evaluated once when they all have states.
+        if route is None or not is_started:
+            return
+        role, area_name = route
         old_state = data.get("old_state")
         new_state = data.get("new_state")
-        is_thermostat_change = entity_id in thermostat_entity_ids
+        config = get_config(hass, config_entry)
+        is_setpoint_change = determine_if_setpoint_changed(old_state, new_state)
+        # Area thermostats relay their temperature sensor, which is routed and
+        # filtered by the deadband separately.
+        is_thermostat_change = role == ROLE_CENTRAL_THERMOSTAT or (
+            role == ROLE_AREA_THERMOSTAT
+            and (
+                is_setpoint_change
+                or not determine_if_hvac_mode_unchanged(old_state, new_state)
+            )
+        )
+        if role == ROLE_TEMPERATURE and observe_area_temperature(
+            hass, runtime_data, config, area_name, new_state
+        ):
+            async_dispatcher_send(
+                hass,
+                SIGNAL_THERMAL_MODEL_UPDATED.format(config_entry.entry_id, area_name),
+            )
+        is_temperature_change = role == ROLE_TEMPERATURE and (
+            determine_if_temperature_moved(
+                new_state,
+                get_evaluated_temperature(config, runtime_data.systems, area_name),
+                config.temperature_deadband,
+            )
+        )
         is_connectivity_change = (
-            entity_id in connectivity_entity_ids
+            role == ROLE_CONNECTIVITY
             and old_state is not None
             and new_state is not None
             and old_state.state == STATE_OFF
             and new_state.state == STATE_ON
         )
-        if is_thermostat_change or is_connectivity_change:
-            trigger_type = (
-                "thermostat" if is_thermostat_change else "connectivity sensor"
-            )
-            old_state_str = old_state.state if old_state is not None else "unknown"
-            new_state_str = new_state.state if new_state is not None else "unknown"
+        if is_thermostat_change or is_temperature_change or is_connectivity_change:
+            if is_thermostat_change:
+                trigger = TRIGGER_THERMOSTAT
+            elif is_temperature_change:
+                trigger = TRIGGER_TEMPERATURE
+            else:
+                trigger = TRIGGER_CONNECTIVITY
             LOGGER.debug(
                 "[HVAC Zoning] handle_event_state_changed: Triggered by %s change - "
                 "entity_id=%s, old_state=%s, new_state=%s",
-                trigger_type,
+                trigger,
                 entity_id,
-                old_state_str,
-                new_state_str,
+                old_state.state if old_state is not None else "unknown",
+                new_state.state if new_state is not None else "unknown",
+            )
+            system_data = runtime_data.systems.get(
+                entity_id
+                if role == ROLE_CENTRAL_THERMOSTAT
+                else config.area_systems.get(area_name, "")
             )
-            adjust_house(hass, config_entry)
+            if system_data is None or system_data.scheduler is None:
+                return
+            scheduler = system_data.scheduler
+            stats.events_routed += 1
+            system_data.pending_triggers.add(trigger)
+            if is_connectivity_change:
+                scheduler.async_request({area_name}, immediate=True, zones={area_name})
+            elif role == ROLE_CENTRAL_THERMOSTAT:
+                # Without an HVAC mode change only the central setpoint can move.
+                scheduler.async_request(
+                    zones=frozenset()
+                    if determine_if_hvac_mode_unchanged(old_state, new_state)
+                    else None
+                )
+            else:
+                scheduler.async_request(immediate=is_setpoint_change, zones={area_name})
+
+    unsubscribe_state_changed: CALLBACK_TYPE | None = None
 
+    @callback
+    def update_routing_index(areas: Collection[str] | None = None) -> None:
+        nonlocal unsubscribe_state_changed
+        config = get_config(hass, config_entry)
+        routing_index = (
+            build_routing_index(hass, config, runtime_data.area_thermostat_entity_ids)
+            if areas is None
+            else update_routing_index_for_areas(
+                hass,
+                runtime_data.routing_index,
+                config,
+                runtime_data.area_thermostat_entity_ids,
+                areas,
+            )
+        )
+        is_same_entities = routing_index.keys() == runtime_data.routing_index.keys()
+        runtime_data.routing_index = routing_index
+        if unsubscribe_state_changed is not None and is_same_entities:
+            return
+        if unsubscribe_state_changed is not None:
+            unsubscribe_state_changed()
+        unsubscribe_state_changed = async_track_state_change_event(
+            hass, list(routing_index), handle_event_state_changed
+        )
+
+    @callback
+    def unsubscribe() -> None:
+        if unsubscribe_state_changed is not None:
+            unsubscribe_state_changed()
+        for system_data in runtime_data.systems.values():
+            async_shutdown_system(system_data)
+
+    async def handle_config_entry_updated(
+        hass: HomeAssistant, config_entry: ConfigEntry
+    ) -> None:
+        previous_config = get_config(hass, config_entry)
+        config = runtime_data.config = HVACZoningConfig.from_config_entry_data(
+            config_entry.data
+        )
+        reset_systems = async_update_systems(
+            hass, config_entry, create_scheduler, previous_config
+        )
+        # Only the changed areas' virtual thermostats and routes are rebuilt, so
+        # the other zones keep running through the update.
+        changed_areas = determine_changed_areas(previous_config, config)
+        for area_name in changed_areas:
+            runtime_data.area_thermostat_entity_ids.pop(area_name, None)
+        async_dispatcher_send(
+            hass, SIGNAL_AREAS_UPDATED.format(config_entry.entry_id), changed_areas
+        )
+        update_routing_index(changed_areas)
+        # The reset systems have no cached evaluation to compare against, so
+        # they are evaluated in full instead of waiting for a state change.
+        if is_started:
+            request_systems(runtime_data, TRIGGER_CONFIG, reset_systems)
+
+    @callback
+    def handle_event_entity_registry_updated(
+        event: Event[EventEntityRegistryUpdatedData],
+    ) -> None:
+        if split_entity_id(event.data["entity_id"])[0] == Platform.CLIMATE:
+            runtime_data.area_thermostat_entity_ids.clear()
+        update_routing_index()
+
+    update_routing_index()
+    config_entry.async_on_unload(unsubscribe)
+    # Runs right away when Home Assistant has already started.
+    config_entry.async_on_unload(async_at_started(hass, handle_started))
+    config_entry.async_on_unload(
+        config_entry.add_update_listener(handle_config_entry_updated)
+    )
     config_entry.async_on_unload(
-        hass.bus.async_listen(EVENT_STATE_CHANGED, handle_event_state_changed)
+        hass.bus.async_listen(
+            EVENT_ENTITY_REGISTRY_UPDATED,
+            handle_event_entity_registry_updated,
+            event_filter=is_entity_id_change,
+        )
     )
+    record_startup_phase(runtime_data, STARTUP_PHASE_SET_UP)
 
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the data stored for a config entry."""
+    await asyncio.gather(
+        ThermalModel(hass, entry.entry_id).async_remove(),
+        ControllerState(hass, entry.entry_id).async_remove(),
+    )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection
 import contextlib
 from typing import Any
 
@@ -11,12 +12,24 @@ from homeassistant.components.climate import (
     HVACMode,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.const import ATTR_TEMPERATURE, Platform, UnitOfTemperature
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from .utils import filter_to_valid_areas, get_all_thermostat_entity_ids
+from .const import DOMAIN, SIGNAL_AREAS_UPDATED, SIGNAL_THERMAL_MODEL_UPDATED
+from .models import AreaConfig, get_config, get_runtime_data
+from .thermal import ThermalModel
+from .utils import parse_temperature
 
 
 class Thermostat(ClimateEntity, RestoreEntity):
@@ -31,14 +44,26 @@ class Thermostat(ClimateEntity, RestoreEntity):
         name,
         temperature_sensor_entity_id,
         thermostat_entity_id,
+        *,
+        thermal_model: ThermalModel | None = None,
+        area: str | None = None,
+        config_entry_id: str | None = None,
     ) -> None:
         """Thermostat init."""
         self._hass = hass
+        self._thermal_model = thermal_model
+        self._area = area
+        self._config_entry_id = config_entry_id
         self._attr_unique_id = name
         self._attr_name = name
         self._attr_target_temperature = 72.0
         self._temperature_sensor_entity_id = temperature_sensor_entity_id
         self._thermostat_entity_id = thermostat_entity_id
+        self._attr_current_temperature = None
+        self._attr_hvac_mode = None
+        self._attr_hvac_modes = []
+        self._unsubscribe_sources: CALLBACK_TYPE | None = None
+        self._async_update_from_sources()
 
     async def _async_restore_target_temperature(self) -> None:
         """Restore target temperature from previous state."""
@@ -54,52 +79,115 @@ class Thermostat(ClimateEntity, RestoreEntity):
         await super().async_added_to_hass()
 
         await self._async_restore_target_temperature()
+        self._async_update_from_sources()
+        self._async_track_sources()
+        self.async_on_remove(self._async_untrack_sources)
+        if self._thermal_model is not None:
+            self.async_on_remove(
+                async_dispatcher_connect(
+                    self.hass,
+                    SIGNAL_THERMAL_MODEL_UPDATED.format(
+                        self._config_entry_id, self._area
+                    ),
+                    self.async_write_ha_state,
+                )
+            )
 
-    @property
-    def current_temperature(self) -> float | None:
-        """Return the current temperature from the temperature sensor."""
-        temperature_sensor = self._hass.states.get(self._temperature_sensor_entity_id)
-        if temperature_sensor is not None:
-            try:
-                return float(temperature_sensor.state)
-            except (ValueError, TypeError):
-                return None
-        return None
+    @callback
+    def _async_track_sources(self) -> None:
+        self._unsubscribe_sources = async_track_state_change_event(
+            self.hass,
+            [self._temperature_sensor_entity_id, self._thermostat_entity_id],
+            self._async_handle_source_state_changed,
+        )
 
-    @property
-    def hvac_mode(self) -> HVACMode | None:
-        """Return the current HVAC mode from the central thermostat."""
-        central_thermostat = self._hass.states.get(self._thermostat_entity_id)
-        if central_thermostat is not None:
-            try:
-                return HVACMode(central_thermostat.state)
-            except ValueError:
-                return None
-        return None
+    @callback
+    def _async_untrack_sources(self) -> None:
+        if self._unsubscribe_sources is not None:
+            self._unsubscribe_sources()
+            self._unsubscribe_sources = None
+
+    @callback
+    def async_update_sources(
+        self, temperature_sensor_entity_id, thermostat_entity_id
+    ) -> None:
+        """Follow the source entities of a reconfigured area."""
+        if (
+            temperature_sensor_entity_id == self._temperature_sensor_entity_id
+            and thermostat_entity_id == self._thermostat_entity_id
+        ):
+            return
+        self._temperature_sensor_entity_id = temperature_sensor_entity_id
+        self._thermostat_entity_id = thermostat_entity_id
+        if self._unsubscribe_sources is None:
+            self._async_update_from_sources()
+            return
+        self._async_untrack_sources()
+        self._async_track_sources()
+        if self._async_update_from_sources():
+            self.async_write_ha_state()
 
     @property
-    def hvac_modes(self) -> list[HVACMode]:
-        """Return the list of available HVAC modes.
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the learned heating and cooling rates of the area."""
+        if self._thermal_model is None:
+            return None
+        return self._thermal_model.as_attributes(self._area)
+
+    @callback
+    def _async_update_from_sources(self) -> bool:
+        """Cache values parsed from the source entities.
 
-        Only returns the current mode to prevent users from changing it.
-        The HVAC mode is controlled by the central thermostat.
+        Returns whether a displayed value changed.
         """
-        current_mode = self.hvac_mode
-        if current_mode is not None:
-            return [current_mode]
-        return []
+        temperature_sensor = self._hass.states.get(self._temperature_sensor_entity_id)
+        current_temperature = (
+            parse_temperature(temperature_sensor.state)
+            if temperature_sensor is not None
+            else None
+        )
+        central_thermostat = self._hass.states.get(self._thermostat_entity_id)
+        hvac_mode = None
+        if central_thermostat is not None:
+            with contextlib.suppress(ValueError):
+                hvac_mode = HVACMode(central_thermostat.state)
+        if (
+            current_temperature == self._attr_current_temperature
+            and hvac_mode == self._attr_hvac_mode
+        ):
+            return False
+        self._attr_current_temperature = current_temperature
+        self._attr_hvac_mode = hvac_mode
+        # Only the current mode is offered; it is controlled by the central
+        # thermostat.
+        self._attr_hvac_modes = [hvac_mode] if hvac_mode is not None else []
+        return True
 
-    def set_hvac_mode(self, hvac_mode: HVACMode) -> None:
+    @callback
+    def _async_handle_source_state_changed(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        if self._async_update_from_sources():
+            self.async_write_ha_state()
+
+    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set HVAC mode - disabled for virtual thermostats.
 
         The HVAC mode is controlled by the central thermostat and cannot
         be changed on virtual thermostats.
         """
 
-    def set_temperature(self, **kwargs: Any) -> None:
-        """Set new target temperature."""
+    async def async_set_temperature(self, **kwargs: Any) -> None:
+        """Set new target temperature.
+
+        Writing the state lets the integration re-evaluate this area right
+        away.
+        """
         temperature = kwargs.get(ATTR_TEMPERATURE)
+        if temperature is None or temperature == self._attr_target_temperature:
+            return
         self._attr_target_temperature = temperature
+        self.async_write_ha_state()
 
 
 async def async_setup_entry(
@@ -109,19 +197,61 @@ async def async_setup_entry(
 ) -> None:
     """Async setup entry."""
 
-    config_entry_data = config_entry.as_dict()["data"]
-    config_entry_data_with_only_valid_areas = filter_to_valid_areas(config_entry_data)
-    areas = config_entry_data_with_only_valid_areas.get("areas", {})
-    thermostat_entity_ids = get_all_thermostat_entity_ids(config_entry_data)
-    thermostat_entity_id = thermostat_entity_ids[0]
-    async_add_entities(
-        [
-            Thermostat(
-                hass,
-                key + "_thermostat",
-                value["temperature"],
-                thermostat_entity_id,
-            )
-            for key, value in areas.items()
-        ]
+    config = get_config(hass, config_entry)
+    runtime_data = get_runtime_data(hass, config_entry)
+    area_thermostat_entity_ids = runtime_data.area_thermostat_entity_ids
+    entity_registry = async_get_entity_registry(hass)
+    for area in config.valid_areas:
+        if entity_id := entity_registry.async_get_entity_id(
+            Platform.CLIMATE, DOMAIN, area.name + "_thermostat"
+        ):
+            area_thermostat_entity_ids[area.name] = entity_id
+
+    def create_thermostat(area: AreaConfig) -> Thermostat:
+        return Thermostat(
+            hass,
+            area.name + "_thermostat",
+            area.temperature,
+            get_config(hass, config_entry).area_systems.get(area.name),
+            thermal_model=runtime_data.thermal_model,
+            area=area.name,
+            config_entry_id=config_entry.entry_id,
+        )
+
+    thermostats = {area.name: create_thermostat(area) for area in config.valid_areas}
+    async_add_entities(list(thermostats.values()))
+
+    @callback
+    def handle_areas_updated(areas: Collection[str]) -> None:
+        """Add, follow or remove the virtual thermostats of changed areas."""
+        config = get_config(hass, config_entry)
+        added_thermostats = []
+        for area_name in areas:
+            thermostat = thermostats.get(area_name)
+            if area_name not in config.valid_area_indexes:
+                if thermostat is None:
+                    continue
+                del thermostats[area_name]
+                if thermostat.registry_entry is not None:
+                    entity_registry.async_remove(thermostat.entity_id)
+                else:
+                    config_entry.async_create_task(hass, thermostat.async_remove())
+                continue
+            area = config.areas[area_name]
+            if thermostat is None:
+                thermostats[area_name] = thermostat = create_thermostat(area)
+                added_thermostats.append(thermostat)
+            else:
+                thermostat.async_update_sources(
+                    area.temperature, config.area_systems.get(area_name)
+                )
+        if added_thermostats:
+            async_add_entities(added_thermostats)
+
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            SIGNAL_AREAS_UPDATED.format(config_entry.entry_id),
+            handle_areas_updated,
+        )
     )
@@ -4,14 +4,21 @@ from __future__ import annotations
 
 from typing import Any
 
-from homeassistant.components.binary_sensor import BinarySensorDeviceClass
-from homeassistant.components.cover import CoverDeviceClass
-from homeassistant.components.sensor import SensorDeviceClass
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
-from homeassistant.const import STATE_OFF, STATE_UNAVAILABLE, STATE_UNKNOWN
-from homeassistant.helpers.area_registry import AreaRegistry
-from homeassistant.helpers.entity_registry import EntityRegistry, async_entries_for_area
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
+from homeassistant.const import STATE_OFF, STATE_UNAVAILABLE, STATE_UNKNOWN, Platform
+from homeassistant.core import callback
+from homeassistant.data_entry_flow import section
+from homeassistant.helpers import area_registry as ar, entity_registry as er
 from homeassistant.helpers.selector import (
+    BooleanSelector,
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
     SelectOptionDict,
     SelectSelector,
     SelectSelectorConfig,
@@ -20,14 +27,79 @@ from homeassistant.helpers.selector import (
 )
 import voluptuous as vol
 
-from .const import DOMAIN
+from .const import (
+    CONF_CENTRAL_THERMOSTAT,
+    CONF_CONTROLLER,
+    CONF_EVALUATION_MAX_LATENCY,
+    CONF_EVALUATION_WINDOW,
+    CONF_HYSTERESIS,
+    CONF_MAX_SETPOINT_OFFSET,
+    CONF_MIN_DWELL,
+    CONF_MIN_OPEN_AREA,
+    CONF_PID_KD,
+    CONF_PID_KI,
+    CONF_PID_KP,
+    CONF_POSITION_STEP,
+    CONF_PROFILE_STARTUP,
+    CONF_PROPORTIONAL_BAND,
+    CONF_TEMPERATURE_COMPARISON,
+    CONF_TEMPERATURE_DEADBAND,
+    CONF_TEMPERATURE_TOLERANCE,
+    CONF_VENT_MODE,
+    CONTROLLER_MPC,
+    CONTROLLER_PID,
+    CONTROLLER_SIMPLE,
+    DEFAULT_CONTROLLER,
+    DEFAULT_EVALUATION_MAX_LATENCY,
+    DEFAULT_EVALUATION_WINDOW,
+    DEFAULT_HYSTERESIS,
+    DEFAULT_MAX_SETPOINT_OFFSET,
+    DEFAULT_MIN_DWELL,
+    DEFAULT_MIN_OPEN_AREA,
+    DEFAULT_PID_KD,
+    DEFAULT_PID_KI,
+    DEFAULT_PID_KP,
+    DEFAULT_POSITION_STEP,
+    DEFAULT_PROFILE_STARTUP,
+    DEFAULT_PROPORTIONAL_BAND,
+    DEFAULT_TEMPERATURE_COMPARISON,
+    DEFAULT_TEMPERATURE_DEADBAND,
+    DEFAULT_TEMPERATURE_TOLERANCE,
+    DEFAULT_VENT_MODE,
+    DOMAIN,
+    MIN_SETPOINT_OFFSET,
+    TEMPERATURE_COMPARISON_PRECISE,
+    TEMPERATURE_COMPARISON_TRUNCATE,
+    VENT_MODE_BINARY,
+    VENT_MODE_PROPORTIONAL,
+)
+from .utils import filter_to_valid_areas, get_all_thermostat_entity_ids
+
+# Device class values, so the cover, binary sensor and sensor components are
+# not loaded with the config flow, which is imported on every startup.
+DEVICE_CLASS_DAMPER = "damper"
+DEVICE_CLASS_CONNECTIVITY = "connectivity"
+DEVICE_CLASS_TEMPERATURE = "temperature"
+
+FLOW_DEVICE_CLASSES = frozenset(
+    {
+        DEVICE_CLASS_DAMPER,
+        DEVICE_CLASS_CONNECTIVITY,
+        DEVICE_CLASS_TEMPERATURE,
+        Platform.CLIMATE,
+    }
+)
+
+AREA_OPTIONS = (
+    ("covers", DEVICE_CLASS_DAMPER, True),
+    ("connectivities", DEVICE_CLASS_CONNECTIVITY, True),
+    ("temperature", DEVICE_CLASS_TEMPERATURE, False),
+)
 
 
-async def get_areas(self):
-    """Load and list areas."""
-    areaRegistry = AreaRegistry(self.hass)
-    await areaRegistry.async_load()
-    return list(areaRegistry.async_list_areas())
+def get_areas(self):
+    """List areas from the loaded area registry."""
+    return list(ar.async_get(self.hass).async_list_areas())
 
 
 def is_entity_available(hass, entity_id, device_class=None):
@@ -36,88 +108,108 @@ def is_entity_available(hass, entity_id, device_class=None):
     if state is None:
         return False
     unavailable_states = [STATE_UNAVAILABLE, STATE_UNKNOWN]
-    if device_class == BinarySensorDeviceClass.CONNECTIVITY:
+    if device_class == DEVICE_CLASS_CONNECTIVITY:
         unavailable_states.append(STATE_OFF)
     return state.state not in unavailable_states
 
 
-def filter_entities_to_device_class_and_map_to_entity_ids(hass, entities, device_class):
-    """Map entities to entity names."""
-    return [
-        entity.entity_id
-        for entity in entities
-        if device_class
-        in (entity.original_device_class, entity.entity_id.split(".")[0])
-        and is_entity_available(hass, entity.entity_id, device_class)
-    ]
+def determine_entity_device_classes(entity):
+    """Determine which of the flow's device classes an entity can fill."""
+    return {
+        entity.original_device_class,
+        entity.entity_id.partition(".")[0],
+    }.intersection(FLOW_DEVICE_CLASSES)
+
+
+def classify_entities(hass, entities):
+    """Bucket available entities by the flow device class they can fill.
+
+    Each entity is classified and its state looked up once, however many
+    steps and device classes read the buckets.
+    """
+    entities_by_device_class: dict[str, list[er.RegistryEntry]] = {}
+    for entity in entities:
+        for device_class in determine_entity_device_classes(entity):
+            if is_entity_available(hass, entity.entity_id, device_class):
+                entities_by_device_class.setdefault(device_class, []).append(entity)
+    return entities_by_device_class
 
 
-async def get_entities_for_area(self, area_id):
-    """Get entities for area."""
-    entity_registry = EntityRegistry(self.hass)
-    await entity_registry.async_load()
-    return async_entries_for_area(entity_registry, area_id)
+def build_area_entities_index(hass):
+    """Group the entities of the loaded entity registry by area."""
+    area_entities_index: dict[str, list[er.RegistryEntry]] = {}
+    for entity in er.async_get(hass).entities.values():
+        if entity.area_id is not None:
+            area_entities_index.setdefault(entity.area_id, []).append(entity)
+    return area_entities_index
+
+
+def get_entities_for_area(self, area_id):
+    """Get entities for area, indexing all areas once per flow."""
+    if self.area_entities_index is None:
+        self.area_entities_index = build_area_entities_index(self.hass)
+    return self.area_entities_index.get(area_id, [])
+
+
+def get_entities_for_area_and_device_class(self, area_id, device_class):
+    """Get the available entities of a device class in an area.
+
+    Each area is classified once per flow and every step reads its buckets.
+    """
+    if (entities_by_device_class := self.area_device_classes.get(area_id)) is None:
+        entities_by_device_class = self.area_device_classes[area_id] = (
+            classify_entities(self.hass, get_entities_for_area(self, area_id))
+        )
+    return entities_by_device_class.get(device_class, [])
 
 
 async def get_defaults(self, area, device_class, multiple):
     """Get defaults for form."""
-    entities_for_area = await get_entities_for_area(self, area.id)
-    entity_ids = filter_entities_to_device_class_and_map_to_entity_ids(
-        self.hass,
-        entities_for_area,
-        device_class,
-    )
+    entity_ids = [
+        entity.entity_id
+        for entity in get_entities_for_area_and_device_class(
+            self, area.id, device_class
+        )
+    ]
     if not multiple:
         return entity_ids[0] if entity_ids else []
     return entity_ids
 
 
-def filter_entities_to_device_class_and_map_to_value_and_label_array_of_dict(
-    hass, entities, device_class
-):
-    """Map entities to entity names."""
+async def get_options(self, area, device_class):
+    """Get options for form."""
     return [
         {"value": entity.entity_id, "label": entity.original_name}
-        for entity in entities
-        if device_class
-        in (entity.original_device_class, entity.entity_id.split(".")[0])
-        and is_entity_available(hass, entity.entity_id, device_class)
+        for entity in get_entities_for_area_and_device_class(
+            self, area.id, device_class
+        )
     ]
 
 
-async def get_options(self, area, device_class):
-    """Get options for form."""
-    entities_for_area = await get_entities_for_area(self, area.id)
-    return filter_entities_to_device_class_and_map_to_value_and_label_array_of_dict(
-        self.hass,
-        entities_for_area,
-        device_class,
-    )
-
-
 async def build_schema_for_device_class(self, device_class, multiple):
     """Build schema for device class."""
-    areas = await get_areas(self)
-    return vol.Schema(
-        {
+    schema = {}
+    for area in get_areas(self):
+        options = await get_options(self, area, device_class)
+        if len(options) == 0:
+            continue
+        schema[
             vol.Optional(
                 area.id,
                 default=await get_defaults(self, area, device_class, multiple),
-            ): SelectSelector(
-                SelectSelectorConfig(
-                    options=await get_options(self, area, device_class),
-                    multiple=multiple,
-                )
             )
-            for area in areas
-            if len(await get_options(self, area, device_class)) != 0
-        },
-    )
+        ] = SelectSelector(
+            SelectSelectorConfig(
+                options=options,
+                multiple=multiple,
+            )
+        )
+    return vol.Schema(schema)
 
 
 async def build_schema_for_areas(self):
     """Build schema for areas."""
-    areas = await get_areas(self)
+    areas = get_areas(self)
     return vol.Schema(
         {
             vol.Optional("bedrooms"): SelectSelector(
@@ -135,6 +227,308 @@ async def build_schema_for_areas(self):
     )
 
 
+def build_schema_for_systems(config_entry):
+    """Build schema for mapping areas to central thermostats."""
+    thermostat_entity_ids = list(
+        dict.fromkeys(get_all_thermostat_entity_ids(config_entry))
+    )
+    return vol.Schema(
+        {
+            vol.Optional(area_id, default=thermostat_entity_ids[0]): SelectSelector(
+                SelectSelectorConfig(
+                    options=[
+                        SelectOptionDict(value=entity_id, label=entity_id)
+                        for entity_id in thermostat_entity_ids
+                    ],
+                )
+            )
+            for area_id in filter_to_valid_areas(config_entry)["areas"]
+        }
+    )
+
+
+def build_area_settings_schema(area_config):
+    """Build the fields of an area's hysteresis and minimum dwell."""
+    return {
+        vol.Required(
+            CONF_HYSTERESIS,
+            default=area_config.get(CONF_HYSTERESIS, DEFAULT_HYSTERESIS),
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=0,
+                max=5,
+                step=0.1,
+                unit_of_measurement="°",
+                mode=NumberSelectorMode.BOX,
+            )
+        ),
+        vol.Required(
+            CONF_MIN_DWELL,
+            default=area_config.get(CONF_MIN_DWELL, DEFAULT_MIN_DWELL),
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=0,
+                max=3600,
+                step=1,
+                unit_of_measurement="s",
+                mode=NumberSelectorMode.BOX,
+            )
+        ),
+    }
+
+
+def build_schema_for_area_settings(config_entry):
+    """Build schema for the settings of each valid area, one section each."""
+    return vol.Schema(
+        {
+            vol.Required(area_id): section(
+                vol.Schema(build_area_settings_schema(area_config)),
+                {"collapsed": True},
+            )
+            for area_id, area_config in filter_to_valid_areas(config_entry)[
+                "areas"
+            ].items()
+        }
+    )
+
+
+async def build_schema_for_area(self, area):
+    """Build schema for editing the entities and settings of one area."""
+    area_config = self.config_entry.data.get("areas", {}).get(area.id, {})
+    schema = {}
+    for key, device_class, multiple in AREA_OPTIONS:
+        options = await get_options(self, area, device_class)
+        if len(options) == 0:
+            continue
+        default = area_config.get(key)
+        schema[vol.Optional(key, default=default) if default else vol.Optional(key)] = (
+            SelectSelector(
+                SelectSelectorConfig(
+                    options=options,
+                    multiple=multiple,
+                )
+            )
+        )
+    schema[vol.Optional("bedroom", default=area_config.get("bedroom", False))] = (
+        BooleanSelector()
+    )
+    thermostat_entity_ids = list(
+        dict.fromkeys(get_all_thermostat_entity_ids(self.config_entry.data))
+    )
+    if len(thermostat_entity_ids) > 1:
+        schema[
+            vol.Optional(
+                CONF_CENTRAL_THERMOSTAT,
+                default=area_config.get(
+                    CONF_CENTRAL_THERMOSTAT, thermostat_entity_ids[0]
+                ),
+            )
+        ] = SelectSelector(
+            SelectSelectorConfig(
+                options=[
+                    SelectOptionDict(value=entity_id, label=entity_id)
+                    for entity_id in thermostat_entity_ids
+                ],
+            )
+        )
+    schema.update(build_area_settings_schema(area_config))
+    return vol.Schema(schema)
+
+
+def build_schema_for_settings(config_entry_data):
+    """Build schema for the settings shared by every area."""
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_TEMPERATURE_COMPARISON,
+                default=config_entry_data.get(
+                    CONF_TEMPERATURE_COMPARISON, DEFAULT_TEMPERATURE_COMPARISON
+                ),
+            ): SelectSelector(
+                SelectSelectorConfig(
+                    options=[
+                        TEMPERATURE_COMPARISON_TRUNCATE,
+                        TEMPERATURE_COMPARISON_PRECISE,
+                    ],
+                    translation_key=CONF_TEMPERATURE_COMPARISON,
+                )
+            ),
+            vol.Required(
+                CONF_TEMPERATURE_TOLERANCE,
+                default=config_entry_data.get(
+                    CONF_TEMPERATURE_TOLERANCE, DEFAULT_TEMPERATURE_TOLERANCE
+                ),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=0,
+                    max=2,
+                    step=0.1,
+                    unit_of_measurement="°",
+                    mode=NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Required(
+                CONF_TEMPERATURE_DEADBAND,
+                default=config_entry_data.get(
+                    CONF_TEMPERATURE_DEADBAND, DEFAULT_TEMPERATURE_DEADBAND
+                ),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=0,
+                    max=2,
+                    step=0.1,
+                    unit_of_measurement="°",
+                    mode=NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Required(
+                CONF_VENT_MODE,
+                default=config_entry_data.get(CONF_VENT_MODE, DEFAULT_VENT_MODE),
+            ): SelectSelector(
+                SelectSelectorConfig(
+                    options=[VENT_MODE_BINARY, VENT_MODE_PROPORTIONAL],
+                    translation_key=CONF_VENT_MODE,
+                )
+            ),
+            vol.Required(
+                CONF_PROPORTIONAL_BAND,
+                default=config_entry_data.get(
+                    CONF_PROPORTIONAL_BAND, DEFAULT_PROPORTIONAL_BAND
+                ),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=0.1,
+                    max=10,
+                    step=0.1,
+                    unit_of_measurement="°",
+                    mode=NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Required(
+                CONF_MIN_OPEN_AREA,
+                default=config_entry_data.get(
+                    CONF_MIN_OPEN_AREA, DEFAULT_MIN_OPEN_AREA
+                ),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=0,
+                    max=100,
+                    step=1,
+                    unit_of_measurement="%",
+                    mode=NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Required(
+                CONF_POSITION_STEP,
+                default=config_entry_data.get(
+                    CONF_POSITION_STEP, DEFAULT_POSITION_STEP
+                ),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=1,
+                    max=100,
+                    step=1,
+                    unit_of_measurement="%",
+                    mode=NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Required(
+                CONF_CONTROLLER,
+                default=config_entry_data.get(CONF_CONTROLLER, DEFAULT_CONTROLLER),
+            ): SelectSelector(
+                SelectSelectorConfig(
+                    options=[CONTROLLER_SIMPLE, CONTROLLER_PID, CONTROLLER_MPC],
+                    translation_key=CONF_CONTROLLER,
+                )
+            ),
+            **{
+                vol.Required(
+                    key, default=config_entry_data.get(key, default)
+                ): NumberSelector(
+                    NumberSelectorConfig(
+                        min=0, max=10, step="any", mode=NumberSelectorMode.BOX
+                    )
+                )
+                for key, default in (
+                    (CONF_PID_KP, DEFAULT_PID_KP),
+                    (CONF_PID_KI, DEFAULT_PID_KI),
+                    (CONF_PID_KD, DEFAULT_PID_KD),
+                )
+            },
+            vol.Required(
+                CONF_MAX_SETPOINT_OFFSET,
+                default=config_entry_data.get(
+                    CONF_MAX_SETPOINT_OFFSET, DEFAULT_MAX_SETPOINT_OFFSET
+                ),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=MIN_SETPOINT_OFFSET,
+                    max=10,
+                    step=0.5,
+                    unit_of_measurement="°",
+                    mode=NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Required(
+                CONF_EVALUATION_WINDOW,
+                default=config_entry_data.get(
+                    CONF_EVALUATION_WINDOW, DEFAULT_EVALUATION_WINDOW
+                ),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=0.25,
+                    max=2,
+                    step=0.05,
+                    unit_of_measurement="s",
+                    mode=NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Required(
+                CONF_EVALUATION_MAX_LATENCY,
+                default=config_entry_data.get(
+                    CONF_EVALUATION_MAX_LATENCY, DEFAULT_EVALUATION_MAX_LATENCY
+                ),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=0.25,
+                    max=10,
+                    step=0.25,
+                    unit_of_measurement="s",
+                    mode=NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Required(
+                CONF_PROFILE_STARTUP,
+                default=config_entry_data.get(
+                    CONF_PROFILE_STARTUP, DEFAULT_PROFILE_STARTUP
+                ),
+            ): BooleanSelector(),
+        }
+    )
+
+
+def merge_area_input(config_entry_data, area_id, user_input, keys):
+    """Merge the edited keys of one area into the config entry data.
+
+    Keys that were offered but left empty are removed from the area.
+    """
+    areas = config_entry_data.get("areas", {})
+    return {
+        **config_entry_data,
+        "areas": {
+            **areas,
+            area_id: {
+                **{
+                    key: value
+                    for key, value in areas.get(area_id, {}).items()
+                    if key not in keys
+                },
+                **user_input,
+            },
+        },
+    }
+
+
 def get_all_rooms(user_input1, user_input2):
     """Get all rooms."""
     return sorted(set(user_input1.keys()).union(user_input2.keys()))
@@ -179,6 +573,17 @@ class HVACZoningConfigFlow(ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
     init_info: dict[str, Any] = {}
+    area_entities_index: dict[str, list[er.RegistryEntry]] | None = None
+
+    def __init__(self) -> None:
+        """Initialize the flow."""
+        self.area_device_classes: dict[str, dict[str, list[er.RegistryEntry]]] = {}
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> HVACZoningOptionsFlow:
+        """Get the options flow for editing areas."""
+        return HVACZoningOptionsFlow()
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -192,7 +597,7 @@ class HVACZoningConfigFlow(ConfigFlow, domain=DOMAIN):
         return self.async_show_form(
             step_id="user",
             data_schema=await build_schema_for_device_class(
-                self, CoverDeviceClass.DAMPER, True
+                self, DEVICE_CLASS_DAMPER, True
             ),
             errors=errors,
         )
@@ -214,7 +619,7 @@ class HVACZoningConfigFlow(ConfigFlow, domain=DOMAIN):
         return self.async_show_form(
             step_id="second",
             data_schema=await build_schema_for_device_class(
-                self, BinarySensorDeviceClass.CONNECTIVITY, True
+                self, DEVICE_CLASS_CONNECTIVITY, True
             ),
             errors=errors,
         )
@@ -231,7 +636,7 @@ class HVACZoningConfigFlow(ConfigFlow, domain=DOMAIN):
         return self.async_show_form(
             step_id="third",
             data_schema=await build_schema_for_device_class(
-                self, SensorDeviceClass.TEMPERATURE, False
+                self, DEVICE_CLASS_TEMPERATURE, False
             ),
             errors=errors,
         )
@@ -243,6 +648,8 @@ class HVACZoningConfigFlow(ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
         if user_input is not None:
             self.init_info = merge_user_input(self.init_info, user_input, "climate")
+            if len(set(get_all_thermostat_entity_ids(self.init_info))) > 1:
+                return await self.async_step_systems()
             return await self.async_step_fifth()
 
         return self.async_show_form(
@@ -251,6 +658,23 @@ class HVACZoningConfigFlow(ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    async def async_step_systems(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle mapping areas to central thermostats."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            self.init_info = merge_user_input(
+                self.init_info, user_input, CONF_CENTRAL_THERMOSTAT
+            )
+            return await self.async_step_fifth()
+
+        return self.async_show_form(
+            step_id="systems",
+            data_schema=build_schema_for_systems(self.init_info),
+            errors=errors,
+        )
+
     async def async_step_fifth(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -268,7 +692,7 @@ class HVACZoningConfigFlow(ConfigFlow, domain=DOMAIN):
                 "bed_time": user_input["bed_time"],
                 "wake_time": user_input["wake_time"],
             }
-            return await self.async_step_sixth()
+            return await self.async_step_area_settings()
 
         return self.async_show_form(
             step_id="fifth",
@@ -276,6 +700,30 @@ class HVACZoningConfigFlow(ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    async def async_step_area_settings(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle setting the hysteresis and minimum dwell of each area."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            self.init_info = {
+                **self.init_info,
+                "areas": {
+                    area_id: {**area_config, **user_input.get(area_id, {})}
+                    for area_id, area_config in self.init_info["areas"].items()
+                },
+            }
+            return await self.async_step_sixth()
+
+        data_schema = build_schema_for_area_settings(self.init_info)
+        if not data_schema.schema:
+            return await self.async_step_sixth()
+        return self.async_show_form(
+            step_id="area_settings",
+            data_schema=data_schema,
+            errors=errors,
+        )
+
     async def async_step_sixth(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -307,3 +755,95 @@ class HVACZoningConfigFlow(ConfigFlow, domain=DOMAIN):
             ),
             errors=errors,
         )
+
+
+class HVACZoningOptionsFlow(OptionsFlow):
+    """Handle editing one area of an HVAC Zoning entry at a time.
+
+    The edited area is written to the entry's data, whose update listener
+    applies the change to that area alone instead of reloading the entry.
+    """
+
+    area_entities_index: dict[str, list[er.RegistryEntry]] | None = None
+
+    def __init__(self) -> None:
+        """Initialize the flow."""
+        self.area_device_classes: dict[str, dict[str, list[er.RegistryEntry]]] = {}
+        self.area: ar.AreaEntry | None = None
+        self.area_keys: frozenset[str] = frozenset()
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle choosing between editing an area and the shared settings."""
+        return self.async_show_menu(
+            step_id="init", menu_options=["select_area", "settings"]
+        )
+
+    async def async_step_select_area(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle selecting the area to edit."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            self.area = ar.async_get(self.hass).async_get_area(user_input["area"])
+            if self.area is not None:
+                return await self.async_step_area()
+            errors["base"] = "area_not_found"
+
+        return self.async_show_form(
+            step_id="select_area",
+            data_schema=vol.Schema(
+                {
+                    vol.Required("area"): SelectSelector(
+                        SelectSelectorConfig(
+                            options=[
+                                SelectOptionDict(value=area.id, label=area.name)
+                                for area in get_areas(self)
+                            ],
+                        )
+                    ),
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_area(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle editing the selected area."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            self.hass.config_entries.async_update_entry(
+                self.config_entry,
+                data=merge_area_input(
+                    self.config_entry.data, self.area.id, user_input, self.area_keys
+                ),
+            )
+            return self.async_create_entry(data=dict(self.config_entry.options))
+
+        data_schema = await build_schema_for_area(self, self.area)
+        self.area_keys = frozenset(str(key) for key in data_schema.schema)
+        return self.async_show_form(
+            step_id="area",
+            data_schema=data_schema,
+            errors=errors,
+            description_placeholders={"area": self.area.name},
+        )
+
+    async def async_step_settings(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle editing the settings shared by every area."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            self.hass.config_entries.async_update_entry(
+                self.config_entry, data={**self.config_entry.data, **user_input}
+            )
+            return self.async_create_entry(data=dict(self.config_entry.options))
+
+        return self.async_show_form(
+            step_id="settings",
+            data_schema=build_schema_for_settings(self.config_entry.data),
+            errors=errors,
+        )
@@ -1,14 +1,126 @@
 """Constants for the HVAC Zoning integration."""
 
+from datetime import timedelta
 import logging
 
-from homeassistant.components.climate import HVACMode
+from homeassistant.const import (
+    SERVICE_CLOSE_COVER,
+    SERVICE_OPEN_COVER,
+    STATE_CLOSED,
+    STATE_CLOSING,
+    STATE_OPEN,
+    STATE_OPENING,
+)
 
 LOGGER = logging.getLogger(__package__)
 
 DOMAIN = "hvac_zoning"
 
-SUPPORTED_HVAC_MODES = [HVACMode.HEAT, HVACMode.COOL]
+# Values of climate and cover component constants. Only the climate platform
+# imports those components, so importing this package, as loading the config
+# flow does, loads neither.
+HVAC_MODE_HEAT = "heat"
+HVAC_MODE_COOL = "cool"
+SUPPORTED_HVAC_MODES = [HVAC_MODE_HEAT, HVAC_MODE_COOL]
+ATTR_HVAC_ACTION = "hvac_action"
+HVAC_ACTIONS_BY_MODE = {HVAC_MODE_HEAT: "heating", HVAC_MODE_COOL: "cooling"}
+SERVICE_SET_TEMPERATURE = "set_temperature"
+ATTR_POSITION = "position"
+ATTR_CURRENT_POSITION = "current_position"
+COVER_FEATURE_SET_POSITION = 4
 
 ACTIVE = "active"
 IDLE = "idle"
+
+ROLE_CENTRAL_THERMOSTAT = "central_thermostat"
+ROLE_AREA_THERMOSTAT = "area_thermostat"
+ROLE_CONNECTIVITY = "connectivity"
+ROLE_TEMPERATURE = "temperature"
+
+COVER_STATES_BY_SERVICE = {
+    SERVICE_OPEN_COVER: (STATE_OPEN, STATE_OPENING),
+    SERVICE_CLOSE_COVER: (STATE_CLOSED, STATE_CLOSING),
+}
+COMMAND_RETRY_INTERVAL = timedelta(minutes=15)
+
+CONF_CENTRAL_THERMOSTAT = "central_thermostat"
+
+CONF_EVALUATION_WINDOW = "evaluation_window"
+CONF_EVALUATION_MAX_LATENCY = "evaluation_max_latency"
+DEFAULT_EVALUATION_WINDOW = 0.5
+DEFAULT_EVALUATION_MAX_LATENCY = 2.0
+
+CONF_PROFILE_STARTUP = "profile_startup"
+DEFAULT_PROFILE_STARTUP = False
+
+CONF_TEMPERATURE_DEADBAND = "temperature_deadband"
+DEFAULT_TEMPERATURE_DEADBAND = 0.3
+
+CONF_HYSTERESIS = "hysteresis"
+CONF_MIN_DWELL = "min_dwell"
+DEFAULT_HYSTERESIS = 0.0
+DEFAULT_MIN_DWELL = 0
+
+CONF_TEMPERATURE_COMPARISON = "temperature_comparison"
+CONF_TEMPERATURE_TOLERANCE = "temperature_tolerance"
+TEMPERATURE_COMPARISON_TRUNCATE = "truncate"
+TEMPERATURE_COMPARISON_PRECISE = "precise"
+DEFAULT_TEMPERATURE_COMPARISON = TEMPERATURE_COMPARISON_TRUNCATE
+DEFAULT_TEMPERATURE_TOLERANCE = 0.1
+
+CONF_VENT_MODE = "vent_mode"
+CONF_PROPORTIONAL_BAND = "proportional_band"
+CONF_MIN_OPEN_AREA = "min_open_area"
+CONF_POSITION_STEP = "position_step"
+VENT_MODE_BINARY = "binary"
+VENT_MODE_PROPORTIONAL = "proportional"
+DEFAULT_VENT_MODE = VENT_MODE_BINARY
+DEFAULT_PROPORTIONAL_BAND = 2.0
+DEFAULT_MIN_OPEN_AREA = 30
+DEFAULT_POSITION_STEP = 10
+MIN_OPEN_POSITION = 10
+
+CONF_CONTROLLER = "controller"
+CONF_PID_KP = "pid_kp"
+CONF_PID_KI = "pid_ki"
+CONF_PID_KD = "pid_kd"
+CONF_MAX_SETPOINT_OFFSET = "max_setpoint_offset"
+CONTROLLER_SIMPLE = "simple"
+CONTROLLER_PID = "pid"
+CONTROLLER_MPC = "mpc"
+DEFAULT_CONTROLLER = CONTROLLER_SIMPLE
+DEFAULT_PID_KP = 1.0
+DEFAULT_PID_KI = 0.02
+DEFAULT_PID_KD = 0.0
+DEFAULT_MAX_SETPOINT_OFFSET = 4.0
+MIN_SETPOINT_OFFSET = 1.0
+# °/min an area is assumed to heat or cool by until a rate is learned.
+DEFAULT_ZONE_RATE = 0.1
+
+THERMAL_MODEL_STORAGE_KEY = "hvac_zoning.thermal_model.{}"
+THERMAL_MODEL_STORAGE_VERSION = 1
+THERMAL_MODEL_SAVE_DELAY = 60
+THERMAL_MODEL_FORGETTING_FACTOR = 0.95
+THERMAL_MODEL_MIN_INTERVAL = timedelta(minutes=5)
+THERMAL_MODEL_MAX_INTERVAL = timedelta(hours=1)
+
+CONTROLLER_STATE_STORAGE_KEY = "hvac_zoning.controller_state.{}"
+CONTROLLER_STATE_STORAGE_VERSION = 1
+CONTROLLER_STATE_SAVE_DELAY = 10
+
+TRIGGER_THERMOSTAT = "thermostat"
+TRIGGER_CONNECTIVITY = "connectivity"
+TRIGGER_TEMPERATURE = "temperature"
+TRIGGER_DWELL = "dwell"
+TRIGGER_STARTED = "started"
+TRIGGER_CONFIG = "config"
+
+STARTUP_PHASE_STORAGE_LOADED = "storage_loaded"
+STARTUP_PHASE_PLATFORMS_SET_UP = "platforms_set_up"
+STARTUP_PHASE_SET_UP = "set_up"
+STARTUP_PHASE_FIRST_EVALUATION = "first_evaluation"
+
+EVALUATION_LATENCY_SAMPLES = 100
+SIGNAL_AREAS_UPDATED = "hvac_zoning_areas_updated_{}"
+SIGNAL_STATS_UPDATED = "hvac_zoning_stats_updated_{}"
+SIGNAL_THERMAL_MODEL_UPDATED = "hvac_zoning_thermal_model_updated_{}_{}"
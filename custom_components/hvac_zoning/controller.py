@@ -0,0 +1,193 @@
+"""Central setpoint controllers for the HVAC Zoning integration.
+
+A controller turns an evaluated plan into the central setpoint. The simple
+controller keeps the fixed nudge of determine_change_in_temperature; the PID
+and model-predictive controllers size the nudge from how far the lagging
+area still has to go, so the system runs one long cycle instead of several
+short ones.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from .const import (
+    CONTROLLER_MPC,
+    CONTROLLER_PID,
+    DEFAULT_ZONE_RATE,
+    HVAC_MODE_COOL,
+    IDLE,
+    MIN_SETPOINT_OFFSET,
+    SUPPORTED_HVAC_MODES,
+)
+from .engine import (
+    HousePlan,
+    HouseSnapshot,
+    determine_central_setpoint,
+    determine_temperature_error,
+)
+
+if TYPE_CHECKING:
+    from .models import HVACZoningConfig
+
+type ZoneRates = Callable[[str, str], float | None]
+"""Return the learned rate of an area in °/min with its vent open, by mode."""
+
+
+def iter_lagging_errors(
+    snapshot: HouseSnapshot, plan: HousePlan
+) -> Iterator[tuple[int, float]]:
+    """Yield the index and error of every area keeping the house active."""
+    is_night = snapshot.is_night_time_mode and snapshot.is_night_time
+    for index, (need, is_bedroom) in enumerate(
+        zip(plan.needs, snapshot.is_bedrooms, strict=True)
+    ):
+        if not need or (is_night and not is_bedroom):
+            continue
+        error = determine_temperature_error(
+            snapshot.target_temperatures[index],
+            snapshot.actual_temperatures[index],
+            snapshot.hvac_mode,
+        )
+        if error is not None and error > 0:
+            yield index, error
+
+
+def determine_setpoint_from_offset(snapshot: HouseSnapshot, offset: float) -> float:
+    """Offset the central temperature towards conditioning, in half degrees."""
+    if snapshot.hvac_mode == HVAC_MODE_COOL:
+        offset = -offset
+    return round((snapshot.central_actual_temperature + offset) * 2) / 2
+
+
+class CentralController(ABC):
+    """Compute the central setpoint for an evaluated plan."""
+
+    @abstractmethod
+    def compute_setpoint(
+        self, snapshot: HouseSnapshot, plan: HousePlan
+    ) -> float | None:
+        """Return the central setpoint, or None to leave it alone."""
+
+
+class SimpleController(CentralController):
+    """Nudge the central setpoint by a fixed amount."""
+
+    def compute_setpoint(
+        self, snapshot: HouseSnapshot, plan: HousePlan
+    ) -> float | None:
+        """Return the central setpoint, or None to leave it alone."""
+        return determine_central_setpoint(snapshot, plan.thermostat_action)
+
+
+class PIDController(CentralController):
+    """Size the setpoint offset from the lagging area's error.
+
+    The integral accumulates in degree-minutes while the house is active and
+    is clamped so it alone cannot exceed the maximum offset.
+    """
+
+    def __init__(self, kp: float, ki: float, kd: float, max_offset: float) -> None:
+        """Initialize the controller."""
+        self.kp = kp
+        self.ki = ki
+        self.kd = kd
+        self.max_offset = max_offset
+        self._integral = 0.0
+        self._last_error: float | None = None
+        self._last_time: datetime | None = None
+        self._last_hvac_mode: str | None = None
+
+    def reset(self) -> None:
+        """Forget the accumulated state."""
+        self._integral = 0.0
+        self._last_error = None
+        self._last_time = None
+
+    def compute_setpoint(
+        self, snapshot: HouseSnapshot, plan: HousePlan
+    ) -> float | None:
+        """Return the central setpoint, or None to leave it alone."""
+        if snapshot.hvac_mode != self._last_hvac_mode:
+            self.reset()
+            self._last_hvac_mode = snapshot.hvac_mode
+        if (
+            not snapshot.control_central_thermostat
+            or snapshot.hvac_mode not in SUPPORTED_HVAC_MODES
+            or plan.thermostat_action == IDLE
+        ):
+            self.reset()
+            return determine_central_setpoint(snapshot, plan.thermostat_action)
+        error = max(
+            (error for _, error in iter_lagging_errors(snapshot, plan)), default=0.0
+        )
+        derivative = 0.0
+        if self._last_time is not None and self._last_error is not None:
+            minutes = (snapshot.now - self._last_time).total_seconds() / 60
+            if minutes > 0:
+                self._integral += error * minutes
+                if self.ki:
+                    self._integral = min(self._integral, self.max_offset / self.ki)
+                derivative = (error - self._last_error) / minutes
+        self._last_error = error
+        self._last_time = snapshot.now
+        offset = self.kp * error + self.ki * self._integral + self.kd * derivative
+        return determine_setpoint_from_offset(
+            snapshot, min(max(offset, MIN_SETPOINT_OFFSET), self.max_offset)
+        )
+
+
+class ModelPredictiveController(CentralController):
+    """Run the system just long enough for the slowest area to be satisfied.
+
+    Each active area's error divided by its heating or cooling rate predicts
+    how long it needs. The central temperature is assumed to move at the
+    average rate of those areas, so the setpoint is the central temperature
+    after the longest of those run times.
+    """
+
+    def __init__(self, zone_rates: ZoneRates | None, max_offset: float) -> None:
+        """Initialize the controller."""
+        self.zone_rates = zone_rates
+        self.max_offset = max_offset
+
+    def _get_rate(self, area: str, hvac_mode: str) -> float:
+        rate = self.zone_rates(area, hvac_mode) if self.zone_rates else None
+        return rate if rate is not None and rate > 0 else DEFAULT_ZONE_RATE
+
+    def compute_setpoint(
+        self, snapshot: HouseSnapshot, plan: HousePlan
+    ) -> float | None:
+        """Return the central setpoint, or None to leave it alone."""
+        if (
+            not snapshot.control_central_thermostat
+            or snapshot.hvac_mode not in SUPPORTED_HVAC_MODES
+            or plan.thermostat_action == IDLE
+        ):
+            return determine_central_setpoint(snapshot, plan.thermostat_action)
+        run_minutes = 0.0
+        rates = []
+        for index, error in iter_lagging_errors(snapshot, plan):
+            rate = self._get_rate(snapshot.areas[index], snapshot.hvac_mode)
+            rates.append(rate)
+            run_minutes = max(run_minutes, error / rate)
+        offset = sum(rates) / len(rates) * run_minutes if rates else 0.0
+        return determine_setpoint_from_offset(
+            snapshot, min(max(offset, MIN_SETPOINT_OFFSET), self.max_offset)
+        )
+
+
+def create_controller(
+    config: HVACZoningConfig, zone_rates: ZoneRates | None = None
+) -> CentralController:
+    """Create the central setpoint controller a configuration asks for."""
+    if config.controller == CONTROLLER_PID:
+        return PIDController(
+            config.pid_kp, config.pid_ki, config.pid_kd, config.max_setpoint_offset
+        )
+    if config.controller == CONTROLLER_MPC:
+        return ModelPredictiveController(zone_rates, config.max_setpoint_offset)
+    return SimpleController()
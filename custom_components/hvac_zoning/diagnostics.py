@@ -0,0 +1,32 @@
+"""Diagnostics support for the HVAC Zoning integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .models import get_runtime_data
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    runtime_data = get_runtime_data(hass, config_entry)
+    diagnostics = {
+        "config_entry_data": dict(config_entry.data),
+        "routed_entities": len(runtime_data.routing_index),
+        "commands_issued": runtime_data.commands_issued,
+        "commands_suppressed": runtime_data.commands_suppressed,
+        "evaluation_requests": sum(
+            system_data.scheduler.requests
+            for system_data in runtime_data.systems.values()
+            if system_data.scheduler is not None
+        ),
+        "stats": runtime_data.stats.as_dict(),
+    }
+    if runtime_data.startup_profile is not None:
+        diagnostics["startup_profile"] = dict(runtime_data.startup_profile.phases)
+    return diagnostics
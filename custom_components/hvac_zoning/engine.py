@@ -0,0 +1,466 @@
+"""Zone decision engine for the HVAC Zoning integration.
+
+The engine is free of Home Assistant I/O: it turns a snapshot of every area
+into a plan of cover services and a central setpoint in one pass.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import math
+
+from homeassistant.const import SERVICE_CLOSE_COVER, SERVICE_OPEN_COVER
+
+from .const import (
+    ACTIVE,
+    HVAC_MODE_COOL,
+    HVAC_MODE_HEAT,
+    IDLE,
+    MIN_OPEN_POSITION,
+    SUPPORTED_HVAC_MODES,
+)
+
+
+def determine_change_in_temperature(
+    actual_temperature: float, hvac_mode: str, action: str
+) -> float:
+    """Determine change in temperature based on HVAC mode and action."""
+    if hvac_mode == HVAC_MODE_HEAT:
+        if action == ACTIVE:
+            return actual_temperature + 2
+        return actual_temperature - 2
+    if hvac_mode == HVAC_MODE_COOL:
+        if action == ACTIVE:
+            return actual_temperature - 2
+        return actual_temperature + 2
+    return actual_temperature
+
+
+@dataclass(frozen=True, slots=True)
+class HouseSnapshot:
+    """Columnar snapshot of all areas, one tuple entry per area."""
+
+    areas: tuple[str, ...]
+    target_temperatures: tuple[float | None, ...]
+    actual_temperatures: tuple[float | None, ...]
+    is_bedrooms: tuple[bool, ...]
+    is_availables: tuple[bool, ...]
+    hystereses: tuple[float, ...]
+    min_dwells: tuple[timedelta, ...]
+    hvac_mode: str
+    central_actual_temperature: float
+    is_night_time_mode: bool
+    is_night_time: bool
+    control_central_thermostat: bool
+    temperature_tolerance: float | None
+    proportional_band: float | None
+    min_open_area: float
+    now: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class HousePlan:
+    """Cover service per area and the central setpoint for a snapshot.
+
+    needs records, per area, whether the area still needs conditioning so a
+    later evaluation of a few areas can recompute the aggregate cheaply.
+    cover_changed_ats records when each area's cover service last changed, and
+    held_untils when an area held by its minimum dwell may change next.
+    cover_positions is only set for proportional vents.
+    """
+
+    cover_services: tuple[str | None, ...]
+    thermostat_action: str
+    central_setpoint: float | None
+    needs: tuple[bool, ...]
+    cover_changed_ats: tuple[datetime | None, ...]
+    held_untils: tuple[datetime | None, ...]
+    cover_positions: tuple[int | None, ...]
+
+
+def determine_need(
+    target_temperature: float | None,
+    actual_temperature: float | None,
+    hvac_mode: str,
+    tolerance: float | None = None,
+) -> bool:
+    """Determine if an area needs conditioning.
+
+    Without a tolerance temperatures are truncated to whole degrees. With one
+    they are compared at full precision, and an area within tolerance of its
+    target is satisfied.
+    """
+    if (
+        target_temperature is None
+        or actual_temperature is None
+        or hvac_mode not in SUPPORTED_HVAC_MODES
+    ):
+        return True
+    if tolerance is None:
+        target_temperature = int(target_temperature)
+        actual_temperature = int(actual_temperature)
+        tolerance = 0
+    if hvac_mode == HVAC_MODE_HEAT:
+        return actual_temperature < target_temperature - tolerance
+    return actual_temperature > target_temperature + tolerance
+
+
+def determine_hysteresis_need(
+    need: bool,
+    previous_need: bool | None,
+    target_temperature: float | None,
+    actual_temperature: float | None,
+    hysteresis: float,
+) -> bool:
+    """Keep an area's previous need until it is hysteresis away from target."""
+    if (
+        previous_need is None
+        or need == previous_need
+        or target_temperature is None
+        or actual_temperature is None
+    ):
+        return need
+    return (
+        need
+        if abs(actual_temperature - target_temperature) >= hysteresis
+        else previous_need
+    )
+
+
+def determine_dwell_cover_service(
+    service: str | None,
+    previous_service: str | None,
+    changed_at: datetime | None,
+    now: datetime,
+    min_dwell: timedelta,
+) -> tuple[str | None, datetime | None, datetime | None]:
+    """Hold an area's cover service until it has dwelled for min_dwell.
+
+    Returns the service, when it last changed, and until when it is held.
+    """
+    if service is None or previous_service is None or service == previous_service:
+        return service, changed_at, None
+    if changed_at is not None and now - changed_at < min_dwell:
+        return previous_service, changed_at, changed_at + min_dwell
+    return service, now, None
+
+
+def release_dwell_holds(
+    covers: list[tuple[str | None, datetime | None, datetime | None]],
+    needs: Sequence[bool],
+    is_bedrooms: Sequence[bool],
+    is_night: bool,
+    now: datetime,
+) -> list[tuple[str | None, datetime | None, datetime | None]]:
+    """Open areas held closed by their minimum dwell if no vent is open.
+
+    Only called while the house is active: the held areas that need
+    conditioning open so the running system is never left with every vent
+    closed.
+    """
+    if any(service == SERVICE_OPEN_COVER for service, _, _ in covers):
+        return covers
+    return [
+        (SERVICE_OPEN_COVER, now, None)
+        if held_until is not None and need and (is_bedroom or not is_night)
+        else (service, changed_at, held_until)
+        for (service, changed_at, held_until), need, is_bedroom in zip(
+            covers, needs, is_bedrooms, strict=True
+        )
+    ]
+
+
+def determine_zone_cover_service(
+    need: bool, is_bedroom: bool, is_available: bool, is_night: bool, keep_open: bool
+) -> str | None:
+    """Determine the cover service for one area of a house."""
+    if not is_available:
+        return None
+    return (
+        SERVICE_OPEN_COVER
+        if (is_bedroom if is_night else keep_open or need)
+        else SERVICE_CLOSE_COVER
+    )
+
+
+def determine_temperature_error(
+    target_temperature: float | None, actual_temperature: float | None, hvac_mode: str
+) -> float | None:
+    """Determine how far an area is from its target in the conditioning direction."""
+    if target_temperature is None or actual_temperature is None:
+        return None
+    if hvac_mode == HVAC_MODE_HEAT:
+        return target_temperature - actual_temperature
+    if hvac_mode == HVAC_MODE_COOL:
+        return actual_temperature - target_temperature
+    return None
+
+
+def determine_proportional_position(
+    error: float | None, proportional_band: float
+) -> int:
+    """Determine the opening of a vent proportional to its area's error.
+
+    A vent opens fully at proportional_band degrees of error, and never less
+    than MIN_OPEN_POSITION while its area needs conditioning.
+    """
+    if error is None:
+        return 100
+    return min(max(math.ceil(error / proportional_band * 100), MIN_OPEN_POSITION), 100)
+
+
+def enforce_min_open_area(
+    positions: tuple[int | None, ...], min_open_area: float
+) -> tuple[int | None, ...]:
+    """Open the most closed vents until min_open_area percent of all is open.
+
+    Vents below a common level are raised to it, so the extra airflow goes to
+    the vents that were closed the most.
+    """
+    available = sorted(position for position in positions if position is not None)
+    required = min_open_area * len(available)
+    if not available or sum(available) >= required:
+        return positions
+    remaining = sum(available)
+    level = 100
+    for count, position in enumerate(available):
+        remaining -= position
+        level = math.ceil((required - remaining) / (count + 1))
+        if count + 1 == len(available) or level <= available[count + 1]:
+            break
+    return tuple(
+        None if position is None else max(position, min(level, 100))
+        for position in positions
+    )
+
+
+def determine_cover_positions(
+    snapshot: HouseSnapshot,
+    cover_services: Sequence[str | None],
+    needs: Sequence[bool],
+    is_active: bool,
+) -> tuple[int | None, ...]:
+    """Determine the position of proportional vents for a house.
+
+    Open vents of areas that need conditioning open in proportion to their
+    error; other open vents open fully and closed vents close. The result
+    then keeps min_open_area percent of the house open.
+    """
+    proportional_band = snapshot.proportional_band
+    if proportional_band is None:
+        return (None,) * len(cover_services)
+    is_proportional = is_active and not (
+        snapshot.is_night_time_mode and snapshot.is_night_time
+    )
+    positions = tuple(
+        None
+        if service is None
+        else 0
+        if service == SERVICE_CLOSE_COVER
+        else determine_proportional_position(
+            determine_temperature_error(target, actual, snapshot.hvac_mode),
+            proportional_band,
+        )
+        if is_proportional and need
+        else 100
+        for service, need, target, actual in zip(
+            cover_services,
+            needs,
+            snapshot.target_temperatures,
+            snapshot.actual_temperatures,
+            strict=True,
+        )
+    )
+    return enforce_min_open_area(positions, snapshot.min_open_area)
+
+
+def has_same_house_inputs(snapshot: HouseSnapshot, previous: HouseSnapshot) -> bool:
+    """Determine if two snapshots agree on every input of the cover services.
+
+    The central actual temperature only feeds the central setpoint, so it may
+    differ.
+    """
+    return (
+        snapshot.areas == previous.areas
+        and snapshot.hvac_mode == previous.hvac_mode
+        and snapshot.is_night_time_mode == previous.is_night_time_mode
+        and snapshot.is_night_time == previous.is_night_time
+        and snapshot.control_central_thermostat == previous.control_central_thermostat
+    )
+
+
+def determine_central_setpoint(
+    snapshot: HouseSnapshot, thermostat_action: str
+) -> float | None:
+    """Determine the central setpoint for a snapshot and thermostat action."""
+    if not snapshot.control_central_thermostat:
+        return None
+    return determine_change_in_temperature(
+        snapshot.central_actual_temperature, snapshot.hvac_mode, thermostat_action
+    )
+
+
+def determine_zone_need(
+    snapshot: HouseSnapshot, index: int, previous_needs: tuple[bool, ...] | None
+) -> bool:
+    """Determine if the area at index needs conditioning, with hysteresis."""
+    target_temperature = snapshot.target_temperatures[index]
+    actual_temperature = snapshot.actual_temperatures[index]
+    return determine_hysteresis_need(
+        determine_need(
+            target_temperature,
+            actual_temperature,
+            snapshot.hvac_mode,
+            snapshot.temperature_tolerance,
+        ),
+        previous_needs[index] if previous_needs is not None else None,
+        target_temperature,
+        actual_temperature,
+        snapshot.hystereses[index],
+    )
+
+
+def determine_zone_cover(
+    snapshot: HouseSnapshot,
+    index: int,
+    need: bool,
+    keep_open: bool,
+    previous_plan: HousePlan | None,
+) -> tuple[str | None, datetime | None, datetime | None]:
+    """Determine the cover service of the area at index, with minimum dwell."""
+    service = determine_zone_cover_service(
+        need,
+        snapshot.is_bedrooms[index],
+        snapshot.is_availables[index],
+        snapshot.is_night_time_mode and snapshot.is_night_time,
+        keep_open,
+    )
+    if previous_plan is None:
+        return service, None, None
+    return determine_dwell_cover_service(
+        service,
+        previous_plan.cover_services[index],
+        previous_plan.cover_changed_ats[index],
+        snapshot.now,
+        snapshot.min_dwells[index],
+    )
+
+
+def evaluate_house(
+    snapshot: HouseSnapshot,
+    previous_snapshot: HouseSnapshot | None = None,
+    previous_plan: HousePlan | None = None,
+) -> HousePlan:
+    """Evaluate a house snapshot into a plan.
+
+    Unavailable areas get no cover service but still count as needing
+    conditioning, matching determine_need for missing temperatures. With a
+    previous plan for the same areas, its needs apply hysteresis if the HVAC
+    mode is unchanged and its cover services apply the minimum dwell, which
+    never holds every vent closed while the house is active.
+    """
+    if previous_snapshot is None or previous_snapshot.areas != snapshot.areas:
+        previous_plan = None
+    previous_needs = (
+        previous_plan.needs
+        if previous_plan is not None
+        and previous_snapshot is not None
+        and previous_snapshot.hvac_mode == snapshot.hvac_mode
+        else None
+    )
+    is_night = snapshot.is_night_time_mode and snapshot.is_night_time
+    indexes = range(len(snapshot.areas))
+    needs = tuple(
+        determine_zone_need(snapshot, index, previous_needs) for index in indexes
+    )
+    is_active = any(
+        need and (is_bedroom or not is_night)
+        for need, is_bedroom in zip(needs, snapshot.is_bedrooms, strict=True)
+    )
+    keep_open = not is_active and snapshot.control_central_thermostat
+    covers = [
+        determine_zone_cover(snapshot, index, needs[index], keep_open, previous_plan)
+        for index in indexes
+    ]
+    if is_active:
+        covers = release_dwell_holds(
+            covers, needs, snapshot.is_bedrooms, is_night, snapshot.now
+        )
+    thermostat_action = ACTIVE if is_active else IDLE
+    cover_services = tuple(service for service, _, _ in covers)
+    return HousePlan(
+        cover_services,
+        thermostat_action,
+        determine_central_setpoint(snapshot, thermostat_action),
+        needs,
+        tuple(changed_at for _, changed_at, _ in covers),
+        tuple(held_until for _, _, held_until in covers),
+        determine_cover_positions(snapshot, cover_services, needs, is_active),
+    )
+
+
+def evaluate_zones(
+    snapshot: HouseSnapshot,
+    indexes: Iterable[int],
+    previous_snapshot: HouseSnapshot,
+    previous_plan: HousePlan,
+) -> HousePlan:
+    """Re-evaluate the areas at indexes, reusing the plan for all others.
+
+    Only the given areas and the central actual temperature may differ from
+    the previous snapshot. The result equals a full evaluate_house, except
+    that areas held by their minimum dwell stay held until re-evaluated; a
+    full evaluation runs when house-wide inputs changed or the aggregate
+    thermostat action flips. Without indexes only the central setpoint is
+    recomputed. Proportional vent positions depend on every area through the
+    minimum open area, so they are always recomputed for the whole house.
+    """
+    if not has_same_house_inputs(snapshot, previous_snapshot):
+        return evaluate_house(snapshot, previous_snapshot, previous_plan)
+    needs = list(previous_plan.needs)
+    for index in indexes:
+        needs[index] = determine_zone_need(snapshot, index, previous_plan.needs)
+    is_night = snapshot.is_night_time_mode and snapshot.is_night_time
+    is_active = any(
+        need and (is_bedroom or not is_night)
+        for need, is_bedroom in zip(needs, snapshot.is_bedrooms, strict=True)
+    )
+    if (ACTIVE if is_active else IDLE) != previous_plan.thermostat_action:
+        return evaluate_house(snapshot, previous_snapshot, previous_plan)
+    keep_open = not is_active and snapshot.control_central_thermostat
+    covers = list(
+        zip(
+            previous_plan.cover_services,
+            previous_plan.cover_changed_ats,
+            previous_plan.held_untils,
+            strict=True,
+        )
+    )
+    for index in indexes:
+        covers[index] = determine_zone_cover(
+            snapshot, index, needs[index], keep_open, previous_plan
+        )
+    if is_active:
+        covers = release_dwell_holds(
+            covers, needs, snapshot.is_bedrooms, is_night, snapshot.now
+        )
+    cover_services = tuple(service for service, _, _ in covers)
+    central_setpoint = (
+        previous_plan.central_setpoint
+        if snapshot.central_actual_temperature
+        == previous_snapshot.central_actual_temperature
+        else determine_central_setpoint(snapshot, previous_plan.thermostat_action)
+    )
+    return HousePlan(
+        cover_services,
+        previous_plan.thermostat_action,
+        central_setpoint,
+        tuple(needs),
+        tuple(changed_at for _, changed_at, _ in covers),
+        tuple(held_until for _, _, held_until in covers),
+        determine_cover_positions(snapshot, cover_services, needs, is_active)
+        if snapshot.proportional_band is not None
+        else previous_plan.cover_positions,
+    )
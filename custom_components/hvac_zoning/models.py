@@ -0,0 +1,403 @@
+"""Models for the HVAC Zoning integration."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field, fields
+from datetime import datetime, time, timedelta
+import math
+from time import perf_counter
+from types import MappingProxyType
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+from .const import (
+    CONF_CENTRAL_THERMOSTAT,
+    CONF_CONTROLLER,
+    CONF_EVALUATION_MAX_LATENCY,
+    CONF_EVALUATION_WINDOW,
+    CONF_HYSTERESIS,
+    CONF_MAX_SETPOINT_OFFSET,
+    CONF_MIN_DWELL,
+    CONF_MIN_OPEN_AREA,
+    CONF_PID_KD,
+    CONF_PID_KI,
+    CONF_PID_KP,
+    CONF_POSITION_STEP,
+    CONF_PROFILE_STARTUP,
+    CONF_PROPORTIONAL_BAND,
+    CONF_TEMPERATURE_COMPARISON,
+    CONF_TEMPERATURE_DEADBAND,
+    CONF_TEMPERATURE_TOLERANCE,
+    CONF_VENT_MODE,
+    DEFAULT_CONTROLLER,
+    DEFAULT_EVALUATION_MAX_LATENCY,
+    DEFAULT_EVALUATION_WINDOW,
+    DEFAULT_HYSTERESIS,
+    DEFAULT_MAX_SETPOINT_OFFSET,
+    DEFAULT_MIN_DWELL,
+    DEFAULT_MIN_OPEN_AREA,
+    DEFAULT_PID_KD,
+    DEFAULT_PID_KI,
+    DEFAULT_PID_KP,
+    DEFAULT_POSITION_STEP,
+    DEFAULT_PROFILE_STARTUP,
+    DEFAULT_PROPORTIONAL_BAND,
+    DEFAULT_TEMPERATURE_COMPARISON,
+    DEFAULT_TEMPERATURE_DEADBAND,
+    DEFAULT_TEMPERATURE_TOLERANCE,
+    DEFAULT_VENT_MODE,
+    DOMAIN,
+    EVALUATION_LATENCY_SAMPLES,
+    TEMPERATURE_COMPARISON_PRECISE,
+    VENT_MODE_PROPORTIONAL,
+)
+from .controller import CentralController
+from .engine import HousePlan, HouseSnapshot
+from .scheduler import AdjustmentScheduler
+from .state import ControllerState, SystemState
+from .thermal import ThermalModel
+from .utils import (
+    determine_if_night_time_mode,
+    filter_to_valid_areas,
+    get_all_thermostat_entity_ids,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class AreaConfig:
+    """Configuration of a single area."""
+
+    name: str
+    covers: tuple[str, ...]
+    connectivities: tuple[str, ...]
+    temperature: str | None
+    climate: str | None
+    bedroom: bool
+    hysteresis: float
+    min_dwell: timedelta
+    central_thermostat: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class HVACSystemConfig:
+    """Configuration of an HVAC system: a central thermostat and its areas."""
+
+    central_thermostat_entity_id: str
+    valid_areas: tuple[AreaConfig, ...]
+    valid_area_indexes: Mapping[str, int]
+
+    @classmethod
+    def from_areas(
+        cls, central_thermostat_entity_id: str, valid_areas: Iterable[AreaConfig]
+    ) -> HVACSystemConfig:
+        """Create a system from the valid areas it conditions."""
+        valid_areas = tuple(valid_areas)
+        return cls(
+            central_thermostat_entity_id=central_thermostat_entity_id,
+            valid_areas=valid_areas,
+            valid_area_indexes=MappingProxyType(
+                {area.name: index for index, area in enumerate(valid_areas)}
+            ),
+        )
+
+
+AREA_CONFIG_FIELDS = frozenset(
+    {
+        "areas",
+        "valid_areas",
+        "valid_area_indexes",
+        "systems",
+        "area_systems",
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
+class HVACZoningConfig:
+    """Configuration of a config entry, parsed once per load or update."""
+
+    areas: Mapping[str, AreaConfig]
+    valid_areas: tuple[AreaConfig, ...]
+    valid_area_indexes: Mapping[str, int]
+    systems: Mapping[str, HVACSystemConfig]
+    area_systems: Mapping[str, str]
+    bed_time: time
+    wake_time: time
+    is_night_time_mode: bool
+    control_central_thermostat: bool
+    evaluation_window: float
+    evaluation_max_latency: float
+    temperature_deadband: float
+    temperature_tolerance: float | None
+    proportional_band: float | None
+    min_open_area: float
+    position_step: int
+    controller: str
+    pid_kp: float
+    pid_ki: float
+    pid_kd: float
+    max_setpoint_offset: float
+    profile_startup: bool
+
+    @classmethod
+    def from_config_entry_data(
+        cls, config_entry_data: Mapping[str, Any]
+    ) -> HVACZoningConfig:
+        """Parse config entry data into a configuration."""
+        areas = MappingProxyType(
+            {
+                name: AreaConfig(
+                    name=name,
+                    covers=tuple(area.get("covers", ())),
+                    connectivities=tuple(area.get("connectivities", ())),
+                    temperature=area.get("temperature"),
+                    climate=area.get("climate"),
+                    bedroom=area.get("bedroom", False),
+                    hysteresis=area.get(CONF_HYSTERESIS, DEFAULT_HYSTERESIS),
+                    min_dwell=timedelta(
+                        seconds=area.get(CONF_MIN_DWELL, DEFAULT_MIN_DWELL)
+                    ),
+                    central_thermostat=area.get(CONF_CENTRAL_THERMOSTAT),
+                )
+                for name, area in config_entry_data.get("areas", {}).items()
+            }
+        )
+        valid_areas = filter_to_valid_areas(config_entry_data)["areas"]
+        thermostat_entity_ids = get_all_thermostat_entity_ids(config_entry_data)
+        central_thermostat_entity_id = (
+            thermostat_entity_ids[0] if thermostat_entity_ids else None
+        )
+        # Areas are conditioned by the first central thermostat unless they
+        # are mapped to another configured one.
+        area_systems = {
+            name: central_thermostat
+            if (central_thermostat := areas[name].central_thermostat)
+            in thermostat_entity_ids
+            else central_thermostat_entity_id
+            for name in valid_areas
+            if central_thermostat_entity_id is not None
+        }
+        system_entity_ids = dict.fromkeys(
+            (
+                *(
+                    [central_thermostat_entity_id]
+                    if central_thermostat_entity_id
+                    else []
+                ),
+                *area_systems.values(),
+            )
+        )
+        return cls(
+            areas=areas,
+            valid_areas=tuple(areas[name] for name in valid_areas),
+            valid_area_indexes=MappingProxyType(
+                {name: index for index, name in enumerate(valid_areas)}
+            ),
+            systems=MappingProxyType(
+                {
+                    entity_id: HVACSystemConfig.from_areas(
+                        entity_id,
+                        (
+                            areas[name]
+                            for name, system in area_systems.items()
+                            if system == entity_id
+                        ),
+                    )
+                    for entity_id in system_entity_ids
+                }
+            ),
+            area_systems=MappingProxyType(area_systems),
+            bed_time=time.fromisoformat(config_entry_data["bed_time"]),
+            wake_time=time.fromisoformat(config_entry_data["wake_time"]),
+            is_night_time_mode=determine_if_night_time_mode(valid_areas),
+            control_central_thermostat=config_entry_data.get(
+                "control_central_thermostat", False
+            ),
+            evaluation_window=config_entry_data.get(
+                CONF_EVALUATION_WINDOW, DEFAULT_EVALUATION_WINDOW
+            ),
+            evaluation_max_latency=config_entry_data.get(
+                CONF_EVALUATION_MAX_LATENCY, DEFAULT_EVALUATION_MAX_LATENCY
+            ),
+            temperature_deadband=config_entry_data.get(
+                CONF_TEMPERATURE_DEADBAND, DEFAULT_TEMPERATURE_DEADBAND
+            ),
+            temperature_tolerance=(
+                config_entry_data.get(
+                    CONF_TEMPERATURE_TOLERANCE, DEFAULT_TEMPERATURE_TOLERANCE
+                )
+                if config_entry_data.get(
+                    CONF_TEMPERATURE_COMPARISON, DEFAULT_TEMPERATURE_COMPARISON
+                )
+                == TEMPERATURE_COMPARISON_PRECISE
+                else None
+            ),
+            proportional_band=(
+                config_entry_data.get(CONF_PROPORTIONAL_BAND, DEFAULT_PROPORTIONAL_BAND)
+                if config_entry_data.get(CONF_VENT_MODE, DEFAULT_VENT_MODE)
+                == VENT_MODE_PROPORTIONAL
+                else None
+            ),
+            min_open_area=config_entry_data.get(
+                CONF_MIN_OPEN_AREA, DEFAULT_MIN_OPEN_AREA
+            ),
+            position_step=config_entry_data.get(
+                CONF_POSITION_STEP, DEFAULT_POSITION_STEP
+            ),
+            controller=config_entry_data.get(CONF_CONTROLLER, DEFAULT_CONTROLLER),
+            pid_kp=config_entry_data.get(CONF_PID_KP, DEFAULT_PID_KP),
+            pid_ki=config_entry_data.get(CONF_PID_KI, DEFAULT_PID_KI),
+            pid_kd=config_entry_data.get(CONF_PID_KD, DEFAULT_PID_KD),
+            max_setpoint_offset=config_entry_data.get(
+                CONF_MAX_SETPOINT_OFFSET, DEFAULT_MAX_SETPOINT_OFFSET
+            ),
+            profile_startup=config_entry_data.get(
+                CONF_PROFILE_STARTUP, DEFAULT_PROFILE_STARTUP
+            ),
+        )
+
+    def has_same_settings(self, other: HVACZoningConfig) -> bool:
+        """Return whether the settings shared by every area are unchanged."""
+        return all(
+            getattr(self, config_field.name) == getattr(other, config_field.name)
+            for config_field in fields(self)
+            if config_field.name not in AREA_CONFIG_FIELDS
+        )
+
+
+def determine_changed_areas(
+    previous_config: HVACZoningConfig, config: HVACZoningConfig
+) -> frozenset[str]:
+    """Return the areas whose configuration or HVAC system changed."""
+    return frozenset(
+        name
+        for name in (*previous_config.areas, *config.areas)
+        if previous_config.areas.get(name) != config.areas.get(name)
+        or previous_config.area_systems.get(name) != config.area_systems.get(name)
+    )
+
+
+@dataclass(slots=True)
+class HVACZoningStats:
+    """Instrumentation counters for a config entry.
+
+    Counters are plain increments on the hot path; percentiles are only
+    computed when read.
+    """
+
+    events_received: int = 0
+    events_routed: int = 0
+    evaluations: int = 0
+    evaluations_by_trigger: dict[str, int] = field(default_factory=dict)
+    service_calls: int = 0
+    evaluation_latencies: deque[float] = field(
+        default_factory=lambda: deque(maxlen=EVALUATION_LATENCY_SAMPLES)
+    )
+
+    def record_evaluation(self, triggers: Iterable[str], latency: float) -> None:
+        """Record an evaluation, counting it once for each coalesced trigger."""
+        self.evaluations += 1
+        for trigger in triggers:
+            self.evaluations_by_trigger[trigger] = (
+                self.evaluations_by_trigger.get(trigger, 0) + 1
+            )
+        self.evaluation_latencies.append(latency)
+
+    def latency_percentile(self, percentile: float) -> float | None:
+        """Return a nearest-rank percentile of recent latencies in seconds."""
+        if not self.evaluation_latencies:
+            return None
+        latencies = sorted(self.evaluation_latencies)
+        rank = max(math.ceil(percentile / 100 * len(latencies)), 1)
+        return latencies[rank - 1]
+
+    @property
+    def service_calls_per_evaluation(self) -> float | None:
+        """Return the average number of service calls per evaluation."""
+        if not self.evaluations:
+            return None
+        return self.service_calls / self.evaluations
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters and derived values as a dictionary."""
+        return {
+            "events_received": self.events_received,
+            "events_routed": self.events_routed,
+            "evaluations": self.evaluations,
+            "evaluations_by_trigger": dict(self.evaluations_by_trigger),
+            "service_calls": self.service_calls,
+            "service_calls_per_evaluation": self.service_calls_per_evaluation,
+            "evaluation_latency_p50": self.latency_percentile(50),
+            "evaluation_latency_p95": self.latency_percentile(95),
+        }
+
+
+@dataclass(slots=True)
+class StartupProfile:
+    """Seconds from the start of setup to the end of each startup phase."""
+
+    started_at: float = field(default_factory=perf_counter)
+    phases: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class HVACSystemData:
+    """Runtime data for one HVAC system of a config entry."""
+
+    central_setpoint_command: tuple[float, datetime] | None = None
+    scheduler: AdjustmentScheduler | None = None
+    controller: CentralController | None = None
+    last_snapshot: HouseSnapshot | None = None
+    last_plan: HousePlan | None = None
+    cancel_dwell_timer: CALLBACK_TYPE | None = None
+    saved_state: SystemState | None = None
+    pending_triggers: set[str] = field(default_factory=set)
+
+
+@dataclass(slots=True)
+class HVACZoningData:
+    """Runtime data for a config entry."""
+
+    config: HVACZoningConfig | None = None
+    routing_index: Mapping[str, tuple[str, str]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    area_thermostat_entity_ids: dict[str, str | None] = field(default_factory=dict)
+    cover_commands: dict[str, tuple[str, datetime]] = field(default_factory=dict)
+    systems: dict[str, HVACSystemData] = field(default_factory=dict)
+    commands_issued: int = 0
+    commands_suppressed: int = 0
+    thermal_model: ThermalModel | None = None
+    controller_state: ControllerState | None = None
+    stats: HVACZoningStats = field(default_factory=HVACZoningStats)
+    startup_profile: StartupProfile | None = None
+
+
+def get_runtime_data(hass: HomeAssistant, config_entry: ConfigEntry) -> HVACZoningData:
+    """Get runtime data for a config entry."""
+    entries = hass.data.setdefault(DOMAIN, {})
+    if (runtime_data := entries.get(config_entry.entry_id)) is None:
+        runtime_data = entries[config_entry.entry_id] = HVACZoningData()
+    return runtime_data
+
+
+def get_system_data(
+    hass: HomeAssistant, config_entry: ConfigEntry, central_thermostat_entity_id: str
+) -> HVACSystemData:
+    """Get runtime data for the HVAC system of a central thermostat."""
+    systems = get_runtime_data(hass, config_entry).systems
+    if (system_data := systems.get(central_thermostat_entity_id)) is None:
+        system_data = systems[central_thermostat_entity_id] = HVACSystemData()
+    return system_data
+
+
+def get_config(hass: HomeAssistant, config_entry: ConfigEntry) -> HVACZoningConfig:
+    """Get the parsed configuration of a config entry, parsing it if needed."""
+    runtime_data = get_runtime_data(hass, config_entry)
+    if runtime_data.config is None:
+        runtime_data.config = HVACZoningConfig.from_config_entry_data(config_entry.data)
+    return runtime_data.config
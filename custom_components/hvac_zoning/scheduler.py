@@ -0,0 +1,121 @@
+"""Adjustment scheduler for the HVAC Zoning integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from datetime import datetime
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+
+class AdjustmentScheduler:
+    """Coalesce adjustment requests into a single evaluation.
+
+    Requests arriving within the window of each other are merged into one
+    evaluation. The window is reset by every request but never pushed past
+    max_latency from the first pending request, so a continuous stream of
+    requests cannot starve the evaluation. Only one evaluation runs at a time;
+    requests made while it runs are evaluated once it finishes.
+
+    A request may be limited to some zones. Merged requests evaluate the union
+    of their zones, and any whole-house request makes the evaluation
+    whole-house, which the function receives as zones of None.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        window: float,
+        max_latency: float,
+        function: Callable[
+            [frozenset[str], frozenset[str] | None], Coroutine[Any, Any, None]
+        ],
+    ) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._config_entry = config_entry
+        self.window = window
+        self.max_latency = max_latency
+        self._function = function
+        self._forced_areas: set[str] = set()
+        self._zones: set[str] = set()
+        self._is_whole_house = False
+        self._first_request_at: float | None = None
+        self._is_due = False
+        self._cancel_timer: CALLBACK_TYPE | None = None
+        self._task: asyncio.Task[None] | None = None
+        self.requests = 0
+        self.evaluations = 0
+
+    @callback
+    def async_request(
+        self,
+        forced_areas: set[str] | frozenset[str] = frozenset(),
+        immediate: bool = False,
+        zones: set[str] | frozenset[str] | None = None,
+    ) -> None:
+        """Request an evaluation, optionally bypassing the window."""
+        self.requests += 1
+        self._forced_areas.update(forced_areas)
+        if zones is None:
+            self._is_whole_house = True
+        else:
+            self._zones.update(zones)
+        now = self._hass.loop.time()
+        if self._first_request_at is None:
+            self._first_request_at = now
+        self._async_cancel_timer()
+        delay = min(self.window, self._first_request_at + self.max_latency - now)
+        if immediate or delay <= 0:
+            self._async_start()
+            return
+        self._cancel_timer = async_call_later(self._hass, delay, self._async_fire)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel any pending evaluation."""
+        self._async_cancel_timer()
+        self._first_request_at = None
+        self._forced_areas.clear()
+        self._zones.clear()
+        self._is_whole_house = False
+        self._is_due = False
+
+    @callback
+    def _async_cancel_timer(self) -> None:
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+            self._cancel_timer = None
+
+    @callback
+    def _async_fire(self, _now: datetime) -> None:
+        self._cancel_timer = None
+        self._async_start()
+
+    @callback
+    def _async_start(self) -> None:
+        self._is_due = True
+        if self._task is None:
+            self._task = self._config_entry.async_create_task(
+                self._hass, self._async_run(), "adjust_house", eager_start=False
+            )
+
+    async def _async_run(self) -> None:
+        try:
+            while self._is_due:
+                self._is_due = False
+                self._first_request_at = None
+                forced_areas = frozenset(self._forced_areas)
+                self._forced_areas.clear()
+                zones = None if self._is_whole_house else frozenset(self._zones)
+                self._zones.clear()
+                self._is_whole_house = False
+                self.evaluations += 1
+                await self._function(forced_areas, zones)
+        finally:
+            self._task = None
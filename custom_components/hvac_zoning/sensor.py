@@ -0,0 +1,149 @@
+"""Diagnostic sensors for the HVAC Zoning integration."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
+
+from .const import (
+    SIGNAL_STATS_UPDATED,
+    TRIGGER_CONNECTIVITY,
+    TRIGGER_TEMPERATURE,
+    TRIGGER_THERMOSTAT,
+)
+from .models import HVACZoningStats, get_runtime_data
+
+
+def latency_in_milliseconds(stats: HVACZoningStats, percentile: float) -> StateType:
+    """Return a latency percentile in milliseconds."""
+    latency = stats.latency_percentile(percentile)
+    return None if latency is None else round(latency * 1000, 3)
+
+
+@dataclass(frozen=True, kw_only=True)
+class HVACZoningSensorEntityDescription(SensorEntityDescription):
+    """Describes an HVAC Zoning diagnostic sensor."""
+
+    value_fn: Callable[[HVACZoningStats], StateType]
+
+
+SENSOR_DESCRIPTIONS: tuple[HVACZoningSensorEntityDescription, ...] = (
+    HVACZoningSensorEntityDescription(
+        key="thermostat_evaluations",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: stats.evaluations_by_trigger.get(TRIGGER_THERMOSTAT, 0),
+    ),
+    HVACZoningSensorEntityDescription(
+        key="connectivity_evaluations",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: stats.evaluations_by_trigger.get(
+            TRIGGER_CONNECTIVITY, 0
+        ),
+    ),
+    HVACZoningSensorEntityDescription(
+        key="temperature_evaluations",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: stats.evaluations_by_trigger.get(TRIGGER_TEMPERATURE, 0),
+    ),
+    HVACZoningSensorEntityDescription(
+        key="evaluation_latency_p50",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: latency_in_milliseconds(stats, 50),
+    ),
+    HVACZoningSensorEntityDescription(
+        key="evaluation_latency_p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: latency_in_milliseconds(stats, 95),
+    ),
+    HVACZoningSensorEntityDescription(
+        key="service_calls_per_evaluation",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: stats.service_calls_per_evaluation,
+    ),
+    HVACZoningSensorEntityDescription(
+        key="events_received",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: stats.events_received,
+    ),
+    HVACZoningSensorEntityDescription(
+        key="events_routed",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: stats.events_routed,
+    ),
+)
+
+
+class HVACZoningSensor(SensorEntity):
+    """Diagnostic sensor for HVAC Zoning instrumentation.
+
+    The state is pushed after each evaluation rather than polled, so the
+    sensors cost nothing while the house is idle.
+    """
+
+    entity_description: HVACZoningSensorEntityDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        config_entry: ConfigEntry,
+        stats: HVACZoningStats,
+        description: HVACZoningSensorEntityDescription,
+    ) -> None:
+        """Sensor init."""
+        self.entity_description = description
+        self._config_entry = config_entry
+        self._stats = stats
+        self._attr_unique_id = f"hvac_zoning_{description.key}"
+        self._attr_name = f"hvac_zoning_{description.key}"
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the value of the sensor."""
+        return self.entity_description.value_fn(self._stats)
+
+    async def async_added_to_hass(self) -> None:
+        """Run when entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_STATS_UPDATED.format(self._config_entry.entry_id),
+                self._async_handle_stats_updated,
+            )
+        )
+
+    @callback
+    def _async_handle_stats_updated(self) -> None:
+        self.async_write_ha_state()
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Async setup entry."""
+
+    stats = get_runtime_data(hass, config_entry).stats
+    async_add_entities(
+        HVACZoningSensor(config_entry, stats, description)
+        for description in SENSOR_DESCRIPTIONS
+    )
@@ -0,0 +1,227 @@
+"""Persisted controller state for the HVAC Zoning integration.
+
+The last command sent to every cover and central thermostat, and the cover
+decision of every area, are saved so a restart resumes where the integration
+left off: commands still within their retry interval are not sent again, and
+areas held by their minimum dwell stay held.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
+
+from .const import (
+    CONTROLLER_STATE_SAVE_DELAY,
+    CONTROLLER_STATE_STORAGE_KEY,
+    CONTROLLER_STATE_STORAGE_VERSION,
+)
+from .engine import HousePlan, HouseSnapshot
+
+if TYPE_CHECKING:
+    from .models import HVACZoningData
+
+
+def format_datetime(value: datetime | None) -> str | None:
+    """Format an optional datetime for storage."""
+    return value.isoformat() if value is not None else None
+
+
+def parse_datetime(value: str | None) -> datetime | None:
+    """Parse an optional stored datetime."""
+    return dt_util.parse_datetime(value) if value is not None else None
+
+
+@dataclass(frozen=True, slots=True)
+class AreaState:
+    """Cover decision of an area when the state was saved."""
+
+    cover_service: str | None
+    cover_changed_at: datetime | None
+    need: bool
+
+
+@dataclass(frozen=True, slots=True)
+class SystemState:
+    """Commands and decisions of an HVAC system when the state was saved."""
+
+    central_setpoint_command: tuple[float, datetime] | None
+    hvac_mode: str | None
+    thermostat_action: str | None
+    areas: Mapping[str, AreaState]
+
+    @classmethod
+    def from_evaluation(
+        cls,
+        central_setpoint_command: tuple[float, datetime] | None,
+        snapshot: HouseSnapshot | None,
+        plan: HousePlan | None,
+    ) -> SystemState:
+        """Capture the state of a system from its last evaluation."""
+        if snapshot is None or plan is None:
+            return cls(central_setpoint_command, None, None, {})
+        return cls(
+            central_setpoint_command=central_setpoint_command,
+            hvac_mode=snapshot.hvac_mode,
+            thermostat_action=plan.thermostat_action,
+            areas={
+                area: AreaState(cover_service, cover_changed_at, need)
+                for area, cover_service, cover_changed_at, need in zip(
+                    snapshot.areas,
+                    plan.cover_services,
+                    plan.cover_changed_ats,
+                    plan.needs,
+                    strict=True,
+                )
+            },
+        )
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> SystemState:
+        """Parse a stored system state."""
+        central_setpoint_command = data.get("central_setpoint_command")
+        return cls(
+            central_setpoint_command=(
+                central_setpoint_command[0],
+                parse_datetime(central_setpoint_command[1]),
+            )
+            if central_setpoint_command is not None
+            else None,
+            hvac_mode=data.get("hvac_mode"),
+            thermostat_action=data.get("thermostat_action"),
+            areas={
+                area: AreaState(
+                    area_state["cover_service"],
+                    parse_datetime(area_state["cover_changed_at"]),
+                    area_state["need"],
+                )
+                for area, area_state in data.get("areas", {}).items()
+            },
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state for storage."""
+        return {
+            "central_setpoint_command": [
+                self.central_setpoint_command[0],
+                format_datetime(self.central_setpoint_command[1]),
+            ]
+            if self.central_setpoint_command is not None
+            else None,
+            "hvac_mode": self.hvac_mode,
+            "thermostat_action": self.thermostat_action,
+            "areas": {
+                area: {
+                    "cover_service": area_state.cover_service,
+                    "cover_changed_at": format_datetime(area_state.cover_changed_at),
+                    "need": area_state.need,
+                }
+                for area, area_state in self.areas.items()
+            },
+        }
+
+    def as_previous_evaluation(
+        self, snapshot: HouseSnapshot
+    ) -> tuple[HouseSnapshot, HousePlan] | None:
+        """Return the saved decisions as the evaluation preceding a snapshot.
+
+        Returns None unless every area of the snapshot has a saved decision.
+        """
+        if (
+            self.hvac_mode is None
+            or self.thermostat_action is None
+            or any(area not in self.areas for area in snapshot.areas)
+        ):
+            return None
+        area_states = [self.areas[area] for area in snapshot.areas]
+        return (
+            replace(snapshot, hvac_mode=self.hvac_mode),
+            HousePlan(
+                cover_services=tuple(state.cover_service for state in area_states),
+                thermostat_action=self.thermostat_action,
+                central_setpoint=None,
+                needs=tuple(state.need for state in area_states),
+                cover_changed_ats=tuple(
+                    state.cover_changed_at for state in area_states
+                ),
+                held_untils=(None,) * len(area_states),
+                cover_positions=(None,) * len(area_states),
+            ),
+        )
+
+
+class ControllerState:
+    """Save and restore the runtime state of a config entry.
+
+    Saves are delayed and batched, so a burst of evaluations costs one write.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the state."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            CONTROLLER_STATE_STORAGE_VERSION,
+            CONTROLLER_STATE_STORAGE_KEY.format(entry_id),
+        )
+
+    async def async_load(self, runtime_data: HVACZoningData) -> dict[str, SystemState]:
+        """Restore the saved cover commands and return each system's state."""
+        if (data := await self._store.async_load()) is None:
+            return {}
+        runtime_data.cover_commands.update(
+            {
+                cover: (target, parse_datetime(sent_at))
+                for cover, (target, sent_at) in data.get("cover_commands", {}).items()
+            }
+        )
+        return {
+            central_thermostat_entity_id: SystemState.from_dict(system_state)
+            for central_thermostat_entity_id, system_state in data.get(
+                "systems", {}
+            ).items()
+        }
+
+    async def async_remove(self) -> None:
+        """Remove the saved state."""
+        await self._store.async_remove()
+
+    @callback
+    def async_schedule_save(self, runtime_data: HVACZoningData) -> None:
+        """Save the runtime state once the save delay has passed."""
+        self._store.async_delay_save(
+            lambda: build_controller_state_data(runtime_data),
+            CONTROLLER_STATE_SAVE_DELAY,
+        )
+
+
+def build_controller_state_data(runtime_data: HVACZoningData) -> dict[str, Any]:
+    """Build the data saved for the runtime state of a config entry.
+
+    A system not yet evaluated since it was restored keeps its saved state.
+    """
+    return {
+        "cover_commands": {
+            cover: [target, format_datetime(sent_at)]
+            for cover, (target, sent_at) in runtime_data.cover_commands.items()
+        },
+        "systems": {
+            central_thermostat_entity_id: (
+                system_data.saved_state
+                if system_data.last_plan is None and system_data.saved_state is not None
+                else SystemState.from_evaluation(
+                    system_data.central_setpoint_command,
+                    system_data.last_snapshot,
+                    system_data.last_plan,
+                )
+            ).as_dict()
+            for central_thermostat_entity_id, system_data in (
+                runtime_data.systems.items()
+            )
+        },
+    }
@@ -0,0 +1,157 @@
+"""Per-area thermal model for the HVAC Zoning integration.
+
+Each area learns how fast its temperature moves, in °/min, for every HVAC
+mode with its vents open and closed. Rates are fitted from the temperature
+sensor stream by recursive least squares with a forgetting factor, so the
+model keeps a constant amount of state per area and no raw history.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    HVAC_MODE_COOL,
+    SUPPORTED_HVAC_MODES,
+    THERMAL_MODEL_FORGETTING_FACTOR,
+    THERMAL_MODEL_MAX_INTERVAL,
+    THERMAL_MODEL_MIN_INTERVAL,
+    THERMAL_MODEL_SAVE_DELAY,
+    THERMAL_MODEL_STORAGE_KEY,
+    THERMAL_MODEL_STORAGE_VERSION,
+)
+
+INITIAL_COVARIANCE = 1e6
+
+
+def determine_rate_key(hvac_mode: str, is_open: bool) -> str:
+    """Return the key of the rate for an HVAC mode and vent state."""
+    return f"{hvac_mode}_{'open' if is_open else 'closed'}"
+
+
+@dataclass(slots=True)
+class RateEstimate:
+    """Recursive least squares estimate of a constant rate."""
+
+    rate: float = 0.0
+    covariance: float = INITIAL_COVARIANCE
+    samples: int = 0
+
+    def update(self, observed_rate: float, forgetting_factor: float) -> None:
+        """Fold an observed rate into the estimate."""
+        gain = self.covariance / (forgetting_factor + self.covariance)
+        self.rate += gain * (observed_rate - self.rate)
+        self.covariance = (1 - gain) * self.covariance / forgetting_factor
+        self.samples += 1
+
+
+@dataclass(frozen=True, slots=True)
+class TemperatureAnchor:
+    """Start of the interval an area's next rate is observed over."""
+
+    temperature: float
+    time: datetime
+    rate_key: str
+
+
+class ThermalModel:
+    """Learn and persist the heating and cooling rates of each area."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the model."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            THERMAL_MODEL_STORAGE_VERSION,
+            THERMAL_MODEL_STORAGE_KEY.format(entry_id),
+        )
+        self._estimates: dict[str, dict[str, RateEstimate]] = {}
+        self._anchors: dict[str, TemperatureAnchor] = {}
+
+    async def async_load(self) -> None:
+        """Load the persisted rates."""
+        if (data := await self._store.async_load()) is None:
+            return
+        self._estimates = {
+            area: {key: RateEstimate(**estimate) for key, estimate in rates.items()}
+            for area, rates in data.get("areas", {}).items()
+        }
+
+    async def async_remove(self) -> None:
+        """Remove the persisted rates."""
+        await self._store.async_remove()
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "areas": {
+                area: {key: asdict(estimate) for key, estimate in rates.items()}
+                for area, rates in self._estimates.items()
+            }
+        }
+
+    def observe(
+        self,
+        area: str,
+        temperature: float | None,
+        now: datetime,
+        *,
+        hvac_mode: str | None,
+        is_active: bool,
+        is_open: bool,
+    ) -> bool:
+        """Observe an area's temperature and return whether a rate was updated.
+
+        A rate is only observed over an interval during which the system was
+        running in the same mode with the area's vents in the same state.
+        """
+        if (
+            temperature is None
+            or not is_active
+            or hvac_mode not in SUPPORTED_HVAC_MODES
+        ):
+            self._anchors.pop(area, None)
+            return False
+        rate_key = determine_rate_key(hvac_mode, is_open)
+        anchor = self._anchors.get(area)
+        if anchor is None or anchor.rate_key != rate_key:
+            self._anchors[area] = TemperatureAnchor(temperature, now, rate_key)
+            return False
+        elapsed = now - anchor.time
+        if elapsed < THERMAL_MODEL_MIN_INTERVAL:
+            return False
+        self._anchors[area] = TemperatureAnchor(temperature, now, rate_key)
+        if elapsed > THERMAL_MODEL_MAX_INTERVAL:
+            return False
+        self._estimates.setdefault(area, {}).setdefault(
+            rate_key, RateEstimate()
+        ).update(
+            (temperature - anchor.temperature) / (elapsed.total_seconds() / 60),
+            THERMAL_MODEL_FORGETTING_FACTOR,
+        )
+        self._store.async_delay_save(self._data_to_save, THERMAL_MODEL_SAVE_DELAY)
+        return True
+
+    def get_rate(self, area: str, hvac_mode: str, is_open: bool) -> float | None:
+        """Return the learned rate of an area in °/min, or None if not learned."""
+        estimate = self._estimates.get(area, {}).get(
+            determine_rate_key(hvac_mode, is_open)
+        )
+        return estimate.rate if estimate is not None else None
+
+    def get_conditioning_rate(self, area: str, hvac_mode: str) -> float | None:
+        """Return how fast an open area moves towards conditioning in °/min."""
+        rate = self.get_rate(area, hvac_mode, True)
+        if rate is None:
+            return None
+        return -rate if hvac_mode == HVAC_MODE_COOL else rate
+
+    def as_attributes(self, area: str) -> dict[str, float]:
+        """Return the learned rates of an area as state attributes."""
+        return {
+            f"{key}_rate": round(estimate.rate, 4)
+            for key, estimate in self._estimates.get(area, {}).items()
+        }
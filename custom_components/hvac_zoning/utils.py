@@ -21,3 +21,21 @@ def get_all_thermostat_entity_ids(config_entry_data):
         for area in config_entry_data.get("areas", {}).values()
         if "climate" in area
     ]
+
+
+def determine_if_night_time_mode(areas):
+    """Determine if night time mode."""
+    return any(area.get("bedroom", False) for area in areas.values())
+
+
+def filter_to_bedrooms(areas):
+    """Filter to bedrooms."""
+    return {key: value for key, value in areas.items() if value.get("bedroom", False)}
+
+
+def parse_temperature(value) -> float | None:
+    """Parse a temperature state or attribute, returning None if not numeric."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
@@ -1,15 +1,55 @@
 """Common testing utilities for HVAC Zoning."""
 
+from datetime import UTC, datetime, timedelta
+
+from homeassistant.components.climate import HVACMode
 from pytest_homeassistant_custom_component.common import (
     MockConfigEntry,
+    MockEntityPlatform,
     async_fire_time_changed,
     mock_device_registry,
     mock_registry,
 )
 
+from custom_components.hvac_zoning.engine import HouseSnapshot
+
 __all__ = [
+    "NOW",
     "MockConfigEntry",
+    "MockEntityPlatform",
     "async_fire_time_changed",
+    "create_snapshot",
     "mock_device_registry",
     "mock_registry",
 ]
+
+NOW = datetime(2025, 1, 1, 12, tzinfo=UTC)
+
+
+def create_snapshot(**kwargs) -> HouseSnapshot:
+    """Create a two area snapshot, overriding fields with kwargs.
+
+    Hystereses and minimum dwells default to zero for every area in kwargs.
+    """
+    num_areas = len(kwargs.get("areas", ("office", "master_bedroom")))
+    return HouseSnapshot(
+        **{
+            "areas": ("office", "master_bedroom"),
+            "hystereses": (0.0,) * num_areas,
+            "min_dwells": (timedelta(0),) * num_areas,
+            "target_temperatures": (71.0, 70.0),
+            "actual_temperatures": (70.0, 70.0),
+            "is_bedrooms": (False, True),
+            "is_availables": (True, True),
+            "hvac_mode": HVACMode.HEAT,
+            "central_actual_temperature": 68.0,
+            "is_night_time_mode": True,
+            "is_night_time": False,
+            "control_central_thermostat": True,
+            "temperature_tolerance": None,
+            "proportional_band": None,
+            "min_open_area": 0,
+            "now": NOW,
+            **kwargs,
+        }
+    )
@@ -1,19 +1,35 @@
 """Test Climate."""
 
-from unittest.mock import AsyncMock
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
 
 from homeassistant.components.climate.const import HVACMode
 from homeassistant.const import ATTR_TEMPERATURE
 from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.util.unit_system import US_CUSTOMARY_SYSTEM
 import pytest
 
 from custom_components.hvac_zoning.climate import Thermostat
+from custom_components.hvac_zoning.const import SIGNAL_THERMAL_MODEL_UPDATED
+from custom_components.hvac_zoning.thermal import ThermalModel
+from tests.common import MockEntityPlatform
 
 name = "basement_thermostat"
 temperature_sensor_entity_id = "sensor.basement_temperature"
 thermostat_entity_id = "climate.living_room_thermostat"
 
 
+async def async_add_thermostat(hass: HomeAssistant) -> Thermostat:
+    """Add a thermostat to hass so it subscribes to its source entities."""
+    thermostat = Thermostat(
+        hass, name, temperature_sensor_entity_id, thermostat_entity_id
+    )
+    await MockEntityPlatform(hass).async_add_entities([thermostat])
+    await hass.async_block_till_done()
+    return thermostat
+
+
 def test_thermostat_default_target_temperature(hass: HomeAssistant) -> None:
     """Test thermostat default target temperature."""
     hass.states.async_set(thermostat_entity_id, HVACMode.HEAT)
@@ -38,50 +54,64 @@ def test_thermostat_current_temperature_from_sensor(hass: HomeAssistant) -> None
     assert thermostat.current_temperature == 68.5
 
 
-def test_set_temperature(hass: HomeAssistant) -> None:
-    """Test set temperature."""
+async def test_set_temperature(hass: HomeAssistant) -> None:
+    """Test set temperature writes the new target temperature."""
+    hass.config.units = US_CUSTOMARY_SYSTEM
     hass.states.async_set(thermostat_entity_id, HVACMode.HEAT)
 
-    thermostat = Thermostat(
-        hass, name, temperature_sensor_entity_id, thermostat_entity_id
-    )
+    thermostat = await async_add_thermostat(hass)
 
     target_temperature = 75.0
     kwargs = {ATTR_TEMPERATURE: target_temperature}
-    thermostat.set_temperature(**kwargs)
+    await thermostat.async_set_temperature(**kwargs)
 
     assert thermostat._attr_target_temperature == target_temperature
+    assert hass.states.get(thermostat.entity_id).attributes[ATTR_TEMPERATURE] == (
+        target_temperature
+    )
+
+    with patch.object(thermostat, "async_write_ha_state") as async_write_ha_state:
+        await thermostat.async_set_temperature(**kwargs)
+        await thermostat.async_set_temperature()
 
+        async_write_ha_state.assert_not_called()
 
-def test_current_temperature_updates_with_sensor_state(hass: HomeAssistant) -> None:
+
+async def test_current_temperature_updates_with_sensor_state(
+    hass: HomeAssistant,
+) -> None:
     """Test current temperature updates when sensor state changes."""
     hass.states.async_set(thermostat_entity_id, HVACMode.HEAT)
     hass.states.async_set(temperature_sensor_entity_id, "68.0")
 
-    thermostat = Thermostat(
-        hass, name, temperature_sensor_entity_id, thermostat_entity_id
-    )
+    thermostat = await async_add_thermostat(hass)
 
     assert thermostat.current_temperature == 68.0
+    state = hass.states.get(thermostat.entity_id)
 
     hass.states.async_set(temperature_sensor_entity_id, "69.0")
+    await hass.async_block_till_done()
 
     assert thermostat.current_temperature == 69.0
+    assert (
+        hass.states.get(thermostat.entity_id).attributes["current_temperature"]
+        != state.attributes["current_temperature"]
+    )
 
 
-def test_hvac_mode_updates_with_thermostat_state(hass: HomeAssistant) -> None:
+async def test_hvac_mode_updates_with_thermostat_state(hass: HomeAssistant) -> None:
     """Test hvac mode updates when central thermostat state changes."""
     hass.states.async_set(thermostat_entity_id, HVACMode.HEAT)
 
-    thermostat = Thermostat(
-        hass, name, temperature_sensor_entity_id, thermostat_entity_id
-    )
+    thermostat = await async_add_thermostat(hass)
 
     assert thermostat.hvac_mode == HVACMode.HEAT
 
     hass.states.async_set(thermostat_entity_id, HVACMode.COOL)
+    await hass.async_block_till_done()
 
     assert thermostat.hvac_mode == HVACMode.COOL
+    assert hass.states.get(thermostat.entity_id).state == HVACMode.COOL
 
 
 def test_thermostat_with_unavailable_entities(hass: HomeAssistant) -> None:
@@ -171,22 +201,80 @@ def test_hvac_modes(hass: HomeAssistant, thermostat_state, expected_hvac_modes)
     assert thermostat.hvac_modes == expected_hvac_modes
 
 
-def test_hvac_modes_updates_with_thermostat_state(hass: HomeAssistant) -> None:
+async def test_hvac_modes_updates_with_thermostat_state(
+    hass: HomeAssistant,
+) -> None:
     """Test hvac_modes updates when central thermostat state changes."""
     hass.states.async_set(thermostat_entity_id, HVACMode.HEAT)
 
-    thermostat = Thermostat(
-        hass, name, temperature_sensor_entity_id, thermostat_entity_id
-    )
+    thermostat = await async_add_thermostat(hass)
 
     assert thermostat.hvac_modes == [HVACMode.HEAT]
 
     hass.states.async_set(thermostat_entity_id, HVACMode.COOL)
+    await hass.async_block_till_done()
 
     assert thermostat.hvac_modes == [HVACMode.COOL]
 
 
-def test_set_hvac_mode_does_nothing(hass: HomeAssistant) -> None:
+async def test_state_written_only_when_displayed_value_changes(
+    hass: HomeAssistant,
+) -> None:
+    """Test source changes that do not change a displayed value are not written."""
+    hass.states.async_set(thermostat_entity_id, HVACMode.HEAT)
+    hass.states.async_set(temperature_sensor_entity_id, "68.0")
+
+    thermostat = await async_add_thermostat(hass)
+
+    with patch.object(thermostat, "async_write_ha_state") as async_write_ha_state:
+        hass.states.async_set(
+            temperature_sensor_entity_id, "68.0", {"battery_level": 80}
+        )
+        hass.states.async_set(
+            thermostat_entity_id, HVACMode.HEAT, {"current_temperature": 70}
+        )
+        await hass.async_block_till_done()
+
+        async_write_ha_state.assert_not_called()
+
+        hass.states.async_set(temperature_sensor_entity_id, "68.5")
+        await hass.async_block_till_done()
+
+        async_write_ha_state.assert_called_once()
+
+
+async def test_unsubscribes_when_removed(hass: HomeAssistant) -> None:
+    """Test the thermostat stops following its sources once removed."""
+    hass.states.async_set(temperature_sensor_entity_id, "68.0")
+
+    thermostat = await async_add_thermostat(hass)
+    await thermostat.async_remove()
+
+    hass.states.async_set(temperature_sensor_entity_id, "69.0")
+    await hass.async_block_till_done()
+
+    assert thermostat.current_temperature == 68.0
+
+
+async def test_update_sources(hass: HomeAssistant) -> None:
+    """Test the thermostat follows new source entities of its area."""
+    hass.states.async_set(temperature_sensor_entity_id, "68.0")
+    hass.states.async_set("sensor.office_temperature", "71.0")
+    thermostat = await async_add_thermostat(hass)
+
+    thermostat.async_update_sources("sensor.office_temperature", thermostat_entity_id)
+    hass.states.async_set(temperature_sensor_entity_id, "69.0")
+    await hass.async_block_till_done()
+
+    assert thermostat.current_temperature == 71.0
+
+    hass.states.async_set("sensor.office_temperature", "72.0")
+    await hass.async_block_till_done()
+
+    assert thermostat.current_temperature == 72.0
+
+
+async def test_set_hvac_mode_does_nothing(hass: HomeAssistant) -> None:
     """Test set_hvac_mode does nothing (HVAC mode is controlled by central thermostat)."""
     hass.states.async_set(thermostat_entity_id, HVACMode.HEAT)
 
@@ -196,7 +284,7 @@ def test_set_hvac_mode_does_nothing(hass: HomeAssistant) -> None:
 
     assert thermostat.hvac_mode == HVACMode.HEAT
 
-    thermostat.set_hvac_mode(HVACMode.COOL)
+    await thermostat.async_set_hvac_mode(HVACMode.COOL)
 
     assert thermostat.hvac_mode == HVACMode.HEAT
 
@@ -220,3 +308,39 @@ def test_hvac_mode_returns_none(
     )
 
     assert thermostat.hvac_mode == expected_hvac_mode
+
+
+async def test_thermostat_thermal_model_attributes(hass: HomeAssistant) -> None:
+    """Test the learned rates are exposed once the model signals an update."""
+    hass.states.async_set(thermostat_entity_id, HVACMode.HEAT)
+    thermal_model = ThermalModel(hass, "entry_id")
+    thermostat = Thermostat(
+        hass,
+        name,
+        temperature_sensor_entity_id,
+        thermostat_entity_id,
+        thermal_model=thermal_model,
+        area="basement",
+        config_entry_id="entry_id",
+    )
+    await MockEntityPlatform(hass).async_add_entities([thermostat])
+    await hass.async_block_till_done()
+
+    assert "heat_open_rate" not in hass.states.get(thermostat.entity_id).attributes
+
+    now = datetime(2025, 1, 1, 12, tzinfo=UTC)
+    for minutes, temperature in ((0, 68.0), (10, 69.0)):
+        thermal_model.observe(
+            "basement",
+            temperature,
+            now + timedelta(minutes=minutes),
+            hvac_mode=HVACMode.HEAT,
+            is_active=True,
+            is_open=True,
+        )
+    async_dispatcher_send(
+        hass, SIGNAL_THERMAL_MODEL_UPDATED.format("entry_id", "basement")
+    )
+    await hass.async_block_till_done()
+
+    assert hass.states.get(thermostat.entity_id).attributes["heat_open_rate"] == 0.1
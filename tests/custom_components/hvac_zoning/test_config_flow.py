@@ -1,84 +1,131 @@
 """Test the HVAC Zoning config flow."""
 
-from unittest.mock import MagicMock, patch
+import subprocess
+import sys
+from unittest.mock import patch
 
 from homeassistant import data_entry_flow
 from homeassistant.const import STATE_OFF, STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import area_registry as ar, entity_registry as er
 from homeassistant.helpers.area_registry import AreaEntry
 from homeassistant.helpers.entity_registry import RegistryEntry
 import pytest
 
 from custom_components.hvac_zoning import config_flow
 from custom_components.hvac_zoning.config_flow import (
+    classify_entities,
     convert_bedroom_input_to_config_entry,
     convert_connectivities_input_to_config_entry,
     convert_user_input_to_boolean,
-    filter_entities_to_device_class_and_map_to_entity_ids,
-    filter_entities_to_device_class_and_map_to_value_and_label_array_of_dict,
     get_all_rooms,
+    get_areas,
     get_defaults,
+    get_entities_for_area,
+    get_entities_for_area_and_device_class,
     get_options,
     is_entity_available,
+    merge_area_input,
     merge_user_input,
 )
-from custom_components.hvac_zoning.const import DOMAIN
-
-# async def test_get_entities_for_area(hass: HomeAssistant) -> None:
-#     """Test get entities for area."""
-#     mock_self = MagicMock()
-#     mock_self.hass = hass
-#     entity_id = "hvac_zoning.foo_cover"
-#     registry_id = "47ad524676f7deec03f2ef84f18ed00"
-#     registry_entry = RegistryEntry(entity_id, "bar", Platform.COVER, id=registry_id)
-#     entity_registry_items = EntityRegistryItems()
-#     entity_registry_items.__setitem__(entity_id, registry_entry)
-#     entity_registry = EntityRegistry(hass)
-#     entity_registry.entities = entity_registry_items
-#     entity_registry.deleted_entities = {}
-#     area_id = "living_room"
-#     entity_registry.async_update_entity(entity_id, area_id=area_id)
-#     await hass.async_block_till_done()
-
-#     with mock_async_load(entity_registry):
-#         print("foo")
-
-#     with patch(
-#         "custom_components.hvac_zoning.config_flow.EntityRegistry",
-#         return_value=entity_registry,
-#     ):
-#         entities = await get_entities_for_area(mock_self, area_id)
-
-#         assert entities == [
-#             RegistryEntry(
-#                 entity_id=entity_id,
-#                 unique_id="bar",
-#                 platform=Platform.COVER,
-#                 previous_unique_id=None,
-#                 aliases=set(),
-#                 area_id=area_id,
-#                 categories={},
-#                 capabilities=None,
-#                 config_entry_id=None,
-#                 device_class=None,
-#                 device_id=None,
-#                 disabled_by=None,
-#                 entity_category=None,
-#                 hidden_by=None,
-#                 icon=None,
-#                 id=registry_id,
-#                 has_entity_name=False,
-#                 labels=set(),
-#                 name=None,
-#                 options={},
-#                 original_device_class=None,
-#                 original_icon=None,
-#                 original_name=None,
-#                 supported_features=0,
-#                 translation_key=None,
-#                 unit_of_measurement=None,
-#             )
-#         ]
+from custom_components.hvac_zoning.const import (
+    CONF_CONTROLLER,
+    CONF_EVALUATION_MAX_LATENCY,
+    CONF_EVALUATION_WINDOW,
+    CONF_HYSTERESIS,
+    CONF_MAX_SETPOINT_OFFSET,
+    CONF_MIN_DWELL,
+    CONF_MIN_OPEN_AREA,
+    CONF_PID_KD,
+    CONF_PID_KI,
+    CONF_PID_KP,
+    CONF_POSITION_STEP,
+    CONF_PROFILE_STARTUP,
+    CONF_PROPORTIONAL_BAND,
+    CONF_TEMPERATURE_COMPARISON,
+    CONF_TEMPERATURE_DEADBAND,
+    CONF_TEMPERATURE_TOLERANCE,
+    CONF_VENT_MODE,
+    CONTROLLER_PID,
+    CONTROLLER_SIMPLE,
+    DOMAIN,
+    TEMPERATURE_COMPARISON_PRECISE,
+    TEMPERATURE_COMPARISON_TRUNCATE,
+    VENT_MODE_BINARY,
+    VENT_MODE_PROPORTIONAL,
+)
+from tests.common import MockConfigEntry
+
+
+async def test_get_entities_for_area(hass: HomeAssistant) -> None:
+    """Test entities are read from the loaded registry and indexed once per flow."""
+    area_registry = ar.async_get(hass)
+    basement = area_registry.async_create("Basement")
+    office = area_registry.async_create("Office")
+    entity_registry = er.async_get(hass)
+    vent = entity_registry.async_get_or_create(
+        "cover", "hvac_stubs", "basement_vent", suggested_object_id="basement_vent"
+    )
+    entity_registry.async_update_entity(vent.entity_id, area_id=basement.id)
+    entity_registry.async_get_or_create(
+        "sensor", "hvac_stubs", "unassigned_temperature"
+    )
+    flow = config_flow.HVACZoningConfigFlow()
+    flow.hass = hass
+
+    with patch(
+        "custom_components.hvac_zoning.config_flow.build_area_entities_index",
+        wraps=config_flow.build_area_entities_index,
+    ) as build_area_entities_index:
+        basement_entities = get_entities_for_area(flow, basement.id)
+        office_entities = get_entities_for_area(flow, office.id)
+
+    assert [entity.entity_id for entity in basement_entities] == ["cover.basement_vent"]
+    assert office_entities == []
+    build_area_entities_index.assert_called_once_with(hass)
+    assert get_areas(flow) == [basement, office]
+
+
+async def test_get_entities_for_area_and_device_class(hass: HomeAssistant) -> None:
+    """Test an area's entities are classified once for every device class."""
+    area_registry = ar.async_get(hass)
+    basement = area_registry.async_create("Basement")
+    entity_registry = er.async_get(hass)
+    for entity_id, original_device_class in (
+        ("cover.basement_vent", "damper"),
+        ("climate.basement_thermostat", None),
+        ("sensor.basement_temperature", "temperature"),
+    ):
+        domain, _, object_id = entity_id.partition(".")
+        entity = entity_registry.async_get_or_create(
+            domain,
+            "hvac_stubs",
+            object_id,
+            suggested_object_id=object_id,
+            original_device_class=original_device_class,
+        )
+        entity_registry.async_update_entity(entity.entity_id, area_id=basement.id)
+        hass.states.async_set(entity_id, "on")
+    hass.states.async_set("cover.basement_vent", STATE_UNAVAILABLE)
+    flow = config_flow.HVACZoningConfigFlow()
+    flow.hass = hass
+
+    with patch(
+        "custom_components.hvac_zoning.config_flow.classify_entities",
+        wraps=config_flow.classify_entities,
+    ) as mock_classify_entities:
+        dampers = get_entities_for_area_and_device_class(flow, basement.id, "damper")
+        climates = get_entities_for_area_and_device_class(flow, basement.id, "climate")
+        temperatures = get_entities_for_area_and_device_class(
+            flow, basement.id, "temperature"
+        )
+
+    assert dampers == []
+    assert [entity.entity_id for entity in climates] == ["climate.basement_thermostat"]
+    assert [entity.entity_id for entity in temperatures] == [
+        "sensor.basement_temperature"
+    ]
+    mock_classify_entities.assert_called_once()
 
 
 @pytest.mark.parametrize(
@@ -102,9 +149,7 @@ def test_filter_excludes_off_connectivity_sensors(
     hass: HomeAssistant,
 ) -> None:
     """Test that connectivity sensors with off state (disconnected) are excluded from the config flow options."""
-    from homeassistant.components.binary_sensor import BinarySensorDeviceClass
-
-    device_class = BinarySensorDeviceClass.CONNECTIVITY
+    device_class = "connectivity"
     entities = [
         RegistryEntry(
             entity_id="binary_sensor.connected_sensor",
@@ -127,16 +172,13 @@ def test_filter_excludes_off_connectivity_sensors(
     hass.states.async_set("binary_sensor.connected_sensor", "on")
     hass.states.async_set("binary_sensor.disconnected_sensor", STATE_OFF)
 
-    entity_names = (
-        filter_entities_to_device_class_and_map_to_value_and_label_array_of_dict(
-            hass, entities, device_class
-        )
-    )
-
-    assert entity_names == [
-        {"label": "Connected Sensor", "value": "binary_sensor.connected_sensor"},
+    entity_ids = [
+        entity.entity_id
+        for entity in classify_entities(hass, entities).get(device_class, [])
     ]
 
+    assert entity_ids == ["binary_sensor.connected_sensor"]
+
 
 @pytest.mark.parametrize(
     (
@@ -204,21 +246,18 @@ def test_filter_excludes_unavailable_entities(
     hass.states.async_set(available_entity_id, available_state)
     hass.states.async_set(unavailable_entity_id, STATE_UNAVAILABLE)
 
-    entity_names = (
-        filter_entities_to_device_class_and_map_to_value_and_label_array_of_dict(
-            hass, entities, device_class
-        )
-    )
-
-    assert entity_names == [
-        {"label": available_name, "value": available_entity_id},
+    entity_ids = [
+        entity.entity_id
+        for entity in classify_entities(hass, entities).get(device_class, [])
     ]
 
+    assert entity_ids == [available_entity_id]
+
 
-def test_filter_entities_to_device_class_and_map_to_value_and_label_array_of_dict(
+def test_classify_entities(
     hass: HomeAssistant,
 ) -> None:
-    """Test map entities to entity names."""
+    """Test entities are bucketed by the device class they can fill."""
     device_class = "damper"
     entities = [
         RegistryEntry(
@@ -260,23 +299,22 @@ def test_filter_entities_to_device_class_and_map_to_value_and_label_array_of_dic
     hass.states.async_set("cover.basement_northeast_vent", "open")
     hass.states.async_set("cover.basement_southeast_vent", "open")
 
-    entity_names = (
-        filter_entities_to_device_class_and_map_to_value_and_label_array_of_dict(
-            hass, entities, device_class
-        )
-    )
+    entity_ids = [
+        entity.entity_id
+        for entity in classify_entities(hass, entities).get(device_class, [])
+    ]
 
-    assert entity_names == [
-        {"label": "Basement West Vent", "value": "cover.basement_west_vent"},
-        {"label": "Basement Northeast Vent", "value": "cover.basement_northeast_vent"},
-        {"label": "Basement Southeast Vent", "value": "cover.basement_southeast_vent"},
+    assert entity_ids == [
+        "cover.basement_west_vent",
+        "cover.basement_northeast_vent",
+        "cover.basement_southeast_vent",
     ]
 
 
-def test_filter_entities_to_device_class_and_map_to_value_and_label_array_of_dict_climate(
+def test_classify_entities_climate(
     hass: HomeAssistant,
 ) -> None:
-    """Test map entities to entity names."""
+    """Test thermostats are bucketed by their domain."""
     device_class = "climate"
     entities = [
         RegistryEntry(
@@ -300,21 +338,18 @@ def test_filter_entities_to_device_class_and_map_to_value_and_label_array_of_dic
     hass.states.async_set("climate.living_room_thermostat", "heat")
     hass.states.async_set("sensor.basement_temperature", "68.0")
 
-    entity_names = (
-        filter_entities_to_device_class_and_map_to_value_and_label_array_of_dict(
-            hass, entities, device_class
-        )
-    )
-
-    assert entity_names == [
-        {"value": "climate.living_room_thermostat", "label": "Living Room Thermostat"}
+    entity_ids = [
+        entity.entity_id
+        for entity in classify_entities(hass, entities).get(device_class, [])
     ]
 
+    assert entity_ids == ["climate.living_room_thermostat"]
 
-def test_filter_entities_to_device_class_and_map_to_entity_names(
+
+def test_classify_entities_skips_other_device_classes(
     hass: HomeAssistant,
 ) -> None:
-    """Test map entities to entity names."""
+    """Test entities of other device classes are not in a bucket."""
     device_class = "damper"
     entities = [
         RegistryEntry(
@@ -347,11 +382,12 @@ def test_filter_entities_to_device_class_and_map_to_entity_names(
     hass.states.async_set("cover.basement_west_vent", "open")
     hass.states.async_set("cover.basement_northeast_vent", "open")
 
-    entity_names = filter_entities_to_device_class_and_map_to_entity_ids(
-        hass, entities, device_class
-    )
+    entity_ids = [
+        entity.entity_id
+        for entity in classify_entities(hass, entities).get(device_class, [])
+    ]
 
-    assert entity_names == [
+    assert entity_ids == [
         "cover.basement_west_vent",
         "cover.basement_northeast_vent",
     ]
@@ -378,8 +414,8 @@ async def test_get_defaults(
     hass: HomeAssistant, device_class, area_name, multiple, expected_defaults
 ) -> None:
     """Test get defaults."""
-    mock_self = MagicMock()
-    mock_self.hass = hass
+    flow = config_flow.HVACZoningConfigFlow()
+    flow.hass = hass
     entities = [
         RegistryEntry(
             entity_id="sensor.basement_temperature",
@@ -425,15 +461,15 @@ async def test_get_defaults(
         "custom_components.hvac_zoning.config_flow.get_entities_for_area",
         return_value=entities,
     ):
-        defaults = await get_defaults(mock_self, area_entry, device_class, multiple)
+        defaults = await get_defaults(flow, area_entry, device_class, multiple)
 
         assert defaults == expected_defaults
 
 
 async def test_get_options(hass: HomeAssistant) -> None:
     """Test get options."""
-    mock_self = MagicMock()
-    mock_self.hass = hass
+    flow = config_flow.HVACZoningConfigFlow()
+    flow.hass = hass
     entities = [
         RegistryEntry(
             entity_id="sensor.basement_temperature",
@@ -479,7 +515,7 @@ async def test_get_options(hass: HomeAssistant) -> None:
         "custom_components.hvac_zoning.config_flow.get_entities_for_area",
         return_value=entities,
     ):
-        options = await get_options(mock_self, area_entry, "damper")
+        options = await get_options(flow, area_entry, "damper")
 
         assert options == [
             {"value": "cover.basement_west_vent", "label": "Basement West Vent"},
@@ -888,6 +924,64 @@ async def test_step_fourth_with_user_input(hass: HomeAssistant) -> None:
     }
 
 
+async def test_step_fourth_with_multiple_thermostats(hass: HomeAssistant) -> None:
+    """Test choosing more than one thermostat asks which areas each conditions."""
+    flow = config_flow.HVACZoningConfigFlow()
+    flow.hass = hass
+    flow.init_info = {
+        "areas": {
+            "master_bedroom": {"covers": ["cover.master_bedroom_vent"]},
+            "basement": {"covers": ["cover.basement_vent"]},
+        }
+    }
+    user_input = {
+        "main_floor": "climate.living_room_thermostat",
+        "basement": "climate.basement_thermostat",
+    }
+
+    result = await flow.async_step_fourth(user_input)
+
+    assert result["type"] == data_entry_flow.FlowResultType.FORM
+    assert result["step_id"] == "systems"
+    assert list(result["data_schema"].schema) == ["basement", "master_bedroom"]
+
+
+async def test_step_systems_with_user_input(hass: HomeAssistant) -> None:
+    """Test areas are mapped to the chosen central thermostats."""
+    flow = config_flow.HVACZoningConfigFlow()
+    flow.hass = hass
+    flow.init_info = {
+        "areas": {
+            "master_bedroom": {"covers": ["cover.master_bedroom_vent"]},
+            "basement": {
+                "covers": ["cover.basement_vent"],
+                "climate": "climate.basement_thermostat",
+            },
+        }
+    }
+    user_input = {
+        "master_bedroom": "climate.living_room_thermostat",
+        "basement": "climate.basement_thermostat",
+    }
+
+    result = await flow.async_step_systems(user_input)
+
+    assert result["step_id"] == "fifth"
+    assert flow.init_info == {
+        "areas": {
+            "master_bedroom": {
+                "covers": ["cover.master_bedroom_vent"],
+                "central_thermostat": "climate.living_room_thermostat",
+            },
+            "basement": {
+                "covers": ["cover.basement_vent"],
+                "climate": "climate.basement_thermostat",
+                "central_thermostat": "climate.basement_thermostat",
+            },
+        }
+    }
+
+
 async def test_step_fifth_without_user_input(hass: HomeAssistant) -> None:
     """Test step fifth without user input."""
     flow = config_flow.HVACZoningConfigFlow()
@@ -923,6 +1017,47 @@ async def test_step_fifth_with_user_input(hass: HomeAssistant) -> None:
     }
 
 
+async def test_step_area_settings(hass: HomeAssistant) -> None:
+    """Test each valid area gets a hysteresis and minimum dwell section."""
+    flow = config_flow.HVACZoningConfigFlow()
+    flow.hass = hass
+    flow.init_info = {
+        "areas": {
+            "master_bedroom": {"covers": ["cover.master_bedroom_vent"]},
+            "main_floor": {"climate": "climate.living_room_thermostat"},
+        },
+        "bed_time": "21:00:00",
+        "wake_time": "05:00:00",
+    }
+
+    result = await flow.async_step_area_settings()
+
+    assert result["type"] == data_entry_flow.FlowResultType.FORM
+    assert result["step_id"] == "area_settings"
+    assert [str(key) for key in result["data_schema"].schema] == ["master_bedroom"]
+    assert result["data_schema"]({"master_bedroom": {}}) == {
+        "master_bedroom": {CONF_HYSTERESIS: 0.0, CONF_MIN_DWELL: 0}
+    }
+
+    result = await flow.async_step_area_settings(
+        {"master_bedroom": {CONF_HYSTERESIS: 1.0, CONF_MIN_DWELL: 600}}
+    )
+
+    assert result["step_id"] == "sixth"
+    assert flow.init_info == {
+        "areas": {
+            "master_bedroom": {
+                "covers": ["cover.master_bedroom_vent"],
+                CONF_HYSTERESIS: 1.0,
+                CONF_MIN_DWELL: 600,
+            },
+            "main_floor": {"climate": "climate.living_room_thermostat"},
+        },
+        "bed_time": "21:00:00",
+        "wake_time": "05:00:00",
+    }
+
+
 async def test_step_sixth(hass: HomeAssistant) -> None:
     """Test step sixth without user input."""
     flow = config_flow.HVACZoningConfigFlow()
@@ -948,3 +1083,236 @@ async def test_step_sixth_with_user_input(hass: HomeAssistant) -> None:
     assert result["data"] == {
         "control_central_thermostat": True,
     }
+
+
+def test_merge_area_input() -> None:
+    """Test only the offered keys of the edited area are replaced."""
+    config_entry_data = {
+        "areas": {
+            "office": {
+                "covers": ["cover.office_vent"],
+                "connectivities": ["binary_sensor.office_vent_status"],
+                "temperature": "sensor.office_temperature",
+                "bedroom": False,
+            },
+            "basement": {"covers": ["cover.basement_vent"]},
+        },
+        "control_central_thermostat": True,
+    }
+
+    assert merge_area_input(
+        config_entry_data,
+        "office",
+        {"covers": ["cover.office_east_vent"], "bedroom": True},
+        {"covers", "connectivities", "bedroom"},
+    ) == {
+        "areas": {
+            "office": {
+                "covers": ["cover.office_east_vent"],
+                "temperature": "sensor.office_temperature",
+                "bedroom": True,
+            },
+            "basement": {"covers": ["cover.basement_vent"]},
+        },
+        "control_central_thermostat": True,
+    }
+
+
+async def test_options_flow_edits_area(hass: HomeAssistant) -> None:
+    """Test the options flow edits one area of the entry's data."""
+    office = ar.async_get(hass).async_create("Office")
+    entity_registry = er.async_get(hass)
+    for object_id in ("office_vent", "office_east_vent"):
+        vent = entity_registry.async_get_or_create(
+            "cover",
+            "hvac_stubs",
+            object_id,
+            suggested_object_id=object_id,
+            original_device_class="damper",
+            original_name=object_id,
+        )
+        entity_registry.async_update_entity(vent.entity_id, area_id=office.id)
+        hass.states.async_set(vent.entity_id, "open")
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "areas": {
+                office.id: {
+                    "covers": ["cover.office_vent"],
+                    "temperature": "sensor.office_temperature",
+                    "bedroom": False,
+                },
+            },
+            "control_central_thermostat": True,
+        },
+    )
+    config_entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+
+    assert result["type"] == data_entry_flow.FlowResultType.MENU
+    assert result["step_id"] == "init"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"next_step_id": "select_area"}
+    )
+
+    assert result["type"] == data_entry_flow.FlowResultType.FORM
+    assert result["step_id"] == "select_area"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"area": office.id}
+    )
+
+    assert result["type"] == data_entry_flow.FlowResultType.FORM
+    assert result["step_id"] == "area"
+    assert [str(key) for key in result["data_schema"].schema] == [
+        "covers",
+        "bedroom",
+        CONF_HYSTERESIS,
+        CONF_MIN_DWELL,
+    ]
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {
+            "covers": ["cover.office_vent", "cover.office_east_vent"],
+            "bedroom": True,
+            CONF_MIN_DWELL: 120,
+        },
+    )
+
+    assert result["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
+    assert config_entry.data["areas"][office.id] == {
+        "covers": ["cover.office_vent", "cover.office_east_vent"],
+        "temperature": "sensor.office_temperature",
+        "bedroom": True,
+        CONF_HYSTERESIS: 0.0,
+        CONF_MIN_DWELL: 120,
+    }
+    assert config_entry.data["control_central_thermostat"] is True
+
+
+async def test_options_flow_edits_settings(hass: HomeAssistant) -> None:
+    """Test the options flow edits the settings shared by every area."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "areas": {"office": {"covers": ["cover.office_vent"]}},
+            "control_central_thermostat": True,
+        },
+    )
+    config_entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"next_step_id": "settings"}
+    )
+
+    assert result["type"] == data_entry_flow.FlowResultType.FORM
+    assert result["step_id"] == "settings"
+    assert result["data_schema"]({}) == {
+        CONF_TEMPERATURE_COMPARISON: TEMPERATURE_COMPARISON_TRUNCATE,
+        CONF_TEMPERATURE_TOLERANCE: 0.1,
+        CONF_TEMPERATURE_DEADBAND: 0.3,
+        CONF_VENT_MODE: VENT_MODE_BINARY,
+        CONF_PROPORTIONAL_BAND: 2.0,
+        CONF_MIN_OPEN_AREA: 30,
+        CONF_POSITION_STEP: 10,
+        CONF_CONTROLLER: CONTROLLER_SIMPLE,
+        CONF_PID_KP: 1.0,
+        CONF_PID_KI: 0.02,
+        CONF_PID_KD: 0.0,
+        CONF_MAX_SETPOINT_OFFSET: 4.0,
+        CONF_EVALUATION_WINDOW: 0.5,
+        CONF_EVALUATION_MAX_LATENCY: 2.0,
+        CONF_PROFILE_STARTUP: False,
+    }
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {
+            CONF_TEMPERATURE_COMPARISON: TEMPERATURE_COMPARISON_PRECISE,
+            CONF_TEMPERATURE_TOLERANCE: 0.2,
+            CONF_TEMPERATURE_DEADBAND: 0.5,
+            CONF_VENT_MODE: VENT_MODE_PROPORTIONAL,
+            CONF_PROPORTIONAL_BAND: 3.0,
+            CONF_CONTROLLER: CONTROLLER_PID,
+            CONF_PID_KP: 0.5,
+            CONF_EVALUATION_WINDOW: 0.25,
+            CONF_PROFILE_STARTUP: True,
+        },
+    )
+
+    assert result["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
+    assert config_entry.data == {
+        "areas": {"office": {"covers": ["cover.office_vent"]}},
+        "control_central_thermostat": True,
+        CONF_TEMPERATURE_COMPARISON: TEMPERATURE_COMPARISON_PRECISE,
+        CONF_TEMPERATURE_TOLERANCE: 0.2,
+        CONF_TEMPERATURE_DEADBAND: 0.5,
+        CONF_VENT_MODE: VENT_MODE_PROPORTIONAL,
+        CONF_PROPORTIONAL_BAND: 3.0,
+        CONF_MIN_OPEN_AREA: 30,
+        CONF_POSITION_STEP: 10,
+        CONF_CONTROLLER: CONTROLLER_PID,
+        CONF_PID_KP: 0.5,
+        CONF_PID_KI: 0.02,
+        CONF_PID_KD: 0.0,
+        CONF_MAX_SETPOINT_OFFSET: 4.0,
+        CONF_EVALUATION_WINDOW: 0.25,
+        CONF_EVALUATION_MAX_LATENCY: 2.0,
+        CONF_PROFILE_STARTUP: True,
+    }
+
+
+@pytest.mark.parametrize(
+    "user_input",
+    [
+        {CONF_TEMPERATURE_DEADBAND: -0.1},
+        {CONF_PROPORTIONAL_BAND: 0},
+        {CONF_MIN_OPEN_AREA: -1},
+        {CONF_MIN_OPEN_AREA: 101},
+        {CONF_PID_KP: -0.1},
+        {CONF_PID_KI: -0.1},
+        {CONF_PID_KD: -0.1},
+        {CONF_MAX_SETPOINT_OFFSET: 0.5},
+        {CONF_EVALUATION_WINDOW: 0.2},
+        {CONF_EVALUATION_WINDOW: 2.5},
+        {CONF_EVALUATION_MAX_LATENCY: 0.2},
+    ],
+)
+async def test_options_flow_rejects_invalid_settings(
+    hass: HomeAssistant, user_input
+) -> None:
+    """Test settings outside their range are rejected."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN, data={"areas": {"office": {"covers": ["cover.office_vent"]}}}
+    )
+    config_entry.add_to_hass(hass)
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"next_step_id": "settings"}
+    )
+
+    with pytest.raises(data_entry_flow.InvalidData):
+        await hass.config_entries.options.async_configure(result["flow_id"], user_input)
+
+    assert config_entry.data == {"areas": {"office": {"covers": ["cover.office_vent"]}}}
+
+
+def test_config_flow_import_does_not_load_cover_or_climate() -> None:
+    """Test loading the config flow leaves the cover and climate components alone."""
+    code = (
+        "import sys; import custom_components.hvac_zoning.config_flow; "
+        "print(sorted({'homeassistant.components.cover', "
+        "'homeassistant.components.climate'} & set(sys.modules)))"
+    )
+    loaded = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    assert loaded.stdout.strip() == "[]"
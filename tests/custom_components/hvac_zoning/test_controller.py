@@ -0,0 +1,168 @@
+"""Test controller."""
+
+from datetime import timedelta
+
+from homeassistant.components.climate import HVACMode
+import pytest
+
+from custom_components.hvac_zoning.const import (
+    CONF_CONTROLLER,
+    CONTROLLER_MPC,
+    CONTROLLER_PID,
+    CONTROLLER_SIMPLE,
+)
+from custom_components.hvac_zoning.controller import (
+    ModelPredictiveController,
+    PIDController,
+    SimpleController,
+    create_controller,
+)
+from custom_components.hvac_zoning.engine import HouseSnapshot, evaluate_house
+from custom_components.hvac_zoning.models import HVACZoningConfig
+from tests.common import NOW, create_snapshot
+
+
+def compute_setpoint(controller, snapshot: HouseSnapshot) -> float | None:
+    """Compute the setpoint of a controller for a freshly evaluated snapshot."""
+    return controller.compute_setpoint(snapshot, evaluate_house(snapshot))
+
+
+def test_simple_controller() -> None:
+    """Test the simple controller keeps the fixed nudge."""
+    snapshot = create_snapshot()
+
+    assert compute_setpoint(SimpleController(), snapshot) == 70.0
+    assert (
+        compute_setpoint(SimpleController(), snapshot)
+        == evaluate_house(snapshot).central_setpoint
+    )
+
+
+@pytest.mark.parametrize(
+    ("hvac_mode", "target_temperatures", "actual_temperatures", "expected_setpoint"),
+    [
+        (HVACMode.HEAT, (71.0, 70.0), (70.0, 70.0), 69.0),
+        (HVACMode.HEAT, (73.0, 70.0), (70.0, 70.0), 71.0),
+        (HVACMode.HEAT, (79.0, 70.0), (70.0, 70.0), 72.0),
+        (HVACMode.HEAT, (72.0, 70.0), (70.5, 70.0), 69.5),
+        (HVACMode.COOL, (68.0, 70.0), (70.0, 70.0), 66.0),
+    ],
+)
+def test_pid_controller_proportional(
+    hvac_mode, target_temperatures, actual_temperatures, expected_setpoint
+) -> None:
+    """Test the offset follows the lagging error within its bounds."""
+    controller = PIDController(kp=1.0, ki=0.0, kd=0.0, max_offset=4.0)
+    snapshot = create_snapshot(
+        hvac_mode=hvac_mode,
+        target_temperatures=target_temperatures,
+        actual_temperatures=actual_temperatures,
+    )
+
+    assert compute_setpoint(controller, snapshot) == expected_setpoint
+
+
+def test_pid_controller_integral() -> None:
+    """Test a persistent error builds up the offset until it is clamped."""
+    controller = PIDController(kp=0.0, ki=0.05, kd=0.0, max_offset=4.0)
+
+    assert compute_setpoint(controller, create_snapshot()) == 69.0
+    assert (
+        compute_setpoint(controller, create_snapshot(now=NOW + timedelta(minutes=40)))
+        == 70.0
+    )
+    assert (
+        compute_setpoint(controller, create_snapshot(now=NOW + timedelta(hours=5)))
+        == 72.0
+    )
+
+
+def test_pid_controller_resets_when_idle() -> None:
+    """Test an idle house discards the accumulated integral."""
+    controller = PIDController(kp=0.0, ki=0.05, kd=0.0, max_offset=4.0)
+    compute_setpoint(controller, create_snapshot())
+    compute_setpoint(controller, create_snapshot(now=NOW + timedelta(hours=5)))
+
+    assert (
+        compute_setpoint(
+            controller,
+            create_snapshot(
+                target_temperatures=(70.0, 70.0),
+                now=NOW + timedelta(hours=6),
+            ),
+        )
+        == 66.0
+    )
+    assert (
+        compute_setpoint(controller, create_snapshot(now=NOW + timedelta(hours=7)))
+        == 69.0
+    )
+
+
+def test_pid_controller_resets_on_hvac_mode_change() -> None:
+    """Test switching between heating and cooling discards the integral."""
+    controller = PIDController(kp=0.0, ki=0.05, kd=0.0, max_offset=4.0)
+    compute_setpoint(controller, create_snapshot())
+    compute_setpoint(controller, create_snapshot(now=NOW + timedelta(hours=5)))
+
+    assert (
+        compute_setpoint(
+            controller,
+            create_snapshot(
+                hvac_mode=HVACMode.COOL,
+                target_temperatures=(69.0, 70.0),
+                now=NOW + timedelta(hours=6),
+            ),
+        )
+        == 67.0
+    )
+
+
+@pytest.mark.parametrize(
+    ("rates", "max_offset", "expected_setpoint"),
+    [
+        (None, 4.0, 71.0),
+        ({"office": 0.1, "master_bedroom": 0.5}, 10.0, 77.0),
+        ({"office": 0.1, "master_bedroom": 0.5}, 4.0, 72.0),
+        ({"office": 0.3, "master_bedroom": 0.05}, 4.0, 71.5),
+        ({"office": None, "master_bedroom": 0.0}, 4.0, 71.0),
+    ],
+)
+def test_model_predictive_controller(rates, max_offset, expected_setpoint) -> None:
+    """Test the setpoint covers the run time of the slowest area."""
+    controller = ModelPredictiveController(
+        (lambda area, hvac_mode: rates[area]) if rates else None, max_offset
+    )
+    snapshot = create_snapshot(target_temperatures=(73.0, 71.0))
+
+    assert compute_setpoint(controller, snapshot) == expected_setpoint
+
+
+def test_model_predictive_controller_idle() -> None:
+    """Test an idle house falls back to the fixed nudge."""
+    controller = ModelPredictiveController(None, 4.0)
+    snapshot = create_snapshot(target_temperatures=(70.0, 70.0))
+
+    assert compute_setpoint(controller, snapshot) == 66.0
+
+
+@pytest.mark.parametrize(
+    ("controller", "expected_type"),
+    [
+        (CONTROLLER_SIMPLE, SimpleController),
+        (CONTROLLER_PID, PIDController),
+        (CONTROLLER_MPC, ModelPredictiveController),
+    ],
+)
+def test_create_controller(controller, expected_type) -> None:
+    """Test the configured controller is created."""
+    config = HVACZoningConfig.from_config_entry_data(
+        {
+            "areas": {},
+            "bed_time": "21:00:00",
+            "wake_time": "05:00:00",
+            CONF_CONTROLLER: controller,
+        }
+    )
+
+    assert isinstance(create_controller(config), expected_type)
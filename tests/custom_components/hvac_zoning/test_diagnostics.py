@@ -0,0 +1,47 @@
+"""Test Diagnostics."""
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.hvac_zoning.const import DOMAIN, TRIGGER_THERMOSTAT
+from custom_components.hvac_zoning.diagnostics import async_get_config_entry_diagnostics
+from custom_components.hvac_zoning.models import StartupProfile, get_runtime_data
+from tests.common import MockConfigEntry
+
+
+async def test_async_get_config_entry_diagnostics(hass: HomeAssistant) -> None:
+    """Test diagnostics include the config and instrumentation counters."""
+    data = {
+        "areas": {"main_floor": {"climate": "climate.living_room_thermostat"}},
+        "bed_time": "21:00:00",
+        "wake_time": "05:00:00",
+    }
+    config_entry = MockConfigEntry(domain=DOMAIN, data=data)
+    runtime_data = get_runtime_data(hass, config_entry)
+    runtime_data.commands_issued = 3
+    runtime_data.commands_suppressed = 1
+    runtime_data.stats.events_received = 4
+    runtime_data.stats.events_routed = 2
+    runtime_data.stats.service_calls = 2
+    runtime_data.stats.record_evaluation({TRIGGER_THERMOSTAT}, 0.004)
+    runtime_data.startup_profile = StartupProfile(phases={"set_up": 0.05})
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+
+    assert diagnostics == {
+        "config_entry_data": data,
+        "routed_entities": 0,
+        "commands_issued": 3,
+        "commands_suppressed": 1,
+        "evaluation_requests": 0,
+        "stats": {
+            "events_received": 4,
+            "events_routed": 2,
+            "evaluations": 1,
+            "evaluations_by_trigger": {TRIGGER_THERMOSTAT: 1},
+            "service_calls": 2,
+            "service_calls_per_evaluation": 2.0,
+            "evaluation_latency_p50": 0.004,
+            "evaluation_latency_p95": 0.004,
+        },
+        "startup_profile": {"set_up": 0.05},
+    }
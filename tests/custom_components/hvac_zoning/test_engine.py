@@ -0,0 +1,505 @@
+"""Test engine."""
+
+from dataclasses import replace
+from datetime import timedelta
+from itertools import product
+
+from homeassistant.components.climate import HVACMode
+from homeassistant.const import SERVICE_CLOSE_COVER, SERVICE_OPEN_COVER
+import pytest
+
+from custom_components.hvac_zoning.const import ACTIVE, IDLE
+from custom_components.hvac_zoning.engine import (
+    HousePlan,
+    determine_change_in_temperature,
+    determine_dwell_cover_service,
+    determine_hysteresis_need,
+    determine_need,
+    enforce_min_open_area,
+    evaluate_house,
+    evaluate_zones,
+)
+from tests.common import NOW, create_snapshot
+
+
+def determine_action(
+    target_temperature: float, actual_temperature: float, hvac_mode: str
+) -> str:
+    """Determine one area's action the way adjust_house did per area."""
+    return (
+        ACTIVE
+        if determine_need(target_temperature, actual_temperature, hvac_mode)
+        else IDLE
+    )
+
+
+def determine_cover_service_to_call(
+    target_temperature: float,
+    actual_temperature: float,
+    hvac_mode: str,
+    thermostat_action: str,
+    is_night_time_mode: bool,
+    is_night_time: bool,
+    is_bedroom: bool,
+    control_central_thermostat: bool,
+) -> str:
+    """Determine one area's cover service the way adjust_house did per area."""
+    if is_night_time_mode and is_night_time:
+        return SERVICE_OPEN_COVER if is_bedroom else SERVICE_CLOSE_COVER
+    action = (
+        ACTIVE
+        if thermostat_action == IDLE and control_central_thermostat is True
+        else determine_action(target_temperature, actual_temperature, hvac_mode)
+    )
+
+    return SERVICE_CLOSE_COVER if action is not ACTIVE else SERVICE_OPEN_COVER
+
+
+@pytest.mark.parametrize(
+    ("target_temperature", "hvac_mode", "action", "expected_change_in_temperature"),
+    [
+        (68, HVACMode.HEAT, ACTIVE, 70),
+        (68, HVACMode.COOL, ACTIVE, 66),
+        (68, HVACMode.OFF, ACTIVE, 68),
+        (68, HVACMode.HEAT, IDLE, 66),
+        (68, HVACMode.COOL, IDLE, 70),
+        (68, HVACMode.HEAT_COOL, ACTIVE, 68),
+        (68, HVACMode.OFF, IDLE, 68),
+    ],
+)
+def test_determine_change_in_temperature(
+    target_temperature, hvac_mode, action, expected_change_in_temperature
+) -> None:
+    """Test determine change in temperature."""
+    change_in_temperature = determine_change_in_temperature(
+        target_temperature, hvac_mode, action
+    )
+    assert change_in_temperature == expected_change_in_temperature
+
+
+def test_evaluate_house() -> None:
+    """Test evaluate house."""
+    plan = evaluate_house(create_snapshot())
+
+    assert plan == HousePlan(
+        cover_services=(SERVICE_OPEN_COVER, SERVICE_CLOSE_COVER),
+        thermostat_action=ACTIVE,
+        central_setpoint=70.0,
+        needs=(True, False),
+        cover_changed_ats=(None, None),
+        held_untils=(None, None),
+        cover_positions=(None, None),
+    )
+
+
+def test_evaluate_house_unavailable_area() -> None:
+    """Test an unavailable area gets no cover service but keeps the house active."""
+    plan = evaluate_house(
+        create_snapshot(
+            target_temperatures=(None, 70.0),
+            actual_temperatures=(70.0, 70.0),
+            is_availables=(False, True),
+            control_central_thermostat=False,
+        )
+    )
+
+    assert plan == HousePlan(
+        cover_services=(None, SERVICE_CLOSE_COVER),
+        thermostat_action=ACTIVE,
+        central_setpoint=None,
+        needs=(True, False),
+        cover_changed_ats=(None, None),
+        held_untils=(None, None),
+        cover_positions=(None, None),
+    )
+
+
+@pytest.mark.parametrize(
+    (
+        "hvac_mode",
+        "is_night_time_mode",
+        "is_night_time",
+        "control_central_thermostat",
+    ),
+    list(
+        product(
+            [HVACMode.HEAT, HVACMode.COOL, HVACMode.OFF],
+            [True, False],
+            [True, False],
+            [True, False],
+        )
+    ),
+)
+def test_evaluate_house_matches_per_area_decisions(
+    hvac_mode, is_night_time_mode, is_night_time, control_central_thermostat
+) -> None:
+    """Test evaluate house agrees with the per-area decision functions."""
+    target_temperatures = (71.0, 70.0, 68.0, 73.5)
+    actual_temperatures = (70.0, 70.9, 69.2, 73.0)
+    is_bedrooms = (False, True, True, False)
+    snapshot = create_snapshot(
+        areas=("office", "master_bedroom", "guest_bedroom", "kitchen"),
+        target_temperatures=target_temperatures,
+        actual_temperatures=actual_temperatures,
+        is_bedrooms=is_bedrooms,
+        is_availables=(True, True, True, True),
+        hvac_mode=hvac_mode,
+        is_night_time_mode=is_night_time_mode,
+        is_night_time=is_night_time,
+        control_central_thermostat=control_central_thermostat,
+    )
+    actions = [
+        determine_action(target, actual, hvac_mode)
+        for target, actual, is_bedroom in zip(
+            target_temperatures, actual_temperatures, is_bedrooms, strict=True
+        )
+        if is_bedroom or not (is_night_time_mode and is_night_time)
+    ]
+    thermostat_action = ACTIVE if ACTIVE in actions else IDLE
+
+    plan = evaluate_house(snapshot)
+
+    assert plan.thermostat_action == thermostat_action
+    assert plan.cover_services == tuple(
+        determine_cover_service_to_call(
+            target,
+            actual,
+            hvac_mode,
+            thermostat_action,
+            is_night_time_mode,
+            is_night_time,
+            is_bedroom,
+            control_central_thermostat,
+        )
+        for target, actual, is_bedroom in zip(
+            target_temperatures, actual_temperatures, is_bedrooms, strict=True
+        )
+    )
+    assert plan.central_setpoint == (
+        determine_change_in_temperature(68.0, hvac_mode, thermostat_action)
+        if control_central_thermostat
+        else None
+    )
+
+
+@pytest.mark.parametrize(
+    ("index", "target_temperature", "actual_temperature"),
+    [
+        (0, 69.0, 70.0),
+        (0, 71.0, 70.0),
+        (1, 72.0, 70.0),
+        (1, None, 70.0),
+        (2, 68.0, 66.0),
+        (3, 74.0, 73.0),
+    ],
+)
+@pytest.mark.parametrize("is_night_time", [True, False])
+@pytest.mark.parametrize("control_central_thermostat", [True, False])
+def test_evaluate_zones_matches_evaluate_house(
+    index,
+    target_temperature,
+    actual_temperature,
+    is_night_time,
+    control_central_thermostat,
+) -> None:
+    """Test re-evaluating one changed area agrees with a full evaluation."""
+    previous_snapshot = create_snapshot(
+        areas=("office", "master_bedroom", "guest_bedroom", "kitchen"),
+        target_temperatures=(70.0, 70.0, 68.0, 73.5),
+        actual_temperatures=(70.0, 70.9, 69.2, 73.0),
+        is_bedrooms=(False, True, True, False),
+        is_availables=(True, True, True, True),
+        is_night_time=is_night_time,
+        control_central_thermostat=control_central_thermostat,
+    )
+    target_temperatures = list(previous_snapshot.target_temperatures)
+    actual_temperatures = list(previous_snapshot.actual_temperatures)
+    is_availables = list(previous_snapshot.is_availables)
+    target_temperatures[index] = target_temperature
+    actual_temperatures[index] = actual_temperature
+    is_availables[index] = target_temperature is not None
+    snapshot = replace(
+        previous_snapshot,
+        target_temperatures=tuple(target_temperatures),
+        actual_temperatures=tuple(actual_temperatures),
+        is_availables=tuple(is_availables),
+    )
+
+    previous_plan = evaluate_house(previous_snapshot)
+
+    plan = evaluate_zones(snapshot, [index], previous_snapshot, previous_plan)
+
+    assert plan == evaluate_house(snapshot, previous_snapshot, previous_plan)
+
+
+def test_evaluate_zones_reuses_other_areas() -> None:
+    """Test areas that were not re-evaluated keep their previous decision."""
+    previous_snapshot = create_snapshot()
+    previous_plan = evaluate_house(previous_snapshot)
+    previous_plan = replace(
+        previous_plan, cover_services=(SERVICE_CLOSE_COVER, SERVICE_OPEN_COVER)
+    )
+
+    plan = evaluate_zones(
+        create_snapshot(target_temperatures=(72.0, 70.0)),
+        [0],
+        previous_snapshot,
+        previous_plan,
+    )
+
+    assert plan.cover_services == (SERVICE_OPEN_COVER, SERVICE_OPEN_COVER)
+
+
+def test_evaluate_zones_full_pass_on_house_input_change() -> None:
+    """Test a house-wide change falls back to a full evaluation."""
+    previous_snapshot = create_snapshot()
+    previous_plan = HousePlan(
+        (SERVICE_CLOSE_COVER, SERVICE_OPEN_COVER),
+        ACTIVE,
+        70.0,
+        (True, False),
+        (None, None),
+        (None, None),
+        (None, None),
+    )
+    snapshot = create_snapshot(hvac_mode=HVACMode.COOL)
+
+    plan = evaluate_zones(snapshot, [0], previous_snapshot, previous_plan)
+
+    assert plan == evaluate_house(snapshot, previous_snapshot, previous_plan)
+
+
+def test_evaluate_zones_central_temperature_change() -> None:
+    """Test a central temperature change only recomputes the central setpoint."""
+    previous_snapshot = create_snapshot()
+    previous_plan = HousePlan(
+        (SERVICE_CLOSE_COVER, SERVICE_OPEN_COVER),
+        ACTIVE,
+        70.0,
+        (True, False),
+        (None, None),
+        (None, None),
+        (None, None),
+    )
+
+    plan = evaluate_zones(
+        create_snapshot(central_actual_temperature=69.0),
+        [],
+        previous_snapshot,
+        previous_plan,
+    )
+
+    assert plan == replace(previous_plan, central_setpoint=71.0)
+
+
+@pytest.mark.parametrize(
+    ("need", "previous_need", "actual_temperature", "expected_need"),
+    [
+        (True, None, 69.8, True),
+        (True, False, 69.8, False),
+        (True, False, 69.5, True),
+        (False, True, 70.2, True),
+        (False, True, 70.5, False),
+        (False, False, 70.2, False),
+    ],
+)
+def test_determine_hysteresis_need(
+    need, previous_need, actual_temperature, expected_need
+) -> None:
+    """Test a need only flips once the area is hysteresis away from target."""
+    assert (
+        determine_hysteresis_need(need, previous_need, 70.0, actual_temperature, 0.5)
+        is expected_need
+    )
+
+
+@pytest.mark.parametrize(
+    ("service", "previous_service", "changed_at", "expected"),
+    [
+        (
+            SERVICE_OPEN_COVER,
+            SERVICE_OPEN_COVER,
+            NOW - timedelta(minutes=1),
+            (SERVICE_OPEN_COVER, NOW - timedelta(minutes=1), None),
+        ),
+        (
+            SERVICE_CLOSE_COVER,
+            SERVICE_OPEN_COVER,
+            NOW - timedelta(minutes=1),
+            (
+                SERVICE_OPEN_COVER,
+                NOW - timedelta(minutes=1),
+                NOW + timedelta(minutes=4),
+            ),
+        ),
+        (
+            SERVICE_CLOSE_COVER,
+            SERVICE_OPEN_COVER,
+            NOW - timedelta(minutes=5),
+            (SERVICE_CLOSE_COVER, NOW, None),
+        ),
+        (
+            SERVICE_CLOSE_COVER,
+            SERVICE_OPEN_COVER,
+            None,
+            (SERVICE_CLOSE_COVER, NOW, None),
+        ),
+        (SERVICE_CLOSE_COVER, None, None, (SERVICE_CLOSE_COVER, None, None)),
+        (None, SERVICE_OPEN_COVER, NOW, (None, NOW, None)),
+    ],
+)
+def test_determine_dwell_cover_service(
+    service, previous_service, changed_at, expected
+) -> None:
+    """Test a cover service is held until it has dwelled long enough."""
+    assert (
+        determine_dwell_cover_service(
+            service, previous_service, changed_at, NOW, timedelta(minutes=5)
+        )
+        == expected
+    )
+
+
+def test_evaluate_house_hysteresis_and_dwell() -> None:
+    """Test a boundary area neither flips its need nor its vent early."""
+    previous_snapshot = create_snapshot(
+        hystereses=(0.5, 0.5), min_dwells=(timedelta(minutes=5),) * 2
+    )
+    previous_plan = replace(
+        evaluate_house(previous_snapshot),
+        cover_changed_ats=(NOW - timedelta(minutes=1), None),
+    )
+
+    plan = evaluate_house(
+        replace(previous_snapshot, actual_temperatures=(71.2, 70.0)),
+        previous_snapshot,
+        previous_plan,
+    )
+
+    assert plan.needs == (True, False)
+
+    plan = evaluate_house(
+        replace(previous_snapshot, actual_temperatures=(71.5, 69.0)),
+        previous_snapshot,
+        previous_plan,
+    )
+
+    assert plan.needs == (False, True)
+    assert plan.thermostat_action == ACTIVE
+    assert plan.cover_services == (SERVICE_OPEN_COVER, SERVICE_OPEN_COVER)
+    assert plan.cover_changed_ats == (NOW - timedelta(minutes=1), NOW)
+    assert plan.held_untils == (NOW + timedelta(minutes=4), None)
+
+
+def test_evaluate_house_dwell_keeps_a_vent_open_while_active() -> None:
+    """Test the minimum dwell never holds every vent closed while active."""
+    snapshot = create_snapshot(
+        actual_temperatures=(70.0, 69.0),
+        min_dwells=(timedelta(minutes=5),) * 2,
+        now=NOW - timedelta(minutes=2),
+    )
+    plan = evaluate_house(snapshot)
+    previous_snapshot = replace(
+        snapshot, actual_temperatures=(71.0, 69.0), now=NOW - timedelta(minutes=1)
+    )
+    previous_plan = evaluate_house(previous_snapshot, snapshot, plan)
+
+    assert previous_plan.cover_services == (SERVICE_CLOSE_COVER, SERVICE_OPEN_COVER)
+
+    snapshot = replace(previous_snapshot, actual_temperatures=(70.0, 70.0), now=NOW)
+    plan = evaluate_house(snapshot, previous_snapshot, previous_plan)
+
+    assert plan.thermostat_action == ACTIVE
+    assert plan.central_setpoint == 70.0
+    assert plan.cover_services == (SERVICE_OPEN_COVER, SERVICE_CLOSE_COVER)
+    assert plan.cover_changed_ats == (NOW, NOW)
+    assert plan.held_untils == (None, None)
+    assert evaluate_zones(snapshot, [0, 1], previous_snapshot, previous_plan) == plan
+
+
+@pytest.mark.parametrize(
+    ("target_temperature", "actual_temperature", "hvac_mode", "tolerance", "expected"),
+    [
+        (72.0, 71.9, HVACMode.HEAT, None, True),
+        (72.0, 72.9, HVACMode.HEAT, None, False),
+        (71.9, 71.0, HVACMode.HEAT, None, False),
+        (72.0, 71.0, HVACMode.HEAT, 0.1, True),
+        (72.0, 71.9, HVACMode.HEAT, 0.1, False),
+        (72.0, 71.85, HVACMode.HEAT, 0.1, True),
+        (21.5, 21.0, HVACMode.HEAT, 0.1, True),
+        (21.5, 21.9, HVACMode.COOL, None, False),
+        (21.5, 21.9, HVACMode.COOL, 0.1, True),
+        (21.5, 21.55, HVACMode.COOL, 0.1, False),
+        (None, 21.0, HVACMode.HEAT, 0.1, True),
+        (21.5, 21.0, HVACMode.OFF, 0.1, True),
+    ],
+)
+def test_determine_need(
+    target_temperature, actual_temperature, hvac_mode, tolerance, expected
+) -> None:
+    """Test precise comparison resolves fractions that truncation loses."""
+    assert (
+        determine_need(target_temperature, actual_temperature, hvac_mode, tolerance)
+        is expected
+    )
+
+
+@pytest.mark.parametrize(
+    ("positions", "min_open_area", "expected_positions"),
+    [
+        ((100, 0, None), 30, (100, 0, None)),
+        ((20, 0, 10, 0), 30, (30, 30, 30, 30)),
+        ((100, 0, 10, 0), 50, (100, 34, 34, 34)),
+        ((60, 0, None), 50, (60, 40, None)),
+        ((None, None), 50, (None, None)),
+    ],
+)
+def test_enforce_min_open_area(positions, min_open_area, expected_positions) -> None:
+    """Test the most closed vents are opened to reach the minimum open area."""
+    assert enforce_min_open_area(positions, min_open_area) == expected_positions
+
+
+def test_evaluate_house_proportional_vents() -> None:
+    """Test vents open in proportion to their area's temperature error."""
+    snapshot = create_snapshot(
+        areas=("office", "kitchen", "master_bedroom"),
+        target_temperatures=(72.0, 71.0, 70.0),
+        actual_temperatures=(71.5, 68.0, 70.0),
+        is_bedrooms=(False, False, True),
+        is_availables=(True, True, True),
+        temperature_tolerance=0.1,
+        proportional_band=2.0,
+        min_open_area=30,
+    )
+
+    plan = evaluate_house(snapshot)
+
+    assert plan.cover_services == (
+        SERVICE_OPEN_COVER,
+        SERVICE_OPEN_COVER,
+        SERVICE_CLOSE_COVER,
+    )
+    assert plan.cover_positions == (25, 100, 0)
+
+    plan = evaluate_house(replace(snapshot, min_open_area=50))
+
+    assert plan.cover_positions == (25, 100, 25)
+
+
+def test_evaluate_zones_proportional_vents() -> None:
+    """Test re-evaluating one area recomputes every proportional position."""
+    previous_snapshot = create_snapshot(
+        temperature_tolerance=0.1, proportional_band=2.0, min_open_area=50
+    )
+    previous_plan = evaluate_house(previous_snapshot)
+    snapshot = create_snapshot(
+        actual_temperatures=(70.5, 69.5),
+        temperature_tolerance=0.1,
+        proportional_band=2.0,
+        min_open_area=50,
+    )
+
+    plan = evaluate_zones(snapshot, [0, 1], previous_snapshot, previous_plan)
+
+    assert plan == evaluate_house(snapshot, previous_snapshot, previous_plan)
+    assert plan.cover_positions == (50, 50)
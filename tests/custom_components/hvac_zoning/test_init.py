@@ -1,40 +1,114 @@
 """Test init."""
 
-from unittest.mock import MagicMock, call
+from datetime import datetime, time, timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 from homeassistant import core
-from homeassistant.components.climate import SERVICE_SET_TEMPERATURE, HVACMode
+from homeassistant.components.climate import SERVICE_SET_TEMPERATURE
+from homeassistant.components.cover import (
+    ATTR_CURRENT_POSITION,
+    ATTR_POSITION,
+    CoverEntityFeature,
+)
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    ATTR_SUPPORTED_FEATURES,
     ATTR_TEMPERATURE,
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_STATE_CHANGED,
     SERVICE_CLOSE_COVER,
     SERVICE_OPEN_COVER,
+    SERVICE_SET_COVER_POSITION,
     STATE_CLOSED,
     STATE_OFF,
     STATE_ON,
+    STATE_OPEN,
     Platform,
 )
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import entity_registry as er
+from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.helpers import area_registry as ar, entity_registry as er
+import homeassistant.util.dt as dt_util
+from homeassistant.util.unit_system import US_CUSTOMARY_SYSTEM
 import pytest
 
 from custom_components.hvac_zoning import (
-    adjust_house,
+    async_adjust_house,
+    async_remove_entry,
     async_setup_entry,
-    determine_action,
-    determine_change_in_temperature,
-    determine_cover_service_to_call,
-    determine_if_night_time_mode,
+    build_routing_index,
+    determine_actual_temperature,
+    determine_if_command_needed,
+    determine_if_temperature_moved,
     determine_is_night_time,
-    filter_to_bedrooms,
     get_all_cover_entity_ids,
     get_all_temperature_entity_ids,
+    get_area_thermostat_entity_id,
+)
+from custom_components.hvac_zoning.const import (
+    CONF_CONTROLLER,
+    CONF_EVALUATION_WINDOW,
+    CONF_MIN_DWELL,
+    CONF_PROFILE_STARTUP,
+    CONF_TEMPERATURE_DEADBAND,
+    CONF_VENT_MODE,
+    CONTROLLER_PID,
+    CONTROLLER_STATE_SAVE_DELAY,
+    CONTROLLER_STATE_STORAGE_KEY,
+    DEFAULT_EVALUATION_MAX_LATENCY,
+    DOMAIN,
+    ROLE_AREA_THERMOSTAT,
+    ROLE_CENTRAL_THERMOSTAT,
+    ROLE_CONNECTIVITY,
+    ROLE_TEMPERATURE,
+    THERMAL_MODEL_STORAGE_KEY,
+    TRIGGER_CONFIG,
+    TRIGGER_CONNECTIVITY,
+    TRIGGER_DWELL,
+    TRIGGER_STARTED,
+    TRIGGER_TEMPERATURE,
+    TRIGGER_THERMOSTAT,
+    VENT_MODE_PROPORTIONAL,
+)
+from custom_components.hvac_zoning.controller import PIDController
+from custom_components.hvac_zoning.models import HVACZoningConfig, get_system_data
+from tests.common import MockConfigEntry, async_fire_time_changed
+
+
+async def async_wait_for_evaluation(hass: HomeAssistant) -> None:
+    """Advance time past the evaluation window and wait for the evaluation."""
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=DEFAULT_EVALUATION_MAX_LATENCY)
+    )
+    await hass.async_block_till_done()
+
+
+@pytest.mark.parametrize(
+    ("temperature", "evaluated_temperature", "expected_is_moved"),
+    [
+        ("70.2", 70.0, False),
+        ("69.7", 70.0, True),
+        ("70.3", 70.0, True),
+        ("unavailable", 70.0, True),
+        ("70.0", None, True),
+    ],
 )
-from custom_components.hvac_zoning.const import ACTIVE, DOMAIN, IDLE
-from tests.common import MockConfigEntry
+def test_determine_if_temperature_moved(
+    temperature, evaluated_temperature, expected_is_moved
+) -> None:
+    """Test determine if temperature moved."""
+    is_moved = determine_if_temperature_moved(
+        core.State("sensor.office_temperature", temperature),
+        evaluated_temperature,
+        0.3,
+    )
+
+    assert is_moved is expected_is_moved
 
 
 def test_get_all_cover_entity_ids() -> None:
@@ -85,140 +159,34 @@ def test_get_all_temperature_entity_ids() -> None:
     ]
 
 
-@pytest.mark.parametrize(
-    ("areas", "expected_result"),
-    [
-        ({"office": {"bedroom": True}}, True),
-        ({"upstairs_bathroom": {"bedroom": False}}, False),
-        ({"office": {"bedroom": True}, "upstairs_bathroom": {"bedroom": False}}, True),
-        (
-            {"office": {"bedroom": False}, "upstairs_bathroom": {"bedroom": False}},
-            False,
-        ),
-        ({}, False),
-    ],
-)
-def test_determine_if_night_time_mode(areas, expected_result) -> None:
-    """Test determine if night time mode."""
-    is_night_time_mode = determine_if_night_time_mode(areas)
-    assert is_night_time_mode == expected_result
-
-
-@pytest.mark.parametrize(
-    ("target_temperature", "actual_temperature", "hvac_mode", "expected_action"),
-    [
-        (73, 71, HVACMode.HEAT, ACTIVE),
-        (70, 71, HVACMode.COOL, ACTIVE),
-        (73, "71.52", HVACMode.HEAT, ACTIVE),
-        (70, "71.52", HVACMode.COOL, ACTIVE),
-        ("73.1", 71, HVACMode.HEAT, ACTIVE),
-        ("70.1", 71, HVACMode.COOL, ACTIVE),
-        (71, 73, HVACMode.HEAT, IDLE),
-        (71, 70, HVACMode.COOL, IDLE),
-        ("71.52", 73, HVACMode.HEAT, IDLE),
-        ("71.52", 70, HVACMode.COOL, IDLE),
-        (71, "73.1", HVACMode.HEAT, IDLE),
-        (71, "70.1", HVACMode.COOL, IDLE),
-    ],
-)
-def test_determine_action(
-    target_temperature, actual_temperature, hvac_mode, expected_action
-) -> None:
-    """Test determine action."""
-    action = determine_action(target_temperature, actual_temperature, hvac_mode)
-    assert action == expected_action
+now = datetime(2024, 1, 1, 12, 0, 0)
 
 
 @pytest.mark.parametrize(
-    (
-        "target_temperature",
-        "actual_temperature",
-        "hvac_mode",
-        "thermostat_action",
-        "is_night_time_mode",
-        "is_night_time",
-        "is_bedroom",
-        "control_central_thermostat",
-        "expected_service",
-    ),
+    ("is_in_target_state", "target", "last_command", "expected_result"),
     [
-        (71, 70, HVACMode.HEAT, None, False, False, False, True, SERVICE_OPEN_COVER),
-        (69, 70, HVACMode.HEAT, None, False, False, False, True, SERVICE_CLOSE_COVER),
-        (70, 70, HVACMode.HEAT, None, False, False, False, True, SERVICE_CLOSE_COVER),
-        (69, 70, HVACMode.COOL, None, False, False, False, True, SERVICE_OPEN_COVER),
-        (71, 70, HVACMode.COOL, None, False, False, False, True, SERVICE_CLOSE_COVER),
-        (71, 70, None, None, False, False, False, True, SERVICE_OPEN_COVER),
+        (True, SERVICE_OPEN_COVER, None, False),
+        (False, SERVICE_OPEN_COVER, None, True),
+        (False, SERVICE_OPEN_COVER, (SERVICE_CLOSE_COVER, now), True),
+        (False, SERVICE_OPEN_COVER, (SERVICE_OPEN_COVER, now), False),
         (
-            71,
-            70,
-            HVACMode.HEAT_COOL,
-            None,
-            False,
             False,
-            False,
-            True,
             SERVICE_OPEN_COVER,
+            (SERVICE_OPEN_COVER, now - timedelta(minutes=15)),
+            True,
         ),
-        (None, 70, HVACMode.HEAT, None, False, False, False, True, SERVICE_OPEN_COVER),
-        (70, None, HVACMode.HEAT, None, False, False, False, True, SERVICE_OPEN_COVER),
-        (None, 70, HVACMode.COOL, None, False, False, False, True, SERVICE_OPEN_COVER),
-        (70, None, HVACMode.COOL, None, False, False, False, True, SERVICE_OPEN_COVER),
-        (70, 70, HVACMode.COOL, IDLE, False, False, False, True, SERVICE_OPEN_COVER),
-        (70, 70, HVACMode.COOL, None, True, True, True, True, SERVICE_OPEN_COVER),
-        (70, 70, HVACMode.COOL, None, True, True, False, True, SERVICE_CLOSE_COVER),
-        (70, 70, HVACMode.COOL, None, True, False, False, True, SERVICE_CLOSE_COVER),
-        (70, 70, HVACMode.COOL, None, False, False, False, True, SERVICE_CLOSE_COVER),
-        (70, 70, HVACMode.COOL, None, False, True, False, True, SERVICE_CLOSE_COVER),
-        (70, 70, HVACMode.COOL, None, False, True, True, True, SERVICE_CLOSE_COVER),
-        (71, 70, HVACMode.COOL, IDLE, False, False, False, False, SERVICE_CLOSE_COVER),
-    ],
-)
-def test_determine_cover_service_to_call(
-    target_temperature,
-    actual_temperature,
-    hvac_mode,
-    thermostat_action,
-    is_night_time_mode,
-    is_night_time,
-    is_bedroom,
-    control_central_thermostat,
-    expected_service,
-) -> None:
-    """Test determine cover service."""
-    service = determine_cover_service_to_call(
-        target_temperature,
-        actual_temperature,
-        hvac_mode,
-        thermostat_action,
-        is_night_time_mode,
-        is_night_time,
-        is_bedroom,
-        control_central_thermostat,
-    )
-
-    assert service == expected_service
-
-
-@pytest.mark.parametrize(
-    ("target_temperature", "hvac_mode", "action", "expected_change_in_temperature"),
-    [
-        (68, HVACMode.HEAT, ACTIVE, 70),
-        (68, HVACMode.COOL, ACTIVE, 66),
-        (68, HVACMode.OFF, ACTIVE, 68),
-        (68, HVACMode.HEAT, IDLE, 66),
-        (68, HVACMode.COOL, IDLE, 70),
-        (68, HVACMode.HEAT_COOL, ACTIVE, 68),
-        (68, HVACMode.OFF, IDLE, 68),
+        (False, 70, (70, now - timedelta(minutes=1)), False),
+        (False, 70, (72, now - timedelta(minutes=1)), True),
     ],
 )
-def test_determine_change_in_temperature(
-    target_temperature, hvac_mode, action, expected_change_in_temperature
+def test_determine_if_command_needed(
+    is_in_target_state, target, last_command, expected_result
 ) -> None:
-    """Test determine change in temperature."""
-    change_in_temperature = determine_change_in_temperature(
-        target_temperature, hvac_mode, action
+    """Test determine if command needed."""
+    assert (
+        determine_if_command_needed(is_in_target_state, target, last_command, now)
+        is expected_result
     )
-    assert change_in_temperature == expected_change_in_temperature
 
 
 @pytest.mark.parametrize(
@@ -237,43 +205,13 @@ def test_determine_is_night_time(
 ) -> None:
     """Test determine is night time."""
     with freeze_time(test_date):
-        is_night_time = determine_is_night_time(bed_time, wake_time)
+        is_night_time = determine_is_night_time(
+            time.fromisoformat(bed_time), time.fromisoformat(wake_time)
+        )
 
         assert is_night_time is expected_result
 
 
-@pytest.mark.parametrize(
-    ("areas", "expected_result"),
-    [
-        (
-            {
-                "office": {
-                    "covers": ["cover.office_vent"],
-                    "temperature": "sensor.office_temperature",
-                    "bedroom": False,
-                },
-                "upstairs_bathroom": {
-                    "covers": ["cover.upstairs_bathroom_vent"],
-                    "temperature": "sensor.upstairs_bathroom_temperature",
-                    "bedroom": True,
-                },
-            },
-            {
-                "upstairs_bathroom": {
-                    "covers": ["cover.upstairs_bathroom_vent"],
-                    "temperature": "sensor.upstairs_bathroom_temperature",
-                    "bedroom": True,
-                },
-            },
-        ),
-        ({}, {}),
-    ],
-)
-def test_filter_to_bedrooms(areas, expected_result) -> None:
-    """Test filter to bedrooms."""
-    assert filter_to_bedrooms(areas) == expected_result
-
-
 central_thermostat_entity_id = "climate.living_room_thermostat"
 cover_entity_id = "cover.master_bedroom_vent"
 cover_connectivity_entity_id = "binary_sensor.status"
@@ -298,6 +236,61 @@ data = {
 }
 
 
+async def test_get_area_thermostat_entity_id(hass: HomeAssistant) -> None:
+    """Test area thermostat entity ids are resolved once and then cached."""
+    entity_registry = er.async_get(hass)
+    entity_registry.async_get_or_create(
+        "climate",
+        DOMAIN,
+        "master_bedroom_thermostat",
+        suggested_object_id="master_bedroom_thermostat",
+    )
+    area_thermostat_entity_ids: dict[str, str | None] = {}
+
+    entity_id = get_area_thermostat_entity_id(
+        hass, area_thermostat_entity_ids, "master_bedroom"
+    )
+
+    assert entity_id == area_target_temperature_entity_id
+    assert area_thermostat_entity_ids == {
+        "master_bedroom": area_target_temperature_entity_id
+    }
+
+    with patch(
+        "custom_components.hvac_zoning.async_get_entity_registry"
+    ) as mock_async_get_entity_registry:
+        entity_id = get_area_thermostat_entity_id(
+            hass, area_thermostat_entity_ids, "master_bedroom"
+        )
+
+    assert entity_id == area_target_temperature_entity_id
+    mock_async_get_entity_registry.assert_not_called()
+
+
+async def test_build_routing_index(hass: HomeAssistant) -> None:
+    """Test build routing index."""
+    entity_registry = er.async_get(hass)
+    entity_registry.async_get_or_create(
+        "climate",
+        DOMAIN,
+        "master_bedroom_thermostat",
+        suggested_object_id="master_bedroom_thermostat",
+    )
+
+    routing_index = build_routing_index(
+        hass, HVACZoningConfig.from_config_entry_data(data)
+    )
+
+    assert routing_index == {
+        central_thermostat_entity_id: (ROLE_CENTRAL_THERMOSTAT, "main_floor"),
+        cover_connectivity_entity_id: (ROLE_CONNECTIVITY, "master_bedroom"),
+        area_target_temperature_entity_id: (ROLE_AREA_THERMOSTAT, "master_bedroom"),
+        area_actual_temperature_entity_id: (ROLE_TEMPERATURE, "master_bedroom"),
+    }
+    with pytest.raises(TypeError):
+        routing_index["sensor.unrelated"] = (ROLE_CONNECTIVITY, "master_bedroom")
+
+
 async def test_adjust_house(hass: HomeAssistant) -> None:
     """Test adjust house."""
 
@@ -314,7 +307,7 @@ async def test_adjust_house(hass: HomeAssistant) -> None:
     )
     hass.states.async_set(
         entity_id=cover_entity_id,
-        new_state="open",
+        new_state=STATE_CLOSED,
     )
     hass.states.async_set(
         entity_id=area_actual_temperature_entity_id,
@@ -337,16 +330,16 @@ async def test_adjust_house(hass: HomeAssistant) -> None:
         },
     )
     await hass.async_block_till_done()
-    hass.services = MagicMock()
+    hass.services = MagicMock(async_call=AsyncMock())
 
-    adjust_house(hass, config_entry)
+    await async_adjust_house(hass, config_entry)
 
-    hass.services.call.assert_has_calls(
+    hass.services.async_call.assert_has_calls(
         [
             call(
                 Platform.COVER,
                 SERVICE_OPEN_COVER,
-                service_data={ATTR_ENTITY_ID: cover_entity_id},
+                service_data={ATTR_ENTITY_ID: [cover_entity_id]},
             ),
             call(
                 Platform.CLIMATE,
@@ -360,6 +353,55 @@ async def test_adjust_house(hass: HomeAssistant) -> None:
     )
 
 
+async def test_adjust_house_controller_sets_setpoint(hass: HomeAssistant) -> None:
+    """Test the configured controller computes the central setpoint."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=data,
+    )
+    hass.states.async_set(
+        entity_id=central_thermostat_entity_id,
+        new_state="heat",
+        attributes={
+            "current_temperature": 68,
+        },
+    )
+    hass.states.async_set(
+        entity_id=area_actual_temperature_entity_id,
+        new_state=70,
+    )
+    entity_registry = er.async_get(hass)
+    entity_registry.async_get_or_create(
+        "climate",
+        DOMAIN,
+        "master_bedroom_thermostat",
+        suggested_object_id="master_bedroom_thermostat",
+    )
+    hass.states.async_set(
+        entity_id="climate.master_bedroom_thermostat",
+        new_state=None,
+        attributes={
+            "temperature": 71,
+        },
+    )
+    await hass.async_block_till_done()
+    hass.services = MagicMock(async_call=AsyncMock())
+    get_system_data(
+        hass, config_entry, central_thermostat_entity_id
+    ).controller = PIDController(kp=1.0, ki=0.0, kd=0.0, max_offset=4.0)
+
+    await async_adjust_house(hass, config_entry)
+
+    hass.services.async_call.assert_any_call(
+        Platform.CLIMATE,
+        SERVICE_SET_TEMPERATURE,
+        service_data={
+            ATTR_ENTITY_ID: central_thermostat_entity_id,
+            ATTR_TEMPERATURE: 69,
+        },
+    )
+
+
 async def test_adjust_house_control_central_thermostat_false(
     hass: HomeAssistant,
 ) -> None:
@@ -380,7 +422,7 @@ async def test_adjust_house_control_central_thermostat_false(
     )
     hass.states.async_set(
         entity_id=cover_entity_id,
-        new_state="open",
+        new_state=STATE_CLOSED,
     )
     hass.states.async_set(
         entity_id=area_actual_temperature_entity_id,
@@ -403,22 +445,99 @@ async def test_adjust_house_control_central_thermostat_false(
         },
     )
     await hass.async_block_till_done()
-    hass.services = MagicMock()
+    hass.services = MagicMock(async_call=AsyncMock())
 
-    adjust_house(hass, config_entry)
+    await async_adjust_house(hass, config_entry)
 
-    assert hass.services.call.call_count == 1
-    hass.services.call.assert_has_calls(
+    assert hass.services.async_call.call_count == 1
+    hass.services.async_call.assert_has_calls(
         [
             call(
                 Platform.COVER,
                 SERVICE_OPEN_COVER,
-                service_data={ATTR_ENTITY_ID: cover_entity_id},
+                service_data={ATTR_ENTITY_ID: [cover_entity_id]},
             )
         ]
     )
 
 
+async def test_async_adjust_house_batches_cover_service_calls(
+    hass: HomeAssistant,
+) -> None:
+    """Test covers are grouped into one service call per cover service."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            **data,
+            "areas": {
+                **data["areas"],
+                "office": {
+                    "covers": ["cover.office_vent", "cover.office_vent_2"],
+                    "temperature": "sensor.office_temperature",
+                    "bedroom": False,
+                },
+                "kitchen": {
+                    "covers": ["cover.kitchen_vent"],
+                    "temperature": "sensor.kitchen_temperature",
+                    "bedroom": False,
+                },
+            },
+            "control_central_thermostat": False,
+        },
+    )
+    hass.states.async_set(
+        entity_id=central_thermostat_entity_id,
+        new_state="heat",
+        attributes={
+            "current_temperature": 68,
+        },
+    )
+    entity_registry = er.async_get(hass)
+    for area_name, actual_temperature, target_temperature in (
+        ("master_bedroom", 70, 71),
+        ("office", 70, 71),
+        ("kitchen", 72, 71),
+    ):
+        hass.states.async_set(f"sensor.{area_name}_temperature", actual_temperature)
+        entity_registry.async_get_or_create(
+            "climate",
+            DOMAIN,
+            f"{area_name}_thermostat",
+            suggested_object_id=f"{area_name}_thermostat",
+        )
+        hass.states.async_set(
+            f"climate.{area_name}_thermostat",
+            None,
+            {"temperature": target_temperature},
+        )
+    await hass.async_block_till_done()
+    hass.services = MagicMock(async_call=AsyncMock())
+
+    await async_adjust_house(hass, config_entry)
+
+    assert hass.services.async_call.call_count == 2
+    hass.services.async_call.assert_has_calls(
+        [
+            call(
+                Platform.COVER,
+                SERVICE_OPEN_COVER,
+                service_data={
+                    ATTR_ENTITY_ID: [
+                        cover_entity_id,
+                        "cover.office_vent",
+                        "cover.office_vent_2",
+                    ]
+                },
+            ),
+            call(
+                Platform.COVER,
+                SERVICE_CLOSE_COVER,
+                service_data={ATTR_ENTITY_ID: ["cover.kitchen_vent"]},
+            ),
+        ]
+    )
+
+
 async def test_async_setup_entry(hass: HomeAssistant) -> None:
     """Test async setup entry."""
     config_entry = MockConfigEntry(
@@ -436,14 +555,14 @@ async def test_async_setup_entry(hass: HomeAssistant) -> None:
     )
     hass.states.async_set(
         entity_id=cover_entity_id,
-        new_state="open",
+        new_state=STATE_CLOSED,
     )
     hass.states.async_set(
         entity_id=area_actual_temperature_entity_id,
         new_state=69,
     )
     await hass.async_block_till_done()
-    hass.services = MagicMock()
+    hass.services = MagicMock(async_call=AsyncMock())
 
     await async_setup_entry(hass, config_entry)
 
@@ -453,6 +572,8 @@ async def test_async_setup_entry(hass: HomeAssistant) -> None:
     )
     assert actual_thermostat_entity_id is not None
 
+    hass.services.reset_mock()
+
     hass.states.async_set(
         entity_id=actual_thermostat_entity_id,
         new_state=None,
@@ -460,28 +581,15 @@ async def test_async_setup_entry(hass: HomeAssistant) -> None:
             "temperature": 70,
         },
     )
-    await hass.async_block_till_done()
-    hass.services.reset_mock()
-
-    hass.bus.async_fire(
-        EVENT_STATE_CHANGED,
-        {
-            ATTR_ENTITY_ID: actual_thermostat_entity_id,
-            "old_state": core.State(
-                actual_thermostat_entity_id,
-                71,
-            ),
-        },
-    )
-    await hass.async_block_till_done()
+    await async_wait_for_evaluation(hass)
 
-    assert hass.services.call.call_count == 2
-    hass.services.call.assert_has_calls(
+    assert hass.services.async_call.call_count == 2
+    hass.services.async_call.assert_has_calls(
         [
             call(
                 Platform.COVER,
                 SERVICE_OPEN_COVER,
-                service_data={ATTR_ENTITY_ID: cover_entity_id},
+                service_data={ATTR_ENTITY_ID: [cover_entity_id]},
             ),
             call(
                 Platform.CLIMATE,
@@ -495,6 +603,63 @@ async def test_async_setup_entry(hass: HomeAssistant) -> None:
     )
 
 
+async def test_async_setup_entry_suppresses_redundant_commands(
+    hass: HomeAssistant,
+) -> None:
+    """Test commands already sent are not repeated on the next trigger."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=data,
+        state=ConfigEntryState.LOADED,
+    )
+    config_entry.add_to_hass(hass)
+    hass.states.async_set(
+        entity_id=central_thermostat_entity_id,
+        new_state="heat",
+        attributes={
+            "current_temperature": 68,
+        },
+    )
+    hass.states.async_set(
+        entity_id=cover_entity_id,
+        new_state=STATE_CLOSED,
+    )
+    hass.states.async_set(
+        entity_id=area_actual_temperature_entity_id,
+        new_state=69,
+    )
+    await hass.async_block_till_done()
+    hass.services = MagicMock(async_call=AsyncMock())
+
+    await async_setup_entry(hass, config_entry)
+
+    hass.states.async_set(
+        entity_id=area_target_temperature_entity_id,
+        new_state=None,
+        attributes={
+            "temperature": 70,
+        },
+    )
+    await async_wait_for_evaluation(hass)
+    hass.services.reset_mock()
+
+    hass.states.async_set(
+        entity_id=central_thermostat_entity_id,
+        new_state="heat",
+        attributes={
+            "current_temperature": 68,
+            "temperature": 69,
+        },
+    )
+    await async_wait_for_evaluation(hass)
+
+    assert hass.services.async_call.call_count == 0
+    runtime_data = hass.data[DOMAIN][config_entry.entry_id]
+    assert runtime_data.commands_issued == 2
+    # A central temperature change only reconciles the central setpoint.
+    assert runtime_data.commands_suppressed == 1
+
+
 async def test_async_setup_entry_damper_wake(hass: HomeAssistant) -> None:
     """Test async setup entry."""
     config_entry = MockConfigEntry(
@@ -518,7 +683,7 @@ async def test_async_setup_entry_damper_wake(hass: HomeAssistant) -> None:
         new_state=69,
     )
     await hass.async_block_till_done()
-    hass.services = MagicMock()
+    hass.services = MagicMock(async_call=AsyncMock())
 
     await async_setup_entry(hass, config_entry)
 
@@ -554,28 +719,26 @@ async def test_async_setup_entry_damper_wake(hass: HomeAssistant) -> None:
     )
     await hass.async_block_till_done()
 
-    assert hass.services.call.call_count == 1
-    hass.services.call.assert_has_calls(
+    assert hass.services.async_call.call_count == 1
+    hass.services.async_call.assert_has_calls(
         [
             call(
                 Platform.COVER,
                 SERVICE_OPEN_COVER,
-                service_data={ATTR_ENTITY_ID: cover_entity_id},
+                service_data={ATTR_ENTITY_ID: [cover_entity_id]},
             ),
         ]
     )
 
 
-async def test_async_setup_entry_damper_open(hass: HomeAssistant) -> None:
-    """Test async setup entry."""
+async def test_async_setup_entry_records_stats(hass: HomeAssistant) -> None:
+    """Test events and evaluations are counted by trigger."""
     config_entry = MockConfigEntry(
         domain=DOMAIN,
-        data={
-            **data,
-            "control_central_thermostat": False,
-        },
+        data=data,
         state=ConfigEntryState.LOADED,
     )
+    config_entry.add_to_hass(hass)
     hass.states.async_set(
         entity_id=central_thermostat_entity_id,
         new_state="heat",
@@ -585,25 +748,988 @@ async def test_async_setup_entry_damper_open(hass: HomeAssistant) -> None:
     )
     hass.states.async_set(
         entity_id=cover_entity_id,
-        new_state="open",
+        new_state=STATE_CLOSED,
     )
     hass.states.async_set(
-        entity_id=area_target_temperature_entity_id,
-        new_state=None,
+        entity_id=area_actual_temperature_entity_id,
+        new_state=69,
+    )
+    hass.states.async_set(
+        entity_id=cover_connectivity_entity_id,
+        new_state=STATE_OFF,
+    )
+    await hass.async_block_till_done()
+    hass.services = MagicMock(async_call=AsyncMock())
+
+    await async_setup_entry(hass, config_entry)
+    await async_wait_for_evaluation(hass)
+    stats = hass.data[DOMAIN][config_entry.entry_id].stats
+
+    hass.states.async_set(
+        entity_id=central_thermostat_entity_id,
+        new_state="heat",
         attributes={
+            "current_temperature": 68,
             "temperature": 70,
         },
     )
+    await async_wait_for_evaluation(hass)
     hass.states.async_set(
-        entity_id=area_actual_temperature_entity_id,
-        new_state=69,
+        entity_id=cover_connectivity_entity_id,
+        new_state=STATE_ON,
     )
     await hass.async_block_till_done()
-    hass.services = MagicMock()
+    hass.states.async_set(
+        entity_id=cover_connectivity_entity_id,
+        new_state=STATE_ON,
+        attributes={"rssi": -60},
+    )
+    await async_wait_for_evaluation(hass)
+
+    assert stats.events_received == 3
+    assert stats.events_routed == 2
+    assert stats.evaluations == 3
+    assert stats.evaluations_by_trigger == {
+        TRIGGER_STARTED: 1,
+        TRIGGER_THERMOSTAT: 1,
+        TRIGGER_CONNECTIVITY: 1,
+    }
+    assert stats.service_calls == hass.services.async_call.call_count
+    assert len(stats.evaluation_latencies) == 3
 
-    await async_setup_entry(hass, config_entry)
 
-    hass.bus.async_fire(
+async def test_async_setup_entry_rebuilds_config_on_update(
+    hass: HomeAssistant,
+) -> None:
+    """Test the parsed configuration is rebuilt when the entry is updated."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=data,
+        state=ConfigEntryState.LOADED,
+    )
+    config_entry.add_to_hass(hass)
+    hass.services = MagicMock(async_call=AsyncMock())
+
+    await async_setup_entry(hass, config_entry)
+    runtime_data = hass.data[DOMAIN][config_entry.entry_id]
+    config = runtime_data.config
+
+    assert config.bed_time == time(21)
+
+    hass.config_entries.async_update_entry(
+        config_entry,
+        data={
+            **data,
+            "bed_time": "22:30:00",
+            CONF_EVALUATION_WINDOW: 1.0,
+            CONF_CONTROLLER: CONTROLLER_PID,
+        },
+    )
+    await hass.async_block_till_done()
+
+    assert runtime_data.config is not config
+    assert runtime_data.config.bed_time == time(22, 30)
+    system_data = runtime_data.systems[central_thermostat_entity_id]
+    assert system_data.scheduler.window == 1.0
+    assert isinstance(system_data.controller, PIDController)
+
+
+async def test_async_setup_entry_updates_only_changed_areas(
+    hass: HomeAssistant,
+) -> None:
+    """Test an area change adds and removes only that area's thermostat."""
+    office_cover_entity_id = "cover.office_vent"
+    office_temperature_entity_id = "sensor.office_temperature"
+    office_thermostat_entity_id = "climate.office_thermostat"
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=data,
+        state=ConfigEntryState.LOADED,
+    )
+    config_entry.add_to_hass(hass)
+    hass.services = MagicMock(async_call=AsyncMock())
+
+    await async_setup_entry(hass, config_entry)
+    await hass.async_block_till_done()
+    runtime_data = hass.data[DOMAIN][config_entry.entry_id]
+    master_bedroom_state = hass.states.get(area_target_temperature_entity_id)
+
+    with patch.object(hass.config_entries, "async_reload") as mock_async_reload:
+        hass.config_entries.async_update_entry(
+            config_entry,
+            data={
+                **data,
+                "areas": {
+                    **data["areas"],
+                    "office": {
+                        "covers": [office_cover_entity_id],
+                        "temperature": office_temperature_entity_id,
+                    },
+                },
+            },
+        )
+        await hass.async_block_till_done()
+
+        assert hass.states.get(office_thermostat_entity_id) is not None
+        assert runtime_data.routing_index[office_temperature_entity_id] == (
+            ROLE_TEMPERATURE,
+            "office",
+        )
+        assert runtime_data.routing_index[office_thermostat_entity_id] == (
+            ROLE_AREA_THERMOSTAT,
+            "office",
+        )
+        assert (
+            hass.states.get(area_target_temperature_entity_id) is master_bedroom_state
+        )
+
+        hass.config_entries.async_update_entry(
+            config_entry,
+            data={
+                **data,
+                "areas": {
+                    **data["areas"],
+                    "office": {
+                        "covers": [],
+                        "temperature": office_temperature_entity_id,
+                    },
+                },
+            },
+        )
+        await hass.async_block_till_done()
+
+    mock_async_reload.assert_not_called()
+    assert hass.states.get(office_thermostat_entity_id) is None
+    assert er.async_get(hass).async_get(office_thermostat_entity_id) is None
+    assert office_temperature_entity_id not in runtime_data.routing_index
+    assert office_thermostat_entity_id not in runtime_data.routing_index
+    assert hass.states.get(area_target_temperature_entity_id) is master_bedroom_state
+    assert runtime_data.routing_index == build_routing_index(
+        hass, runtime_data.config, runtime_data.area_thermostat_entity_ids
+    )
+
+
+async def test_async_setup_entry_evaluates_after_options_flow(
+    hass: HomeAssistant,
+) -> None:
+    """Test vents added to an area by the options flow are commanded right away."""
+    hass.config.units = US_CUSTOMARY_SYSTEM
+    east_cover_entity_id = "cover.master_bedroom_east_vent"
+    master_bedroom = ar.async_get(hass).async_create("Master Bedroom")
+    entity_registry = er.async_get(hass)
+    for entity_id in (cover_entity_id, east_cover_entity_id):
+        entity = entity_registry.async_get_or_create(
+            "cover",
+            "hvac_stubs",
+            entity_id,
+            suggested_object_id=entity_id.partition(".")[2],
+            original_device_class="damper",
+            original_name=entity_id,
+        )
+        entity_registry.async_update_entity(entity.entity_id, area_id=master_bedroom.id)
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=data,
+        state=ConfigEntryState.LOADED,
+    )
+    config_entry.add_to_hass(hass)
+    hass.states.async_set(
+        entity_id=central_thermostat_entity_id,
+        new_state="heat",
+        attributes={
+            "current_temperature": 68,
+        },
+    )
+    hass.states.async_set(entity_id=cover_entity_id, new_state=STATE_OPEN)
+    hass.states.async_set(entity_id=east_cover_entity_id, new_state=STATE_CLOSED)
+    hass.states.async_set(entity_id=area_actual_temperature_entity_id, new_state=60)
+    await hass.async_block_till_done()
+    hass.services = MagicMock(async_call=AsyncMock())
+
+    await async_setup_entry(hass, config_entry)
+    await async_wait_for_evaluation(hass)
+    hass.services.reset_mock()
+
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"next_step_id": "select_area"}
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"area": master_bedroom.id}
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {"covers": [cover_entity_id, east_cover_entity_id], "bedroom": True},
+    )
+    await async_wait_for_evaluation(hass)
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    hass.services.async_call.assert_any_call(
+        Platform.COVER,
+        SERVICE_OPEN_COVER,
+        service_data={ATTR_ENTITY_ID: [east_cover_entity_id]},
+    )
+    runtime_data = hass.data[DOMAIN][config_entry.entry_id]
+    assert runtime_data.stats.evaluations_by_trigger == {
+        TRIGGER_STARTED: 1,
+        TRIGGER_CONFIG: 1,
+    }
+
+
+async def test_async_setup_entry_setpoint_change_evaluates_zone(
+    hass: HomeAssistant,
+) -> None:
+    """Test a setpoint change immediately re-evaluates only its area."""
+    hass.config.units = US_CUSTOMARY_SYSTEM
+    office_cover_entity_id = "cover.office_vent"
+    office_temperature_entity_id = "sensor.office_temperature"
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            **data,
+            "areas": {
+                **data["areas"],
+                "office": {
+                    "covers": [office_cover_entity_id],
+                    "temperature": office_temperature_entity_id,
+                    "bedroom": False,
+                },
+            },
+        },
+        state=ConfigEntryState.LOADED,
+    )
+    config_entry.add_to_hass(hass)
+    hass.states.async_set(
+        entity_id=central_thermostat_entity_id,
+        new_state="heat",
+        attributes={
+            "current_temperature": 68,
+        },
+    )
+    for entity_id in (cover_entity_id, office_cover_entity_id):
+        hass.states.async_set(entity_id=entity_id, new_state=STATE_CLOSED)
+    for entity_id in (area_actual_temperature_entity_id, office_temperature_entity_id):
+        hass.states.async_set(entity_id=entity_id, new_state=69)
+    await hass.async_block_till_done()
+    hass.services = MagicMock(async_call=AsyncMock())
+
+    await async_setup_entry(hass, config_entry)
+    await async_wait_for_evaluation(hass)
+    await async_adjust_house(hass, config_entry)
+    hass.states.async_set(entity_id=office_cover_entity_id, new_state=STATE_OPEN)
+    await hass.async_block_till_done()
+    hass.services.reset_mock()
+
+    office_thermostat_entity_id = er.async_get(hass).async_get_entity_id(
+        "climate", DOMAIN, "office_thermostat"
+    )
+    office_thermostat = hass.states.get(office_thermostat_entity_id)
+    with patch(
+        "custom_components.hvac_zoning.build_house_snapshot"
+    ) as build_house_snapshot:
+        hass.states.async_set(
+            entity_id=office_thermostat_entity_id,
+            new_state=office_thermostat.state,
+            attributes={**office_thermostat.attributes, "temperature": 65},
+        )
+        await hass.async_block_till_done()
+
+    build_house_snapshot.assert_not_called()
+    hass.services.async_call.assert_called_once_with(
+        Platform.COVER,
+        SERVICE_CLOSE_COVER,
+        service_data={ATTR_ENTITY_ID: [office_cover_entity_id]},
+    )
+
+
+async def test_async_setup_entry_temperature_change_evaluates_zone(
+    hass: HomeAssistant,
+) -> None:
+    """Test a temperature change re-evaluates only its area."""
+    hass.config.units = US_CUSTOMARY_SYSTEM
+    office_cover_entity_id = "cover.office_vent"
+    office_temperature_entity_id = "sensor.office_temperature"
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            **data,
+            "areas": {
+                **data["areas"],
+                "office": {
+                    "covers": [office_cover_entity_id],
+                    "temperature": office_temperature_entity_id,
+                    "bedroom": False,
+                },
+            },
+        },
+        state=ConfigEntryState.LOADED,
+    )
+    config_entry.add_to_hass(hass)
+    hass.states.async_set(
+        entity_id=central_thermostat_entity_id,
+        new_state="heat",
+        attributes={
+            "current_temperature": 68,
+        },
+    )
+    for entity_id in (cover_entity_id, office_cover_entity_id):
+        hass.states.async_set(entity_id=entity_id, new_state=STATE_OPEN)
+    for entity_id in (area_actual_temperature_entity_id, office_temperature_entity_id):
+        hass.states.async_set(entity_id=entity_id, new_state=69)
+    await hass.async_block_till_done()
+    hass.services = MagicMock(async_call=AsyncMock())
+
+    await async_setup_entry(hass, config_entry)
+    await async_wait_for_evaluation(hass)
+    await async_adjust_house(hass, config_entry)
+    hass.services.reset_mock()
+
+    with (
+        patch(
+            "custom_components.hvac_zoning.build_house_snapshot"
+        ) as build_house_snapshot,
+        patch(
+            "custom_components.hvac_zoning.determine_actual_temperature",
+            wraps=determine_actual_temperature,
+        ) as mock_determine_actual_temperature,
+    ):
+        hass.states.async_set(entity_id=office_temperature_entity_id, new_state=73)
+        await async_wait_for_evaluation(hass)
+
+    build_house_snapshot.assert_not_called()
+    assert hass.data[DOMAIN][config_entry.entry_id].stats.evaluations_by_trigger == {
+        TRIGGER_STARTED: 1,
+        TRIGGER_TEMPERATURE: 1,
+    }
+    mock_determine_actual_temperature.assert_called_once_with(
+        hass, office_temperature_entity_id
+    )
+    hass.services.async_call.assert_called_once_with(
+        Platform.COVER,
+        SERVICE_CLOSE_COVER,
+        service_data={ATTR_ENTITY_ID: [office_cover_entity_id]},
+    )
+
+
+async def test_async_setup_entry_multiple_central_thermostats(
+    hass: HomeAssistant,
+) -> None:
+    """Test each central thermostat conditions only its own areas."""
+    hass.config.units = US_CUSTOMARY_SYSTEM
+    basement_thermostat_entity_id = "climate.basement_thermostat"
+    basement_cover_entity_id = "cover.basement_vent"
+    basement_temperature_entity_id = "sensor.basement_temperature"
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            **data,
+            "areas": {
+                **data["areas"],
+                "basement": {
+                    "covers": [basement_cover_entity_id],
+                    "temperature": basement_temperature_entity_id,
+                    "climate": basement_thermostat_entity_id,
+                    "central_thermostat": basement_thermostat_entity_id,
+                    "bedroom": False,
+                },
+            },
+        },
+        state=ConfigEntryState.LOADED,
+    )
+    config_entry.add_to_hass(hass)
+    for entity_id, current_temperature in (
+        (central_thermostat_entity_id, 68),
+        (basement_thermostat_entity_id, 66),
+    ):
+        hass.states.async_set(
+            entity_id=entity_id,
+            new_state="heat",
+            attributes={"current_temperature": current_temperature},
+        )
+    for entity_id in (cover_entity_id, basement_cover_entity_id):
+        hass.states.async_set(entity_id=entity_id, new_state=STATE_CLOSED)
+    for entity_id in (
+        area_actual_temperature_entity_id,
+        basement_temperature_entity_id,
+    ):
+        hass.states.async_set(entity_id=entity_id, new_state=69)
+    await hass.async_block_till_done()
+    hass.services = MagicMock(async_call=AsyncMock())
+
+    await async_setup_entry(hass, config_entry)
+    await async_wait_for_evaluation(hass)
+    hass.services.reset_mock()
+    runtime_data = hass.data[DOMAIN][config_entry.entry_id]
+    for system_data in runtime_data.systems.values():
+        system_data.central_setpoint_command = None
+    runtime_data.cover_commands.clear()
+
+    await async_adjust_house(hass, config_entry)
+
+    assert list(runtime_data.systems) == [
+        central_thermostat_entity_id,
+        basement_thermostat_entity_id,
+    ]
+    for entity_id, setpoint in (
+        (central_thermostat_entity_id, 70),
+        (basement_thermostat_entity_id, 68),
+    ):
+        hass.services.async_call.assert_any_call(
+            Platform.CLIMATE,
+            SERVICE_SET_TEMPERATURE,
+            service_data={ATTR_ENTITY_ID: entity_id, ATTR_TEMPERATURE: setpoint},
+        )
+    living_room_plan = runtime_data.systems[central_thermostat_entity_id].last_plan
+    hass.services.reset_mock()
+
+    hass.states.async_set(entity_id=basement_temperature_entity_id, new_state=73)
+    await async_wait_for_evaluation(hass)
+
+    assert (
+        runtime_data.systems[central_thermostat_entity_id].last_plan is living_room_plan
+    )
+    hass.services.async_call.assert_called_once_with(
+        Platform.CLIMATE,
+        SERVICE_SET_TEMPERATURE,
+        service_data={
+            ATTR_ENTITY_ID: basement_thermostat_entity_id,
+            ATTR_TEMPERATURE: 64,
+        },
+    )
+
+
+async def test_async_setup_entry_records_stats_per_system(
+    hass: HomeAssistant,
+) -> None:
+    """Test each system's evaluation records only the triggers it was requested by."""
+    hass.config.units = US_CUSTOMARY_SYSTEM
+    basement_thermostat_entity_id = "climate.basement_thermostat"
+    basement_temperature_entity_id = "sensor.basement_temperature"
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            **data,
+            "areas": {
+                **data["areas"],
+                "basement": {
+                    "covers": ["cover.basement_vent"],
+                    "temperature": basement_temperature_entity_id,
+                    "climate": basement_thermostat_entity_id,
+                    "central_thermostat": basement_thermostat_entity_id,
+                    "bedroom": False,
+                },
+            },
+        },
+        state=ConfigEntryState.LOADED,
+    )
+    config_entry.add_to_hass(hass)
+    for entity_id in (central_thermostat_entity_id, basement_thermostat_entity_id):
+        hass.states.async_set(
+            entity_id=entity_id,
+            new_state="heat",
+            attributes={"current_temperature": 68},
+        )
+    for entity_id in (
+        area_actual_temperature_entity_id,
+        basement_temperature_entity_id,
+    ):
+        hass.states.async_set(entity_id=entity_id, new_state=69)
+    await hass.async_block_till_done()
+    hass.services = MagicMock(async_call=AsyncMock())
+
+    await async_setup_entry(hass, config_entry)
+    await async_wait_for_evaluation(hass)
+    stats = hass.data[DOMAIN][config_entry.entry_id].stats
+    stats.evaluations = 0
+    stats.evaluations_by_trigger.clear()
+
+    for entity_id in (
+        area_actual_temperature_entity_id,
+        basement_temperature_entity_id,
+    ):
+        hass.states.async_set(entity_id=entity_id, new_state=73)
+    await async_wait_for_evaluation(hass)
+
+    assert stats.evaluations == 2
+    assert stats.evaluations_by_trigger == {TRIGGER_TEMPERATURE: 2}
+
+
+async def test_async_setup_entry_ignores_temperature_within_deadband(
+    hass: HomeAssistant,
+) -> None:
+    """Test temperature changes only trigger once they exceed the deadband."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={**data, CONF_TEMPERATURE_DEADBAND: 0.5},
+        state=ConfigEntryState.LOADED,
+    )
+    config_entry.add_to_hass(hass)
+    hass.states.async_set(
+        entity_id=central_thermostat_entity_id,
+        new_state="heat",
+        attributes={
+            "current_temperature": 68,
+        },
+    )
+    hass.states.async_set(entity_id=cover_entity_id, new_state=STATE_OPEN)
+    hass.states.async_set(entity_id=area_actual_temperature_entity_id, new_state=69)
+    await hass.async_block_till_done()
+    hass.services = MagicMock(async_call=AsyncMock())
+
+    await async_setup_entry(hass, config_entry)
+    await async_wait_for_evaluation(hass)
+    await async_adjust_house(hass, config_entry)
+    stats = hass.data[DOMAIN][config_entry.entry_id].stats
+    stats.evaluations_by_trigger.clear()
+
+    for temperature in (69.2, 69.4):
+        hass.states.async_set(
+            entity_id=area_actual_temperature_entity_id, new_state=temperature
+        )
+        await async_wait_for_evaluation(hass)
+
+    assert stats.evaluations_by_trigger == {}
+
+    hass.states.async_set(entity_id=area_actual_temperature_entity_id, new_state=69.5)
+    await async_wait_for_evaluation(hass)
+
+    assert stats.evaluations_by_trigger == {TRIGGER_TEMPERATURE: 1}
+
+
+async def test_async_setup_entry_reevaluates_zone_after_min_dwell(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a vent held by its minimum dwell changes once the dwell expires."""
+    hass.config.units = US_CUSTOMARY_SYSTEM
+    office_cover_entity_id = "cover.office_vent"
+    office_temperature_entity_id = "sensor.office_temperature"
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            **data,
+            "areas": {
+                **data["areas"],
+                "office": {
+                    "covers": [office_cover_entity_id],
+                    "temperature": office_temperature_entity_id,
+                    "bedroom": False,
+                    CONF_MIN_DWELL: 300,
+                },
+            },
+        },
+        state=ConfigEntryState.LOADED,
+    )
+    config_entry.add_to_hass(hass)
+    hass.states.async_set(
+        entity_id=central_thermostat_entity_id,
+        new_state="heat",
+        attributes={
+            "current_temperature": 68,
+        },
+    )
+    for entity_id in (cover_entity_id, office_cover_entity_id):
+        hass.states.async_set(entity_id=entity_id, new_state=STATE_OPEN)
+    for entity_id in (area_actual_temperature_entity_id, office_temperature_entity_id):
+        hass.states.async_set(entity_id=entity_id, new_state=69)
+    await hass.async_block_till_done()
+    hass.services = MagicMock(async_call=AsyncMock())
+
+    await async_setup_entry(hass, config_entry)
+    await async_wait_for_evaluation(hass)
+    await async_adjust_house(hass, config_entry)
+    hass.states.async_set(entity_id=office_temperature_entity_id, new_state=73)
+    await async_wait_for_evaluation(hass)
+    hass.states.async_set(entity_id=office_cover_entity_id, new_state=STATE_CLOSED)
+    hass.states.async_set(entity_id=office_temperature_entity_id, new_state=69)
+    await async_wait_for_evaluation(hass)
+    hass.services.reset_mock()
+
+    runtime_data = hass.data[DOMAIN][config_entry.entry_id]
+    last_plan = runtime_data.systems[central_thermostat_entity_id].last_plan
+    assert last_plan.cover_services[1] == SERVICE_CLOSE_COVER
+    assert last_plan.held_untils[1] is not None
+
+    freezer.tick(timedelta(seconds=301))
+    async_fire_time_changed(hass)
+    await async_wait_for_evaluation(hass)
+
+    assert runtime_data.stats.evaluations_by_trigger[TRIGGER_DWELL] == 1
+    hass.services.async_call.assert_called_once_with(
+        Platform.COVER,
+        SERVICE_OPEN_COVER,
+        service_data={ATTR_ENTITY_ID: [office_cover_entity_id]},
+    )
+
+
+@pytest.mark.parametrize(
+    ("hvac_action", "expected_rate"), [("heating", 0.1), ("idle", None)]
+)
+async def test_async_setup_entry_learns_thermal_model(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, hvac_action, expected_rate
+) -> None:
+    """Test temperature changes teach the thermal model only while heating."""
+    hass.config.units = US_CUSTOMARY_SYSTEM
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=data,
+        state=ConfigEntryState.LOADED,
+    )
+    config_entry.add_to_hass(hass)
+    hass.states.async_set(
+        entity_id=central_thermostat_entity_id,
+        new_state="heat",
+        attributes={
+            "current_temperature": 68,
+            "hvac_action": hvac_action,
+        },
+    )
+    hass.states.async_set(entity_id=cover_entity_id, new_state=STATE_OPEN)
+    hass.states.async_set(entity_id=area_actual_temperature_entity_id, new_state=69)
+    await hass.async_block_till_done()
+    hass.services = MagicMock(async_call=AsyncMock())
+
+    await async_setup_entry(hass, config_entry)
+    await async_wait_for_evaluation(hass)
+    await async_adjust_house(hass, config_entry)
+    hass.states.async_set(entity_id=area_actual_temperature_entity_id, new_state=69.2)
+    await async_wait_for_evaluation(hass)
+    freezer.tick(timedelta(minutes=5))
+    hass.states.async_set(entity_id=area_actual_temperature_entity_id, new_state=69.7)
+    await async_wait_for_evaluation(hass)
+
+    thermal_model = hass.data[DOMAIN][config_entry.entry_id].thermal_model
+    assert thermal_model.get_rate("master_bedroom", "heat", True) == (
+        pytest.approx(expected_rate) if expected_rate is not None else None
+    )
+    assert (
+        hass.states.get("climate.master_bedroom_thermostat").attributes.get(
+            "heat_open_rate"
+        )
+        == expected_rate
+    )
+
+
+async def test_async_setup_entry_warm_starts_from_saved_state(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test commands saved before a restart are not sent again."""
+    hass.config.units = US_CUSTOMARY_SYSTEM
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=data,
+        state=ConfigEntryState.LOADED,
+    )
+    config_entry.add_to_hass(hass)
+    sent_at = (dt_util.utcnow() - timedelta(minutes=1)).isoformat()
+    hass_storage[CONTROLLER_STATE_STORAGE_KEY.format(config_entry.entry_id)] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": CONTROLLER_STATE_STORAGE_KEY.format(config_entry.entry_id),
+        "data": {
+            "cover_commands": {cover_entity_id: [SERVICE_OPEN_COVER, sent_at]},
+            "systems": {
+                central_thermostat_entity_id: {
+                    "central_setpoint_command": [70, sent_at],
+                    "hvac_mode": "heat",
+                    "thermostat_action": "active",
+                    "areas": {
+                        "master_bedroom": {
+                            "cover_service": SERVICE_OPEN_COVER,
+                            "cover_changed_at": sent_at,
+                            "need": True,
+                        }
+                    },
+                }
+            },
+        },
+    }
+    hass.states.async_set(
+        entity_id=central_thermostat_entity_id,
+        new_state="heat",
+        attributes={
+            "current_temperature": 68,
+        },
+    )
+    hass.states.async_set(entity_id=cover_entity_id, new_state=STATE_CLOSED)
+    hass.states.async_set(entity_id=area_actual_temperature_entity_id, new_state=69)
+    await hass.async_block_till_done()
+    hass.services = MagicMock(async_call=AsyncMock())
+
+    await async_setup_entry(hass, config_entry)
+    runtime_data = hass.data[DOMAIN][config_entry.entry_id]
+    system_data = runtime_data.systems[central_thermostat_entity_id]
+
+    assert system_data.saved_state is not None
+
+    await async_adjust_house(hass, config_entry)
+
+    hass.services.async_call.assert_not_called()
+    assert system_data.saved_state is None
+    assert system_data.last_plan.cover_changed_ats == (dt_util.parse_datetime(sent_at),)
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=CONTROLLER_STATE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    saved_data = hass_storage[
+        CONTROLLER_STATE_STORAGE_KEY.format(config_entry.entry_id)
+    ]["data"]
+    assert saved_data["cover_commands"] == {
+        cover_entity_id: [SERVICE_OPEN_COVER, sent_at]
+    }
+    assert saved_data["systems"][central_thermostat_entity_id][
+        "central_setpoint_command"
+    ] == [70, sent_at]
+
+
+async def test_async_setup_entry_defers_evaluation_until_started(
+    hass: HomeAssistant,
+) -> None:
+    """Test the first evaluation waits for Home Assistant to start."""
+    hass.set_state(CoreState.starting)
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={**data, CONF_PROFILE_STARTUP: True},
+        state=ConfigEntryState.LOADED,
+    )
+    config_entry.add_to_hass(hass)
+    hass.services = MagicMock(async_call=AsyncMock())
+
+    await async_setup_entry(hass, config_entry)
+    runtime_data = hass.data[DOMAIN][config_entry.entry_id]
+    hass.states.async_set(
+        entity_id=central_thermostat_entity_id,
+        new_state="heat",
+        attributes={
+            "current_temperature": 68,
+        },
+    )
+    hass.states.async_set(entity_id=cover_entity_id, new_state=STATE_CLOSED)
+    hass.states.async_set(entity_id=area_actual_temperature_entity_id, new_state=69)
+    await async_wait_for_evaluation(hass)
+
+    hass.services.async_call.assert_not_called()
+    assert runtime_data.stats.events_received == 3
+    assert runtime_data.stats.evaluations == 0
+    assert list(runtime_data.startup_profile.phases) == [
+        "storage_loaded",
+        "platforms_set_up",
+        "set_up",
+    ]
+
+    hass.set_state(CoreState.running)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await async_wait_for_evaluation(hass)
+
+    assert runtime_data.stats.evaluations_by_trigger == {TRIGGER_STARTED: 1}
+    assert "first_evaluation" in runtime_data.startup_profile.phases
+    hass.services.async_call.assert_any_call(
+        Platform.COVER,
+        SERVICE_OPEN_COVER,
+        service_data={ATTR_ENTITY_ID: [cover_entity_id]},
+    )
+
+
+async def test_async_setup_entry_evaluates_when_already_started(
+    hass: HomeAssistant,
+) -> None:
+    """Test an entry set up after Home Assistant started is evaluated right away."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={**data, CONF_PROFILE_STARTUP: True},
+        state=ConfigEntryState.LOADED,
+    )
+    config_entry.add_to_hass(hass)
+    hass.states.async_set(
+        entity_id=central_thermostat_entity_id,
+        new_state="heat",
+        attributes={
+            "current_temperature": 68,
+        },
+    )
+    hass.states.async_set(entity_id=cover_entity_id, new_state=STATE_CLOSED)
+    hass.states.async_set(entity_id=area_actual_temperature_entity_id, new_state=69)
+    await hass.async_block_till_done()
+    hass.services = MagicMock(async_call=AsyncMock())
+
+    await async_setup_entry(hass, config_entry)
+    await async_wait_for_evaluation(hass)
+
+    runtime_data = hass.data[DOMAIN][config_entry.entry_id]
+    assert hass.state is CoreState.running
+    assert runtime_data.stats.evaluations_by_trigger == {TRIGGER_STARTED: 1}
+    assert "first_evaluation" in runtime_data.startup_profile.phases
+    hass.services.async_call.assert_any_call(
+        Platform.COVER,
+        SERVICE_OPEN_COVER,
+        service_data={ATTR_ENTITY_ID: [cover_entity_id]},
+    )
+
+
+async def test_async_setup_entry_central_temperature_change_sets_setpoint(
+    hass: HomeAssistant,
+) -> None:
+    """Test a central temperature change only reconciles the central setpoint."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=data,
+        state=ConfigEntryState.LOADED,
+    )
+    config_entry.add_to_hass(hass)
+    hass.states.async_set(
+        entity_id=central_thermostat_entity_id,
+        new_state="heat",
+        attributes={
+            "current_temperature": 68,
+        },
+    )
+    hass.states.async_set(entity_id=cover_entity_id, new_state=STATE_CLOSED)
+    hass.states.async_set(entity_id=area_actual_temperature_entity_id, new_state=69)
+    await hass.async_block_till_done()
+    hass.services = MagicMock(async_call=AsyncMock())
+
+    await async_setup_entry(hass, config_entry)
+    await async_wait_for_evaluation(hass)
+    await async_adjust_house(hass, config_entry)
+    hass.services.reset_mock()
+
+    with patch(
+        "custom_components.hvac_zoning.determine_actual_temperature"
+    ) as mock_determine_actual_temperature:
+        hass.states.async_set(
+            entity_id=central_thermostat_entity_id,
+            new_state="heat",
+            attributes={
+                "current_temperature": 67,
+            },
+        )
+        await async_wait_for_evaluation(hass)
+
+    mock_determine_actual_temperature.assert_not_called()
+    hass.services.async_call.assert_called_once_with(
+        Platform.CLIMATE,
+        SERVICE_SET_TEMPERATURE,
+        service_data={
+            ATTR_ENTITY_ID: central_thermostat_entity_id,
+            ATTR_TEMPERATURE: 65,
+        },
+    )
+
+
+async def test_adjust_house_proportional_vents(hass: HomeAssistant) -> None:
+    """Test positionable vents are set to a position unless within a step."""
+    hass.config.units = US_CUSTOMARY_SYSTEM
+    office_cover_entity_id = "cover.office_vent"
+    office_temperature_entity_id = "sensor.office_temperature"
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            **data,
+            "areas": {
+                **data["areas"],
+                "office": {
+                    "covers": [office_cover_entity_id],
+                    "temperature": office_temperature_entity_id,
+                    "bedroom": False,
+                },
+            },
+            CONF_VENT_MODE: VENT_MODE_PROPORTIONAL,
+        },
+        state=ConfigEntryState.LOADED,
+    )
+    config_entry.add_to_hass(hass)
+    hass.states.async_set(
+        entity_id=central_thermostat_entity_id,
+        new_state="heat",
+        attributes={
+            "current_temperature": 68,
+        },
+    )
+    hass.states.async_set(
+        entity_id=cover_entity_id,
+        new_state=STATE_OPEN,
+        attributes={
+            ATTR_SUPPORTED_FEATURES: CoverEntityFeature.SET_POSITION,
+            ATTR_CURRENT_POSITION: 45,
+        },
+    )
+    hass.states.async_set(
+        entity_id=office_cover_entity_id,
+        new_state=STATE_OPEN,
+        attributes={
+            ATTR_SUPPORTED_FEATURES: CoverEntityFeature.SET_POSITION,
+            ATTR_CURRENT_POSITION: 100,
+        },
+    )
+    hass.states.async_set(entity_id=area_actual_temperature_entity_id, new_state=71)
+    hass.states.async_set(entity_id=office_temperature_entity_id, new_state=71.5)
+    await hass.async_block_till_done()
+    hass.services = MagicMock(async_call=AsyncMock())
+
+    await async_setup_entry(hass, config_entry)
+    await hass.async_block_till_done()
+    hass.services.reset_mock()
+    await async_adjust_house(hass, config_entry)
+
+    cover_calls = [
+        service_call
+        for service_call in hass.services.async_call.call_args_list
+        if service_call.args[0] == Platform.COVER
+    ]
+    assert cover_calls == [
+        call(
+            Platform.COVER,
+            SERVICE_SET_COVER_POSITION,
+            service_data={ATTR_ENTITY_ID: [office_cover_entity_id], ATTR_POSITION: 25},
+        )
+    ]
+    runtime_data = hass.data[DOMAIN][config_entry.entry_id]
+    last_plan = runtime_data.systems[central_thermostat_entity_id].last_plan
+    assert last_plan.cover_positions == (50, 25)
+    assert runtime_data.commands_suppressed == 1
+
+
+async def test_async_setup_entry_damper_open(hass: HomeAssistant) -> None:
+    """Test async setup entry."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            **data,
+            "control_central_thermostat": False,
+        },
+        state=ConfigEntryState.LOADED,
+    )
+    hass.states.async_set(
+        entity_id=central_thermostat_entity_id,
+        new_state="heat",
+        attributes={
+            "current_temperature": 68,
+        },
+    )
+    hass.states.async_set(
+        entity_id=cover_entity_id,
+        new_state="open",
+    )
+    hass.states.async_set(
+        entity_id=area_target_temperature_entity_id,
+        new_state=None,
+        attributes={
+            "temperature": 70,
+        },
+    )
+    hass.states.async_set(
+        entity_id=area_actual_temperature_entity_id,
+        new_state=69,
+    )
+    await hass.async_block_till_done()
+    hass.services = MagicMock(async_call=AsyncMock())
+
+    await async_setup_entry(hass, config_entry)
+    await async_wait_for_evaluation(hass)
+    hass.services.reset_mock()
+
+    hass.bus.async_fire(
         EVENT_STATE_CHANGED,
         {
             ATTR_ENTITY_ID: cover_entity_id,
@@ -615,7 +1741,7 @@ async def test_async_setup_entry_damper_open(hass: HomeAssistant) -> None:
     )
     await hass.async_block_till_done()
 
-    assert hass.services.call.call_count == 0
+    assert hass.services.async_call.call_count == 0
 
 
 async def test_async_setup_entry_connectivity_old_state_none(
@@ -643,7 +1769,7 @@ async def test_async_setup_entry_connectivity_old_state_none(
         new_state=69,
     )
     await hass.async_block_till_done()
-    hass.services = MagicMock()
+    hass.services = MagicMock(async_call=AsyncMock())
 
     await async_setup_entry(hass, config_entry)
 
@@ -676,4 +1802,100 @@ async def test_async_setup_entry_connectivity_old_state_none(
     )
     await hass.async_block_till_done()
 
-    assert hass.services.call.call_count == 0
+    assert hass.services.async_call.call_count == 0
+
+
+async def test_async_setup_entry_rebuilds_routing_index_on_rename(
+    hass: HomeAssistant,
+) -> None:
+    """Test the routing index follows a renamed virtual thermostat."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            **data,
+            "control_central_thermostat": False,
+        },
+        state=ConfigEntryState.LOADED,
+    )
+    config_entry.add_to_hass(hass)
+    hass.states.async_set(
+        entity_id=central_thermostat_entity_id,
+        new_state="heat",
+        attributes={
+            "current_temperature": 68,
+        },
+    )
+    hass.states.async_set(
+        entity_id=area_actual_temperature_entity_id,
+        new_state=69,
+    )
+    await hass.async_block_till_done()
+    hass.services = MagicMock(async_call=AsyncMock())
+
+    await async_setup_entry(hass, config_entry)
+
+    entity_registry = er.async_get(hass)
+    entity_registry.async_update_entity(
+        area_target_temperature_entity_id,
+        new_entity_id="climate.renamed_thermostat",
+    )
+    await hass.async_block_till_done()
+    hass.services.reset_mock()
+
+    hass.bus.async_fire(
+        EVENT_STATE_CHANGED,
+        {
+            ATTR_ENTITY_ID: "climate.renamed_thermostat",
+            "old_state": core.State("climate.renamed_thermostat", 71),
+        },
+    )
+    await async_wait_for_evaluation(hass)
+
+    assert hass.services.async_call.call_count == 1
+
+
+async def test_async_setup_entry_tracks_only_routed_entities(
+    hass: HomeAssistant,
+) -> None:
+    """Test the integration subscribes only to the entities it routes."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=data,
+        state=ConfigEntryState.LOADED,
+    )
+    config_entry.add_to_hass(hass)
+    hass.services = MagicMock(async_call=AsyncMock())
+
+    with patch(
+        "custom_components.hvac_zoning.async_track_state_change_event"
+    ) as mock_track_state_change_event:
+        await async_setup_entry(hass, config_entry)
+
+    mock_track_state_change_event.assert_called_once()
+    assert sorted(mock_track_state_change_event.call_args.args[1]) == sorted(
+        [
+            central_thermostat_entity_id,
+            cover_connectivity_entity_id,
+            area_target_temperature_entity_id,
+            area_actual_temperature_entity_id,
+        ]
+    )
+
+
+async def test_async_remove_entry(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test removing an entry removes the data stored for it."""
+    config_entry = MockConfigEntry(domain=DOMAIN, data=data)
+    keys = [
+        THERMAL_MODEL_STORAGE_KEY.format(config_entry.entry_id),
+        CONTROLLER_STATE_STORAGE_KEY.format(config_entry.entry_id),
+    ]
+    other_key = THERMAL_MODEL_STORAGE_KEY.format("other_entry_id")
+    for key in (*keys, other_key):
+        hass_storage[key] = {"version": 1, "key": key, "data": {}}
+
+    await async_remove_entry(hass, config_entry)
+
+    assert not any(key in hass_storage for key in keys)
+    assert other_key in hass_storage
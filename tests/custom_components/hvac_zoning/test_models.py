@@ -0,0 +1,273 @@
+"""Test models."""
+
+from datetime import time, timedelta
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.hvac_zoning.const import (
+    CONF_CENTRAL_THERMOSTAT,
+    CONF_EVALUATION_WINDOW,
+    CONF_HYSTERESIS,
+    CONF_MIN_DWELL,
+    CONF_PROFILE_STARTUP,
+    CONF_TEMPERATURE_COMPARISON,
+    CONF_TEMPERATURE_TOLERANCE,
+    CONF_VENT_MODE,
+    CONTROLLER_SIMPLE,
+    DEFAULT_EVALUATION_MAX_LATENCY,
+    DOMAIN,
+    EVALUATION_LATENCY_SAMPLES,
+    TEMPERATURE_COMPARISON_PRECISE,
+    TRIGGER_CONNECTIVITY,
+    TRIGGER_THERMOSTAT,
+    VENT_MODE_PROPORTIONAL,
+)
+from custom_components.hvac_zoning.models import (
+    AreaConfig,
+    HVACSystemConfig,
+    HVACZoningConfig,
+    HVACZoningStats,
+    determine_changed_areas,
+    get_config,
+    get_runtime_data,
+)
+from tests.common import MockConfigEntry
+
+config_entry_data = {
+    "areas": {
+        "master_bedroom": {
+            "covers": ["cover.master_bedroom_vent"],
+            "connectivities": ["binary_sensor.master_bedroom_vent_status"],
+            "temperature": "sensor.master_bedroom_temperature",
+            "bedroom": True,
+            CONF_HYSTERESIS: 1.0,
+            CONF_MIN_DWELL: 600,
+        },
+        "office": {
+            "covers": [],
+            "temperature": "sensor.office_temperature",
+        },
+        "main_floor": {
+            "climate": "climate.living_room_thermostat",
+            "bedroom": False,
+        },
+    },
+    "bed_time": "21:00:00",
+    "wake_time": "05:00:00",
+    "control_central_thermostat": True,
+    CONF_EVALUATION_WINDOW: 1.0,
+}
+
+
+def test_config_from_config_entry_data() -> None:
+    """Test config entry data is parsed into an immutable configuration."""
+    config = HVACZoningConfig.from_config_entry_data(config_entry_data)
+
+    master_bedroom = AreaConfig(
+        name="master_bedroom",
+        covers=("cover.master_bedroom_vent",),
+        connectivities=("binary_sensor.master_bedroom_vent_status",),
+        temperature="sensor.master_bedroom_temperature",
+        climate=None,
+        bedroom=True,
+        hysteresis=1.0,
+        min_dwell=timedelta(minutes=10),
+        central_thermostat=None,
+    )
+    assert config.areas["master_bedroom"] == master_bedroom
+    assert config.areas["main_floor"].climate == "climate.living_room_thermostat"
+    assert config.areas["office"].hysteresis == 0.0
+    assert config.areas["office"].min_dwell == timedelta(0)
+    assert config.valid_areas == (master_bedroom,)
+    assert config.valid_area_indexes == {"master_bedroom": 0}
+    assert config.systems == {
+        "climate.living_room_thermostat": HVACSystemConfig(
+            central_thermostat_entity_id="climate.living_room_thermostat",
+            valid_areas=(master_bedroom,),
+            valid_area_indexes={"master_bedroom": 0},
+        )
+    }
+    assert config.area_systems == {"master_bedroom": "climate.living_room_thermostat"}
+    assert config.bed_time == time(21)
+    assert config.wake_time == time(5)
+    assert config.is_night_time_mode is True
+    assert config.control_central_thermostat is True
+    assert config.evaluation_window == 1.0
+    assert config.temperature_deadband == 0.3
+    assert config.temperature_tolerance is None
+    assert config.proportional_band is None
+    assert config.controller == CONTROLLER_SIMPLE
+    assert config.max_setpoint_offset == 4.0
+    assert config.evaluation_max_latency == DEFAULT_EVALUATION_MAX_LATENCY
+    assert config.profile_startup is False
+
+
+def test_config_precise_temperature_comparison() -> None:
+    """Test a precise comparison carries its tolerance."""
+    config = HVACZoningConfig.from_config_entry_data(
+        {
+            **config_entry_data,
+            CONF_TEMPERATURE_COMPARISON: TEMPERATURE_COMPARISON_PRECISE,
+            CONF_TEMPERATURE_TOLERANCE: 0.2,
+        }
+    )
+
+    assert config.temperature_tolerance == 0.2
+
+
+def test_config_proportional_vents() -> None:
+    """Test proportional vents carry their proportional band."""
+    config = HVACZoningConfig.from_config_entry_data(
+        {**config_entry_data, CONF_VENT_MODE: VENT_MODE_PROPORTIONAL}
+    )
+
+    assert config.proportional_band == 2.0
+    assert config.min_open_area == 30
+    assert config.position_step == 10
+
+
+def test_config_profile_startup() -> None:
+    """Test startup profiling can be enabled."""
+    config = HVACZoningConfig.from_config_entry_data(
+        {**config_entry_data, CONF_PROFILE_STARTUP: True}
+    )
+
+    assert config.profile_startup is True
+
+
+def test_config_multiple_central_thermostats() -> None:
+    """Test areas are grouped into one system per central thermostat."""
+    config = HVACZoningConfig.from_config_entry_data(
+        {
+            **config_entry_data,
+            "areas": {
+                **config_entry_data["areas"],
+                "basement": {
+                    "covers": ["cover.basement_vent"],
+                    "climate": "climate.basement_thermostat",
+                    CONF_CENTRAL_THERMOSTAT: "climate.basement_thermostat",
+                },
+                "attic": {
+                    "covers": ["cover.attic_vent"],
+                    CONF_CENTRAL_THERMOSTAT: "climate.unknown_thermostat",
+                },
+            },
+        }
+    )
+
+    assert config.area_systems == {
+        "master_bedroom": "climate.living_room_thermostat",
+        "basement": "climate.basement_thermostat",
+        "attic": "climate.living_room_thermostat",
+    }
+    assert list(config.systems) == [
+        "climate.living_room_thermostat",
+        "climate.basement_thermostat",
+    ]
+    living_room = config.systems["climate.living_room_thermostat"]
+    assert [area.name for area in living_room.valid_areas] == [
+        "master_bedroom",
+        "attic",
+    ]
+    assert living_room.valid_area_indexes == {"master_bedroom": 0, "attic": 1}
+    assert config.systems["climate.basement_thermostat"].valid_area_indexes == {
+        "basement": 0
+    }
+
+
+def test_determine_changed_areas() -> None:
+    """Test only areas whose configuration changed are reported."""
+    previous_config = HVACZoningConfig.from_config_entry_data(config_entry_data)
+    config = HVACZoningConfig.from_config_entry_data(
+        {
+            **config_entry_data,
+            "areas": {
+                **config_entry_data["areas"],
+                "office": {
+                    "covers": ["cover.office_vent"],
+                    "temperature": "sensor.office_temperature",
+                },
+                "attic": {"covers": ["cover.attic_vent"]},
+            },
+        }
+    )
+
+    assert determine_changed_areas(previous_config, config) == {"office", "attic"}
+    assert determine_changed_areas(config, previous_config) == {"office", "attic"}
+    assert config.has_same_settings(previous_config)
+
+
+def test_config_has_same_settings() -> None:
+    """Test a setting shared by every area is not an area change."""
+    previous_config = HVACZoningConfig.from_config_entry_data(config_entry_data)
+    config = HVACZoningConfig.from_config_entry_data(
+        {**config_entry_data, "bed_time": "22:00:00"}
+    )
+
+    assert determine_changed_areas(previous_config, config) == frozenset()
+    assert not config.has_same_settings(previous_config)
+
+
+def test_get_config(hass: HomeAssistant) -> None:
+    """Test the configuration is parsed once and then reused."""
+    config_entry = MockConfigEntry(domain=DOMAIN, data=config_entry_data)
+
+    config = get_config(hass, config_entry)
+
+    assert get_config(hass, config_entry) is config
+    assert get_runtime_data(hass, config_entry).config is config
+
+
+def test_stats_record_evaluation() -> None:
+    """Test an evaluation is counted once for each coalesced trigger."""
+    stats = HVACZoningStats()
+
+    stats.record_evaluation({TRIGGER_THERMOSTAT, TRIGGER_CONNECTIVITY}, 0.002)
+    stats.record_evaluation({TRIGGER_THERMOSTAT}, 0.001)
+
+    assert stats.evaluations == 2
+    assert stats.evaluations_by_trigger == {
+        TRIGGER_THERMOSTAT: 2,
+        TRIGGER_CONNECTIVITY: 1,
+    }
+    assert list(stats.evaluation_latencies) == [0.002, 0.001]
+
+
+def test_stats_latency_percentile() -> None:
+    """Test latency percentiles use the nearest rank of recent samples."""
+    stats = HVACZoningStats()
+
+    assert stats.latency_percentile(50) is None
+
+    for latency in range(1, EVALUATION_LATENCY_SAMPLES + 11):
+        stats.record_evaluation((), latency)
+
+    assert len(stats.evaluation_latencies) == EVALUATION_LATENCY_SAMPLES
+    assert stats.latency_percentile(0) == 11
+    assert stats.latency_percentile(50) == 60
+    assert stats.latency_percentile(95) == 105
+    assert stats.latency_percentile(100) == 110
+
+
+def test_stats_service_calls_per_evaluation() -> None:
+    """Test service calls are averaged over evaluations."""
+    stats = HVACZoningStats()
+
+    assert stats.service_calls_per_evaluation is None
+
+    stats.record_evaluation({TRIGGER_THERMOSTAT}, 0.001)
+    stats.record_evaluation({TRIGGER_THERMOSTAT}, 0.001)
+    stats.service_calls = 3
+
+    assert stats.service_calls_per_evaluation == 1.5
+    assert stats.as_dict()["service_calls_per_evaluation"] == 1.5
+
+
+def test_get_runtime_data(hass: HomeAssistant) -> None:
+    """Test runtime data is created once per config entry."""
+    config_entry = MockConfigEntry(domain=DOMAIN, data={})
+
+    runtime_data = get_runtime_data(hass, config_entry)
+
+    assert get_runtime_data(hass, config_entry) is runtime_data
+    assert hass.data[DOMAIN][config_entry.entry_id] is runtime_data
@@ -0,0 +1,130 @@
+"""Test scheduler."""
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from custom_components.hvac_zoning.const import DOMAIN
+from custom_components.hvac_zoning.scheduler import AdjustmentScheduler
+from tests.common import MockConfigEntry, async_fire_time_changed
+
+
+def create_scheduler(hass: HomeAssistant, function) -> AdjustmentScheduler:
+    """Create a scheduler with a 0.5 s window and 2 s max latency."""
+    config_entry = MockConfigEntry(domain=DOMAIN, data={})
+    return AdjustmentScheduler(hass, config_entry, 0.5, 2.0, function)
+
+
+async def test_requests_within_window_are_coalesced(hass: HomeAssistant) -> None:
+    """Test a burst of requests results in a single evaluation."""
+    function = AsyncMock()
+    scheduler = create_scheduler(hass, function)
+
+    scheduler.async_request()
+    scheduler.async_request({"office"})
+    scheduler.async_request({"basement"})
+    await hass.async_block_till_done()
+
+    function.assert_not_called()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    function.assert_awaited_once_with(frozenset({"office", "basement"}), None)
+    assert scheduler.requests == 3
+    assert scheduler.evaluations == 1
+
+
+async def test_max_latency_bounds_window(hass: HomeAssistant) -> None:
+    """Test a continuous stream of requests cannot postpone the evaluation."""
+    function = AsyncMock()
+    scheduler = create_scheduler(hass, function)
+
+    scheduler.async_request()
+    scheduler._first_request_at -= 1.8
+    scheduler.async_request()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=0.2))
+    await hass.async_block_till_done()
+
+    function.assert_awaited_once()
+
+
+async def test_immediate_request_bypasses_window(hass: HomeAssistant) -> None:
+    """Test an immediate request is evaluated without waiting for the window."""
+    function = AsyncMock()
+    scheduler = create_scheduler(hass, function)
+
+    scheduler.async_request()
+    scheduler.async_request({"office"}, immediate=True)
+    await hass.async_block_till_done()
+
+    function.assert_awaited_once_with(frozenset({"office"}), None)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    function.assert_awaited_once()
+
+
+async def test_only_one_evaluation_in_flight(hass: HomeAssistant) -> None:
+    """Test requests made during an evaluation run once it finishes."""
+    release = asyncio.Event()
+    running = 0
+    max_running = 0
+
+    async def function(forced_areas, zones) -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await release.wait()
+        running -= 1
+
+    scheduler = create_scheduler(hass, function)
+
+    scheduler.async_request(immediate=True)
+    await asyncio.sleep(0)
+    scheduler.async_request(immediate=True)
+    scheduler.async_request(immediate=True)
+    await asyncio.sleep(0)
+    release.set()
+    await hass.async_block_till_done()
+
+    assert max_running == 1
+    assert scheduler.evaluations == 2
+
+
+async def test_zone_requests_are_merged(hass: HomeAssistant) -> None:
+    """Test zone requests merge unless a whole-house request is pending."""
+    function = AsyncMock()
+    scheduler = create_scheduler(hass, function)
+
+    scheduler.async_request(zones={"office"})
+    scheduler.async_request(zones={"basement"})
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    function.assert_awaited_once_with(frozenset(), frozenset({"office", "basement"}))
+
+    function.reset_mock()
+    scheduler.async_request(zones={"office"})
+    scheduler.async_request()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+
+    function.assert_awaited_once_with(frozenset(), None)
+
+
+async def test_shutdown_cancels_pending_evaluation(hass: HomeAssistant) -> None:
+    """Test shutdown cancels a pending evaluation."""
+    function = AsyncMock()
+    scheduler = create_scheduler(hass, function)
+
+    scheduler.async_request()
+    scheduler.async_shutdown()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    function.assert_not_called()
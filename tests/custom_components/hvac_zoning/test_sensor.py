@@ -0,0 +1,116 @@
+"""Test Sensor."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import STATE_CLOSED, STATE_UNKNOWN
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+import homeassistant.util.dt as dt_util
+
+from custom_components.hvac_zoning import async_setup_entry
+from custom_components.hvac_zoning.const import (
+    DEFAULT_EVALUATION_MAX_LATENCY,
+    DOMAIN,
+    TRIGGER_THERMOSTAT,
+)
+from custom_components.hvac_zoning.models import HVACZoningStats
+from custom_components.hvac_zoning.sensor import (
+    SENSOR_DESCRIPTIONS,
+    latency_in_milliseconds,
+)
+from tests.common import MockConfigEntry, async_fire_time_changed
+
+central_thermostat_entity_id = "climate.living_room_thermostat"
+cover_entity_id = "cover.master_bedroom_vent"
+area_actual_temperature_entity_id = "sensor.master_bedroom_temperature"
+data = {
+    "areas": {
+        "master_bedroom": {
+            "covers": [cover_entity_id],
+            "temperature": area_actual_temperature_entity_id,
+            "bedroom": False,
+        },
+        "main_floor": {
+            "climate": central_thermostat_entity_id,
+            "bedroom": False,
+        },
+    },
+    "bed_time": "21:00:00",
+    "wake_time": "05:00:00",
+    "control_central_thermostat": True,
+}
+
+
+def test_latency_in_milliseconds() -> None:
+    """Test latency percentiles are reported in milliseconds."""
+    stats = HVACZoningStats()
+
+    assert latency_in_milliseconds(stats, 50) is None
+
+    stats.record_evaluation({TRIGGER_THERMOSTAT}, 0.0012345)
+
+    assert latency_in_milliseconds(stats, 50) == 1.234
+
+
+async def test_sensors_update_after_evaluation(hass: HomeAssistant) -> None:
+    """Test the diagnostic sensors are pushed after an evaluation only."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=data,
+        state=ConfigEntryState.LOADED,
+    )
+    config_entry.add_to_hass(hass)
+    hass.states.async_set(
+        central_thermostat_entity_id, "heat", {"current_temperature": 68}
+    )
+    hass.states.async_set(cover_entity_id, STATE_CLOSED)
+    hass.states.async_set(area_actual_temperature_entity_id, 69)
+    await hass.async_block_till_done()
+    hass.services = MagicMock(async_call=AsyncMock())
+
+    await async_setup_entry(hass, config_entry)
+    await hass.async_block_till_done()
+
+    entity_registry = er.async_get(hass)
+    sensor_entity_ids = {
+        description.key: entity_registry.async_get_entity_id(
+            "sensor", DOMAIN, f"hvac_zoning_{description.key}"
+        )
+        for description in SENSOR_DESCRIPTIONS
+    }
+    assert None not in sensor_entity_ids.values()
+    assert hass.states.get(sensor_entity_ids["evaluation_latency_p50"]).state == (
+        STATE_UNKNOWN
+    )
+    assert (
+        entity_registry.async_get(sensor_entity_ids["events_received"]).entity_category
+        == "diagnostic"
+    )
+
+    hass.states.async_set(
+        central_thermostat_entity_id,
+        "heat",
+        {"current_temperature": 68, "temperature": 70},
+    )
+    await hass.async_block_till_done()
+
+    assert hass.states.get(sensor_entity_ids["events_received"]).state == "0"
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=DEFAULT_EVALUATION_MAX_LATENCY)
+    )
+    await hass.async_block_till_done()
+
+    assert hass.states.get(sensor_entity_ids["thermostat_evaluations"]).state == "1"
+    assert hass.states.get(sensor_entity_ids["connectivity_evaluations"]).state == "0"
+    assert hass.states.get(sensor_entity_ids["temperature_evaluations"]).state == "0"
+    assert hass.states.get(sensor_entity_ids["events_received"]).state == "1"
+    assert hass.states.get(sensor_entity_ids["events_routed"]).state == "1"
+    assert hass.states.get(sensor_entity_ids["service_calls_per_evaluation"]).state == (
+        "2.0"
+    )
+    assert hass.states.get(sensor_entity_ids["evaluation_latency_p95"]).state != (
+        STATE_UNKNOWN
+    )
@@ -0,0 +1,134 @@
+"""Test state."""
+
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.components.climate import HVACMode
+from homeassistant.const import SERVICE_CLOSE_COVER, SERVICE_OPEN_COVER
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from custom_components.hvac_zoning.const import (
+    ACTIVE,
+    CONTROLLER_STATE_SAVE_DELAY,
+    CONTROLLER_STATE_STORAGE_KEY,
+)
+from custom_components.hvac_zoning.engine import evaluate_house
+from custom_components.hvac_zoning.models import HVACSystemData, HVACZoningData
+from custom_components.hvac_zoning.state import ControllerState, SystemState
+from tests.common import NOW, async_fire_time_changed, create_snapshot
+
+ENTRY_ID = "entry_id"
+CENTRAL_THERMOSTAT_ENTITY_ID = "climate.living_room_thermostat"
+
+
+async def test_persists_state(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test commands and decisions are saved and loaded again."""
+    snapshot = create_snapshot()
+    plan = evaluate_house(snapshot)
+    runtime_data = HVACZoningData(
+        cover_commands={"cover.office_vent": (SERVICE_OPEN_COVER, NOW)},
+        systems={
+            CENTRAL_THERMOSTAT_ENTITY_ID: HVACSystemData(
+                central_setpoint_command=(70.0, NOW),
+                last_snapshot=snapshot,
+                last_plan=plan,
+            )
+        },
+    )
+    controller_state = ControllerState(hass, ENTRY_ID)
+    controller_state.async_schedule_save(runtime_data)
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=CONTROLLER_STATE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    assert hass_storage[CONTROLLER_STATE_STORAGE_KEY.format(ENTRY_ID)]["data"] == {
+        "cover_commands": {"cover.office_vent": [SERVICE_OPEN_COVER, NOW.isoformat()]},
+        "systems": {
+            CENTRAL_THERMOSTAT_ENTITY_ID: {
+                "central_setpoint_command": [70.0, NOW.isoformat()],
+                "hvac_mode": HVACMode.HEAT,
+                "thermostat_action": ACTIVE,
+                "areas": {
+                    "office": {
+                        "cover_service": SERVICE_OPEN_COVER,
+                        "cover_changed_at": None,
+                        "need": True,
+                    },
+                    "master_bedroom": {
+                        "cover_service": SERVICE_CLOSE_COVER,
+                        "cover_changed_at": None,
+                        "need": False,
+                    },
+                },
+            }
+        },
+    }
+
+    loaded_runtime_data = HVACZoningData()
+    saved_states = await ControllerState(hass, ENTRY_ID).async_load(loaded_runtime_data)
+
+    assert loaded_runtime_data.cover_commands == runtime_data.cover_commands
+    assert saved_states == {
+        CENTRAL_THERMOSTAT_ENTITY_ID: SystemState.from_evaluation(
+            (70.0, NOW), snapshot, plan
+        )
+    }
+
+
+async def test_load_without_saved_state(hass: HomeAssistant) -> None:
+    """Test nothing is restored before the first save."""
+    runtime_data = HVACZoningData()
+
+    assert await ControllerState(hass, ENTRY_ID).async_load(runtime_data) == {}
+    assert runtime_data.cover_commands == {}
+
+
+def test_as_previous_evaluation_holds_dwell() -> None:
+    """Test the saved decisions keep an area held by its minimum dwell."""
+    saved_state = SystemState.from_dict(
+        {
+            "central_setpoint_command": None,
+            "hvac_mode": HVACMode.HEAT,
+            "thermostat_action": ACTIVE,
+            "areas": {
+                "office": {
+                    "cover_service": SERVICE_CLOSE_COVER,
+                    "cover_changed_at": (NOW - timedelta(minutes=5)).isoformat(),
+                    "need": False,
+                },
+                "master_bedroom": {
+                    "cover_service": SERVICE_CLOSE_COVER,
+                    "cover_changed_at": None,
+                    "need": False,
+                },
+            },
+        }
+    )
+    snapshot = create_snapshot(
+        actual_temperatures=(70.0, 69.0), min_dwells=(timedelta(minutes=10),) * 2
+    )
+
+    plan = evaluate_house(snapshot, *saved_state.as_previous_evaluation(snapshot))
+
+    assert plan.cover_services == (SERVICE_CLOSE_COVER, SERVICE_OPEN_COVER)
+    assert plan.held_untils == (NOW + timedelta(minutes=5), None)
+
+
+def test_as_previous_evaluation_with_unsaved_area() -> None:
+    """Test saved decisions are only used when every area has one."""
+    snapshot = create_snapshot(
+        areas=("office",),
+        hystereses=(0.0,),
+        min_dwells=(timedelta(0),),
+        target_temperatures=(71.0,),
+        actual_temperatures=(70.0,),
+        is_bedrooms=(False,),
+        is_availables=(True,),
+    )
+    saved_state = SystemState.from_evaluation(None, snapshot, evaluate_house(snapshot))
+
+    assert saved_state.as_previous_evaluation(create_snapshot()) is None
@@ -0,0 +1,141 @@
+"""Test thermal."""
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from homeassistant.components.climate import HVACMode
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.hvac_zoning.const import (
+    THERMAL_MODEL_FORGETTING_FACTOR,
+    THERMAL_MODEL_STORAGE_KEY,
+)
+from custom_components.hvac_zoning.thermal import RateEstimate, ThermalModel
+
+NOW = datetime(2025, 1, 1, 12, tzinfo=UTC)
+ENTRY_ID = "entry_id"
+
+
+def observe(
+    model: ThermalModel,
+    temperature: float | None,
+    minutes: float,
+    *,
+    hvac_mode: str | None = HVACMode.HEAT,
+    is_active: bool = True,
+    is_open: bool = True,
+) -> bool:
+    """Observe the office temperature some minutes after NOW."""
+    return model.observe(
+        "office",
+        temperature,
+        NOW + timedelta(minutes=minutes),
+        hvac_mode=hvac_mode,
+        is_active=is_active,
+        is_open=is_open,
+    )
+
+
+def test_rate_estimate_converges() -> None:
+    """Test the estimate follows a noisy constant rate."""
+    estimate = RateEstimate()
+
+    for observed_rate in (0.12, 0.08, 0.11, 0.09, 0.1, 0.1):
+        estimate.update(observed_rate, THERMAL_MODEL_FORGETTING_FACTOR)
+
+    assert estimate.rate == pytest.approx(0.1, abs=0.005)
+    assert estimate.samples == 6
+
+
+def test_rate_estimate_forgets() -> None:
+    """Test older observations fade so the estimate tracks a changed rate."""
+    estimate = RateEstimate()
+
+    for _ in range(10):
+        estimate.update(0.2, THERMAL_MODEL_FORGETTING_FACTOR)
+    for _ in range(60):
+        estimate.update(0.05, THERMAL_MODEL_FORGETTING_FACTOR)
+
+    assert estimate.rate == pytest.approx(0.05, abs=0.01)
+
+
+async def test_observe(hass: HomeAssistant) -> None:
+    """Test a rate is learned over intervals of at least the minimum."""
+    model = ThermalModel(hass, ENTRY_ID)
+
+    assert observe(model, 68.0, 0) is False
+    assert observe(model, 68.2, 2) is False
+    assert observe(model, 68.5, 5) is True
+    assert model.get_rate("office", HVACMode.HEAT, True) == pytest.approx(0.1)
+    assert model.get_rate("office", HVACMode.HEAT, False) is None
+    assert model.as_attributes("office") == {"heat_open_rate": 0.1}
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"is_active": False},
+        {"hvac_mode": HVACMode.OFF},
+        {"hvac_mode": None},
+        {"is_open": False},
+        {"hvac_mode": HVACMode.COOL},
+    ],
+)
+async def test_observe_restarts_on_condition_change(
+    hass: HomeAssistant, kwargs: dict[str, Any]
+) -> None:
+    """Test an interval spanning a change of conditions is not learned."""
+    model = ThermalModel(hass, ENTRY_ID)
+    observe(model, 68.0, 0)
+
+    assert observe(model, 68.5, 5, **kwargs) is False
+    assert model.as_attributes("office") == {}
+
+
+async def test_observe_discards_stale_interval(hass: HomeAssistant) -> None:
+    """Test an interval longer than the maximum is not learned."""
+    model = ThermalModel(hass, ENTRY_ID)
+    observe(model, 68.0, 0)
+
+    assert observe(model, 70.0, 120) is False
+    assert observe(model, 70.5, 125) is True
+    assert model.get_rate("office", HVACMode.HEAT, True) == pytest.approx(0.1)
+
+
+async def test_get_conditioning_rate(hass: HomeAssistant) -> None:
+    """Test cooling rates are reported towards conditioning."""
+    model = ThermalModel(hass, ENTRY_ID)
+    observe(model, 74.0, 0, hvac_mode=HVACMode.COOL)
+    observe(model, 73.0, 10, hvac_mode=HVACMode.COOL)
+
+    assert model.get_rate("office", HVACMode.COOL, True) == pytest.approx(-0.1)
+    assert model.get_conditioning_rate("office", HVACMode.COOL) == pytest.approx(0.1)
+    assert model.get_conditioning_rate("office", HVACMode.HEAT) is None
+
+
+async def test_persists_rates(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test learned rates are saved and loaded again."""
+    model = ThermalModel(hass, ENTRY_ID)
+    observe(model, 68.0, 0)
+    observe(model, 68.5, 5)
+    await model._store.async_save(model._data_to_save())
+
+    assert hass_storage[THERMAL_MODEL_STORAGE_KEY.format(ENTRY_ID)]["data"] == {
+        "areas": {
+            "office": {
+                "heat_open": {
+                    "rate": pytest.approx(0.1),
+                    "covariance": pytest.approx(1.0, rel=0.1),
+                    "samples": 1,
+                }
+            }
+        }
+    }
+
+    loaded_model = ThermalModel(hass, ENTRY_ID)
+    await loaded_model.async_load()
+
+    assert loaded_model.get_rate("office", HVACMode.HEAT, True) == pytest.approx(0.1)
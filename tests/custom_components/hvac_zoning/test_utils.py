@@ -3,8 +3,11 @@
 import pytest
 
 from custom_components.hvac_zoning.utils import (
+    determine_if_night_time_mode,
+    filter_to_bedrooms,
     filter_to_valid_areas,
     get_all_thermostat_entity_ids,
+    parse_temperature,
 )
 
 
@@ -76,3 +79,68 @@ def test_get_all_thermostat_entity_ids(config_entry_data, expected_thermostats)
     thermostats = get_all_thermostat_entity_ids(config_entry_data)
 
     assert thermostats == expected_thermostats
+
+
+@pytest.mark.parametrize(
+    ("value", "expected_temperature"),
+    [
+        ("71.52", 71.52),
+        (70, 70.0),
+        ("unavailable", None),
+        (None, None),
+    ],
+)
+def test_parse_temperature(value, expected_temperature) -> None:
+    """Test parse temperature."""
+    assert parse_temperature(value) == expected_temperature
+
+
+@pytest.mark.parametrize(
+    ("areas", "expected_result"),
+    [
+        ({"office": {"bedroom": True}}, True),
+        ({"upstairs_bathroom": {"bedroom": False}}, False),
+        ({"office": {"bedroom": True}, "upstairs_bathroom": {"bedroom": False}}, True),
+        (
+            {"office": {"bedroom": False}, "upstairs_bathroom": {"bedroom": False}},
+            False,
+        ),
+        ({}, False),
+    ],
+)
+def test_determine_if_night_time_mode(areas, expected_result) -> None:
+    """Test determine if night time mode."""
+    is_night_time_mode = determine_if_night_time_mode(areas)
+    assert is_night_time_mode == expected_result
+
+
+@pytest.mark.parametrize(
+    ("areas", "expected_result"),
+    [
+        (
+            {
+                "office": {
+                    "covers": ["cover.office_vent"],
+                    "temperature": "sensor.office_temperature",
+                    "bedroom": False,
+                },
+                "upstairs_bathroom": {
+                    "covers": ["cover.upstairs_bathroom_vent"],
+                    "temperature": "sensor.upstairs_bathroom_temperature",
+                    "bedroom": True,
+                },
+            },
+            {
+                "upstairs_bathroom": {
+                    "covers": ["cover.upstairs_bathroom_vent"],
+                    "temperature": "sensor.upstairs_bathroom_temperature",
+                    "bedroom": True,
+                },
+            },
+        ),
+        ({}, {}),
+    ],
+)
+def test_filter_to_bedrooms(areas, expected_result) -> None:
+    """Test filter to bedrooms."""
+    assert filter_to_bedrooms(areas) == expected_result